@@ -0,0 +1,6 @@
+"""Micro-benchmarks for the game's hot paths.
+
+Run a benchmark as a module from the repository root. For example::
+
+    python -m benchmarks.lookup
+"""
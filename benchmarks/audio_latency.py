@@ -0,0 +1,42 @@
+"""Measure the delay from calling play to the first sample for several mixer buffer sizes.
+
+Usage::
+
+    python -m benchmarks.audio_latency
+"""
+
+from pygame.mixer import init
+from pygame.mixer import quit as quit_mixer
+
+from song_match.audio_engine import AudioEngine
+from song_match.config import AUDIO_FREQUENCY
+from song_match.sound_effects import get_piano_note_sound
+from song_match.sound_effects import get_sample_cache
+
+BUFFER_SIZES = (256, 512, 1024)
+NUMBER = 200
+
+
+def measure(buffer: int) -> AudioEngine:
+    init(frequency=AUDIO_FREQUENCY, size=-16, channels=1, buffer=buffer)
+    engine = AudioEngine()
+    engine.open_channels(buffer)
+    sounds = [get_piano_note_sound(name) for name in ('C4', 'D4', 'E4')]
+    for i in range(NUMBER):
+        channel_index = i % len(sounds)
+        engine.play_note(sounds[channel_index], channel_index)
+    get_sample_cache().clear()
+    quit_mixer()
+    return engine
+
+
+def main() -> None:
+    print('{:>8}{:>16}{:>16}{:>16}'.format('buffer', 'buffer (ms)', 'play call (ms)', 'worst case (ms)'))
+    for buffer in BUFFER_SIZES:
+        engine = measure(buffer)
+        print('{:>8}{:>16.2f}{:>16.3f}{:>16.2f}'.format(
+            buffer, engine.buffer_latency * 1000, max(engine.play_times) * 1000, engine.get_play_latency() * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Compare the tap-to-sound latency of the light first and sound first feedback modes,
+over full games against the simulated robot.
+
+Usage::
+
+    python -m benchmarks.feedback
+"""
+
+from unittest.mock import patch
+
+from song_match.cube import FEEDBACK_MODES
+from song_match.simulator import ActionLatencies
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.song import RainRainGoAway
+from song_match.song_match import SongMatch
+from song_match.tap_latency import LIGHT_ON
+from song_match.tap_latency import PERCENTILES
+from song_match.tap_latency import SOUND_START
+from song_match.tap_latency import TapLatencyMetrics
+
+NUM_PLAYERS = 3
+
+#: Players tap faster than a blink, so sound first blinks get cancelled.
+TAP_LATENCY = 0.1
+
+
+def play_game(feedback_mode: str) -> TapLatencyMetrics:
+    song = RainRainGoAway()
+    song_match = SongMatch(song=song, num_players=NUM_PLAYERS, feedback_mode=feedback_mode)
+    latencies = ActionLatencies(tap=TAP_LATENCY)
+    players = SongPlayers(song, NUM_PLAYERS, seed=0, cube_mat=song_match.cube_mat)
+    simulation = Simulation(players, latencies=latencies, virtual_clock=True)
+    try:
+        simulation.run(song_match.play)
+    except SystemExit:
+        pass
+    return song_match.tap_latency
+
+
+def main() -> None:
+    header = '{:<14}{:>8}'.format('mode', 'taps')
+    header += ''.join('{:>12}'.format('p{} (ms)'.format(percentile)) for percentile in PERCENTILES)
+    header += '{:>14}'.format('full blinks')
+    print('Tap to sound latency, {} players tapping every {:.0f} ms'.format(NUM_PLAYERS, TAP_LATENCY * 1000))
+    print(header)
+    with patch('song_match.sound_effects.sample_cache.Sound'), \
+            patch('song_match.song_match.init_mixer'), \
+            patch('song_match.song_match.print'):
+        for feedback_mode in FEEDBACK_MODES:
+            tap_latency = play_game(feedback_mode)
+            line = '{:<14}{:>8}'.format(feedback_mode, len(tap_latency))
+            for percentile in PERCENTILES:
+                line += '{:>12.1f}'.format(tap_latency.get_percentile(SOUND_START, percentile) * 1000)
+            line += '{:>14}'.format(len(tap_latency.get_latencies(LIGHT_ON)))
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Compare the per-tap note, cube, and position lookups before and after precomputing them.
+
+Usage::
+
+    python -m benchmarks.lookup
+"""
+
+from timeit import repeat
+from unittest.mock import patch
+
+from cozmo.objects import LightCubeIDs
+
+from song_match.cube_mat import CubeMat
+from song_match.song import MaryHadALittleLamb
+from song_match.song import Note
+
+from test.util import get_song_robot
+
+NUMBER = 100000
+
+
+class LegacyCubeMat:
+    """:class:`~song_match.cube_mat.CubeMat` as it was before the lookups were precomputed."""
+    __cube_order = None
+
+    @classmethod
+    def get_positions(cls):
+        return list(cls.__cube_order.values())
+
+    @classmethod
+    def order_cubes_by_position(cls, song_robot):
+        cubes = list(song_robot.robot.world.light_cubes.values())
+        sorted_cubes = sorted(cubes, key=lambda cube: cube.pose.position.y)
+        sorted_cube_ids = list(map(lambda cube: cube.cube_id, sorted_cubes))
+        cls.__cube_order = dict(zip(LightCubeIDs, sorted_cube_ids))
+
+    @classmethod
+    def position_to_cube_id(cls, cube_id):
+        cube_ids = list(cls.__cube_order.keys())
+        order = list(cls.__cube_order.values())
+        return cube_ids[order.index(cube_id)]
+
+    @classmethod
+    def cube_id_to_position(cls, cube_id):
+        return cls.__cube_order[cube_id]
+
+
+class LegacyMaryHadALittleLamb(MaryHadALittleLamb):
+    """Song with the linear ``get_cube_id`` lookup from before the note index."""
+
+    def __init__(self):
+        super().__init__()
+        self.__notes = self._notes
+
+    def get_cube_id(self, note):
+        cube_id = self.__notes.index(note) + 1
+        return LegacyCubeMat.cube_id_to_position(cube_id)
+
+
+def time_per_call(statement) -> float:
+    """Best time of a single call in nanoseconds."""
+    return min(repeat(statement, number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main() -> None:
+    song_robot = get_song_robot([20, 10, 30])
+    cube_mat = CubeMat()
+    LegacyCubeMat.order_cubes_by_position(song_robot)
+    cube_mat.order_cubes_by_position(song_robot)
+
+    with patch('song_match.sound_effects.sample_cache.Sound'):
+        legacy_song = LegacyMaryHadALittleLamb()
+        song = MaryHadALittleLamb(cube_mat)
+        note = Note('E4')  # The highest note is the worst case for a linear search
+
+        benchmarks = [
+            ('get_positions', LegacyCubeMat.get_positions, cube_mat.get_positions),
+            ('position_to_cube_id',
+             lambda: LegacyCubeMat.position_to_cube_id(3),
+             lambda: cube_mat.position_to_cube_id(3)),
+            ('cube_id_to_position',
+             lambda: LegacyCubeMat.cube_id_to_position(3),
+             lambda: cube_mat.cube_id_to_position(3)),
+            ('Song.get_cube_id', lambda: legacy_song.get_cube_id(note), lambda: song.get_cube_id(note)),
+        ]
+
+        print('{:<22}{:>12}{:>12}'.format('lookup', 'before (ns)', 'after (ns)'))
+        for name, before, after in benchmarks:
+            print('{:<22}{:>12.0f}{:>12.0f}'.format(name, time_per_call(before), time_per_call(after)))
+
+
+if __name__ == '__main__':
+    main()
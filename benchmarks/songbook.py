@@ -0,0 +1,77 @@
+"""Compare loading a songbook of generated song files with and without the cache of compiled songs.
+
+Usage::
+
+    python -m benchmarks.songbook
+"""
+
+import json
+import os
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, List
+
+from song_match.songbook import NOTE_VALUES
+from song_match.songbook import compile_song_file
+from song_match.songbook import load_compiled_song
+
+NUM_SONGS = 300
+
+SONG_LENGTH = 64
+
+NUMBER = 5
+
+
+def write_songbook(directory: str, num_songs: int = NUM_SONGS, song_length: int = SONG_LENGTH) -> List[str]:
+    """Write song files with random sequences.
+
+    :param directory: Directory to write the song files in.
+    :param num_songs: Number of song files to write.
+    :param song_length: Number of notes in each song.
+    :return: List of paths to the song files.
+    """
+    random = Random(0)
+    notes = ['C4', 'D4', 'E4']
+    paths = []
+    for i in range(num_songs):
+        sequence = ' '.join('{}/{}'.format(random.choice(notes), random.choice(NOTE_VALUES))
+                            for _ in range(song_length))
+        song = {
+            'title': 'Song {}'.format(i),
+            'notes': notes,
+            'lights': ['#ff00ff', '#0000ff', '#00ffbe'],
+            'difficulty_markers': [song_length // 3, song_length * 2 // 3],
+            'sequence': sequence
+        }
+        path = os.path.join(directory, 'song_{}.json'.format(i))
+        with open(path, 'w') as file:
+            json.dump(song, file)
+        paths.append(path)
+    return paths
+
+
+def time_load(load: Callable[[str], object], paths: List[str]) -> float:
+    """Time in milliseconds to load every song file."""
+    start = perf_counter()
+    for path in paths:
+        load(path)
+    return (perf_counter() - start) * 1000
+
+
+def main() -> None:
+    with TemporaryDirectory() as songbook_dir, TemporaryDirectory() as cache_dir:
+        paths = write_songbook(songbook_dir)
+        compile_time = min(time_load(compile_song_file, paths) for _ in range(NUMBER))
+        cold_time = time_load(lambda path: load_compiled_song(path, cache_dir), paths)
+        warm_time = min(time_load(lambda path: load_compiled_song(path, cache_dir), paths) for _ in range(NUMBER))
+
+    print('Songbook of {} songs, {} notes each'.format(NUM_SONGS, SONG_LENGTH))
+    print('{:<30}{:>12}'.format('load', 'time (ms)'))
+    print('{:<30}{:>12.1f}'.format('compile, no cache', compile_time))
+    print('{:<30}{:>12.1f}'.format('compile and write cache', cold_time))
+    print('{:<30}{:>12.1f}'.format('cached', warm_time))
+
+
+if __name__ == '__main__':
+    main()
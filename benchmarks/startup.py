@@ -0,0 +1,135 @@
+"""Measure how long ``main.py --help`` spends importing modules, and check it against a budget.
+
+Runs ``python -X importtime`` in a fresh interpreter, so nothing is cached from this process.
+``-X importtime`` needs Python 3.7 or later, see :func:`get_loaded_modules` for earlier versions.
+
+Usage::
+
+    python -m benchmarks.startup
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+#: Root directory of the repository, where ``main.py`` is.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#: Most time in seconds ``main.py --help`` may spend importing modules, on top of interpreter startup.
+IMPORT_TIME_BUDGET = 0.1
+
+#: Packages ``main.py --help`` must not import.
+HEAVY_PACKAGES = ('cozmo', 'numpy', 'pygame')
+
+NUMBER = 5
+
+# Runs main.py with the arguments in sys.argv, then prints the modules it loaded as the last line
+_LOADED_MODULES_PROGRAM = """
+import json, runpy, sys
+try:
+    runpy.run_path('main.py', run_name='__main__')
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def get_loaded_modules(*args: str) -> List[str]:
+    """Run ``main.py`` in a fresh interpreter, and get every module loaded by the time it returns.
+
+    :param args: Arguments passed to ``main.py``.
+    :return: List of module names.
+    """
+    command = [sys.executable, '-c', _LOADED_MODULES_PROGRAM] + list(args)
+    process = subprocess.run(command, cwd=ROOT_DIR, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             universal_newlines=True)
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def measure_import_times(*args: str) -> Dict[str, float]:
+    """Run ``main.py`` with ``-X importtime``, and get the time each module took to import.
+
+    :param args: Arguments passed to ``main.py``. With no arguments, runs an empty program instead.
+    :return: See :func:`parse_import_times`.
+    """
+    program = [os.path.join(ROOT_DIR, 'main.py')] + list(args) if args else ['-c', 'pass']
+    command = [sys.executable, '-X', 'importtime'] + program
+    process = subprocess.run(command, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                             universal_newlines=True)
+    return parse_import_times(process.stderr)
+
+
+def parse_import_times(output: str) -> Dict[str, float]:
+    """Parse the output of ``-X importtime``.
+
+    Modules imported by other modules are indented under them, see :func:`get_own_import_time`.
+
+    :param output: Standard error of the interpreter.
+    :return: Maps each imported module, with its indentation, to its import time in seconds,
+             including the modules it imported.
+    """
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        import_times[module[1:].rstrip()] = int(cumulative) / 1e6
+    return import_times
+
+
+def get_own_import_time(import_times: Dict[str, float], startup_modules: Iterable[str]) -> float:
+    """Get the time ``main.py`` spent importing modules, including the modules they imported.
+
+    Modules imported by interpreter startup are left out, since they don't depend on the game.
+
+    :param import_times: See :func:`parse_import_times`.
+    :param startup_modules: Modules imported by an empty program, see :func:`measure_import_times`.
+    :return: Time in seconds.
+    """
+    startup_modules = set(startup_modules)
+    return sum(import_time for module, import_time in import_times.items()
+               if not module.startswith(' ') and module not in startup_modules)
+
+
+def get_heavy_packages(modules: Iterable[str]) -> List[str]:
+    """Get the packages of :data:`HEAVY_PACKAGES` that were imported.
+
+    :param modules: Imported modules, like the keys of :func:`parse_import_times` or :func:`get_loaded_modules`.
+    :return: List of package names.
+    """
+    packages = {module.strip().split('.')[0] for module in modules}
+    return sorted(packages.intersection(HEAVY_PACKAGES))
+
+
+def get_slowest_imports(import_times: Dict[str, float], startup_modules: Iterable[str],
+                        num_modules: int = 5) -> List[Tuple[str, float]]:
+    """Get the modules ``main.py`` imported that took longest to import.
+
+    :param import_times: See :func:`parse_import_times`.
+    :param startup_modules: Modules imported by an empty program, see :func:`measure_import_times`.
+    :param num_modules: Number of modules to get.
+    :return: List of module names and import times in seconds, slowest first.
+    """
+    startup_modules = set(startup_modules)
+    own_import_times = [(module, import_time) for module, import_time in import_times.items()
+                        if not module.startswith(' ') and module not in startup_modules]
+    return sorted(own_import_times, key=lambda item: item[1], reverse=True)[:num_modules]
+
+
+def main() -> None:
+    startup_modules = measure_import_times()
+    runs = [measure_import_times('--help') for _ in range(NUMBER)]
+    import_times = min(runs, key=lambda run: get_own_import_time(run, startup_modules))
+    own_import_time = get_own_import_time(import_times, startup_modules)
+    print('main.py --help imports: {:.1f} ms (budget {:.1f} ms)'.format(own_import_time * 1000,
+                                                                         IMPORT_TIME_BUDGET * 1000))
+    print('Heavy packages: {}'.format(', '.join(get_heavy_packages(import_times)) or 'none'))
+    print('{:<40}{:>12}'.format('slowest imports', 'time (ms)'))
+    for module, import_time in get_slowest_imports(import_times, startup_modules):
+        print('{:<40}{:>12.1f}'.format(module, import_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
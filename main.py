@@ -1,52 +1,234 @@
 from argparse import ArgumentParser
+from itertools import count
+from itertools import permutations
 from random import choice
-from typing import Dict
+from random import randint
+from typing import Callable, Iterable
 
-import cozmo
+from song_match.game_constants import FEEDBACK_MODES
+from song_match.game_constants import LIGHT_FIRST
+from song_match.exceptions import InvalidSongFile
+from song_match.song_registry import create_song
+from song_match.song_registry import get_song_keys
+from song_match.song_registry import get_song_title
+from song_match.song_registry import load_songbook
 
-from song_match import HotCrossBuns
-from song_match import MaryHadALittleLamb
-from song_match import RainRainGoAway
-from song_match import Song
-from song_match import SongMatch
+# cozmo, pygame, and the game itself are imported where they're used,
+# so --help and invalid arguments return without loading them.
 
 
 def main():
-    song_match_kwargs = get_song_match_kwargs()
-    song_match = SongMatch(**song_match_kwargs)
-    cozmo.run_program(song_match.play)
+    args = parse_args()
+    if args['tables'] > 1:
+        simulate_tables(args, args['tables'], virtual_clock=args['virtual_clock'])
+        return
+    song_match_kwargs = get_song_match_kwargs(args)
+    if args['simulate']:
+        simulate(song_match_kwargs, num_games=args['num_games'], virtual_clock=args['virtual_clock'],
+                 show_tap_latency=args['show_tap_latency'])
+    else:
+        import cozmo
+        cozmo.run_program(get_game_loop(song_match_kwargs, args['num_games'],
+                                        show_tap_latency=args['show_tap_latency']))
 
 
-def get_song_match_kwargs() -> dict:
-    args = parse_args()
+def get_games(num_games: int) -> Iterable[int]:
+    """Get the number of each game to play, counting forever if ``num_games`` is 0."""
+    return count(1) if num_games == 0 else range(1, num_games + 1)
+
+
+def get_game_loop(song_match_kwargs: dict, num_games: int = 1, setup_game: Callable = None,
+                  show_tap_latency: bool = False) -> Callable:
+    """Get a program playing games one after another on the same robot.
+
+    Each game gets a new :class:`~song_match.song_match.SongMatch`,
+    while the process, the robot connection, and decoded samples stay warm for the next game.
+    If given, ``setup_game`` is called with the robot and the new game before each game.
+    If ``show_tap_latency`` is True, the tap latency of each game is printed after its result.
+    """
+
+    from song_match.song_match import SongMatch
+
+    async def play_games(robot) -> None:
+        for game in get_games(num_games):
+            song_match = SongMatch(**song_match_kwargs)
+            if setup_game is not None:
+                setup_game(robot, song_match)
+            result = await song_match.play(robot)
+            print('Game {}: {}'.format(game, result.format()))
+            if show_tap_latency:
+                print_tap_latency(result.tap_latency)
+
+    return play_games
+
+
+def print_tap_latency(tap_latency) -> None:
+    """Print the tap latency table of a game, if any player tapped a cube."""
+    if len(tap_latency) > 0:
+        print(tap_latency.format())
+
+
+def simulate(song_match_kwargs: dict, num_games: int = 1, virtual_clock: bool = False,
+             show_tap_latency: bool = False) -> None:
+    """Play complete games against a simulated Cozmo, with simulated players tapping the cubes.
+
+    If the number of players is None, the simulated players answer the in game prompt
+    with a random number of players.
+    """
+    from song_match.simulator import Simulation
+
+    def deal_taps(robot, song_match) -> None:
+        # Each game gets its own taps, since a game can end before its players run out of taps
+        robot.world.set_taps(get_simulated_players(song_match_kwargs['song'], song_match_kwargs['num_players'],
+                                                   song_match.cube_mat))
+
+    simulation = Simulation([], virtual_clock=virtual_clock)
+    try:
+        simulation.run(get_game_loop(song_match_kwargs, num_games, setup_game=deal_taps,
+                                     show_tap_latency=show_tap_latency))
+    finally:
+        print('Game time: {:.1f} s, wall time: {:.3f} s'.format(simulation.game_time, simulation.wall_time))
+
+
+def simulate_tables(args: dict, num_tables: int, virtual_clock: bool = False) -> None:
+    """Play a complete game at each of several simulated tables at once, in one process.
+
+    Each table gets its own song, players, and cube layout.
+    """
+    from song_match.session_manager import SessionManager
+    from song_match.simulator import Simulation
+    from song_match.simulator.world import DEFAULT_Y_POSITIONS
+    from song_match.song_match import SongMatch
+
+    layouts = list(permutations(DEFAULT_Y_POSITIONS))
+    simulation = None
+    session_manager = None
+    for i in range(num_tables):
+        song_match_kwargs = get_song_match_kwargs(args)
+        song_match = SongMatch(**song_match_kwargs)
+        taps = get_simulated_players(song_match_kwargs['song'], song_match_kwargs['num_players'],
+                                     song_match.cube_mat)
+        y_positions = layouts[i % len(layouts)]
+        if simulation is None:
+            simulation = Simulation(taps, y_positions=y_positions, virtual_clock=virtual_clock)
+            session_manager = SessionManager(simulation.loop)
+            robot = simulation.robot
+        else:
+            robot = simulation.add_robot(taps, y_positions=y_positions)
+        session_manager.add_session(song_match, robot)
+    try:
+        simulation.run(lambda robot: session_manager.run())
+    finally:
+        for session in session_manager.sessions:
+            outcome = 'failed: {!r}'.format(session.error) if session.error else 'finished'
+            game_time = '-' if session.game_time is None else '{:.1f} s'.format(session.game_time)
+            print('{}: {}, game time: {}, taps: {}'.format(session.name, outcome, game_time,
+                                                           len(session.tap_latency)))
+            if args['show_tap_latency']:
+                print_tap_latency(session.tap_latency)
+        print('Game time: {:.1f} s, wall time: {:.3f} s'.format(simulation.game_time, simulation.wall_time))
+
+
+def get_simulated_players(song, num_players: int = None, cube_mat=None):
+    """Get the taps of simulated players, looking up cube IDs through the game's ``cube_mat``.
+
+    If ``num_players`` is None, the simulated players answer the in game prompt with a random number of players.
+    """
+    from song_match.simulator import SongPlayers
+
+    select_num_players = num_players is None
+    if select_num_players:
+        num_players = randint(1, 3)
+    return SongPlayers(song, num_players, select_num_players=select_num_players, cube_mat=cube_mat)
 
-    songs = get_songs()
-    song_key = args['song_key']
-    song = songs[song_key]
+
+def get_song_match_kwargs(args: dict) -> dict:
+    song = create_song(args['song_key'])
 
     num_players = args['num_players']
 
     return {
         'song': song,
-        'num_players': num_players
+        'num_players': num_players,
+        'feedback_mode': args['feedback_mode'],
+        'pipelined': args['pipelined']
     }
 
 
 def parse_args() -> dict:
     arg_parser = ArgumentParser(description='Play Song Match with Cozmo.')
 
+    songbook_argument_kwargs = get_songbook_argument_kwargs()
+    arg_parser.add_argument('--songbook', **songbook_argument_kwargs)
+    load_songbook_arg(arg_parser, songbook_argument_kwargs)  # Registers the songs before -s lists them
+
     song_argument_kwargs = get_song_argument_kwargs()
     arg_parser.add_argument('-s', **song_argument_kwargs)
 
     num_players_argument_kwargs = get_num_players_argument_kwargs()
     arg_parser.add_argument('-p', **num_players_argument_kwargs)
 
+    arg_parser.add_argument('--feedback', dest='feedback_mode', choices=FEEDBACK_MODES, default=LIGHT_FIRST,
+                            help=('Whether tapped cubes blink before playing their note (light-first), ' +
+                                  'or play their note right away (sound-first). Defaults to light-first.'))
+
+    arg_parser.add_argument('--pipelined', action='store_true',
+                            help='Have Cozmo start each tap as soon as the previous tap lands, to keep to the tempo.')
+
+    arg_parser.add_argument('--tap-latency', dest='show_tap_latency', action='store_true',
+                            help='Print the latency from each player tap to its light and sound after each game.')
+
+    arg_parser.add_argument('--simulate', action='store_true',
+                            help='Play a complete game against a simulated Cozmo, without a robot or phone.')
+
+    arg_parser.add_argument('--virtual-clock', action='store_true',
+                            help='With --simulate, skip over waiting so the game finishes as fast as possible.')
+
+    arg_parser.add_argument('--tables', metavar='T', type=int, default=1,
+                            help='With --simulate, play a game at T simulated tables at once in one process.')
+
+    arg_parser.add_argument('--loop', dest='num_games', metavar='G', type=int, nargs='?', const=0, default=1,
+                            help=('Play G games in a row on the same process and robot, ' +
+                                  'or keep playing until interrupted if G is left out.'))
+
     args = arg_parser.parse_args()
+    if args.tables > 1 and not args.simulate:
+        arg_parser.error('--tables needs --simulate')
+    if args.virtual_clock and not args.simulate:
+        arg_parser.error('--virtual-clock needs --simulate')
+    if args.tables > 1 and args.num_games != 1:
+        arg_parser.error('--loop can\'t be combined with --tables')
     return vars(args)
 
 
+def get_songbook_argument_kwargs() -> dict:
+    return {
+        'action': 'store',
+        'dest': 'songbook',
+        'metavar': 'DIR',
+        'type': str,
+        'help': ('A directory of song files to choose the song from, each under the name of its file ' +
+                 'without the extension. Compiled songs are cached, see song_match.songbook.'),
+        'default': None
+    }
+
+
+def load_songbook_arg(arg_parser: ArgumentParser, songbook_argument_kwargs: dict) -> None:
+    """Register the songs of the songbook given by ``--songbook``, if any."""
+    songbook_parser = ArgumentParser(add_help=False)
+    songbook_parser.add_argument('--songbook', **songbook_argument_kwargs)
+    songbook = songbook_parser.parse_known_args()[0].songbook
+    if songbook is None:
+        return
+    try:
+        load_songbook(songbook)
+    except (OSError, InvalidSongFile) as error:
+        arg_parser.error('--songbook: {}'.format(error))
+
+
 def get_song_argument_kwargs() -> dict:
-    song_choices = list(get_songs().keys())
+    song_choices = get_song_keys()
+    song_titles = ['{} ({})'.format(get_song_title(key), key) for key in song_choices]
     return {
         'action': 'store',
         'dest': 'song_key',
@@ -54,20 +236,12 @@ def get_song_argument_kwargs() -> dict:
         'type': str,
         'choices': song_choices,
         'help': ('The song to play. ' +
-                 'Hot Cross Buns (hcb), Mary Had A Little Lamb (mhall), or Rain Rain Go Away (rrga). ' +
+                 ', '.join(song_titles[:-1]) + ', or ' + song_titles[-1] + '. ' +
                  'Defaults to a random song.'),
         'default': choice(song_choices)
     }
 
 
-def get_songs() -> Dict[str, Song]:
-    return {
-        'hcb': HotCrossBuns(),
-        'mhall': MaryHadALittleLamb(),
-        'rrga': RainRainGoAway()
-    }
-
-
 def get_num_players_argument_kwargs() -> dict:
     return {
         'action': 'store',
@@ -1,10 +1,54 @@
 """
 * :class:`~song_match.song_match.SongMatch` - Main game class.
+* :class:`~song_match.game_result.GameResult` - How a finished game went.
 * :class:`~song_match.song_robot.SongRobot` - A wrapper around :class:`~cozmo.robot.Robot`.
+* :class:`~song_match.session_manager.SessionManager` - Hosts several games on one event loop.
+* :mod:`~song_match.song_registry` - Registry mapping song keys to :class:`~song_match.song.song.Song` classes.
+
+The classes are imported on first use, so importing a light module like
+:mod:`~song_match.song_registry` doesn't load cozmo or pygame.
 """
 
-from .song import HotCrossBuns
-from .song import MaryHadALittleLamb
-from .song import RainRainGoAway
-from .song import Song
-from .song_match import SongMatch
+from importlib import import_module
+from sys import modules
+from sys import version_info
+from types import ModuleType
+
+# Maps each class the package exports to the module it's imported from
+__exports = {
+    'FileSong': '.song',
+    'GameResult': '.game_result',
+    'HotCrossBuns': '.song',
+    'MaryHadALittleLamb': '.song',
+    'RainRainGoAway': '.song',
+    'SessionManager': '.session_manager',
+    'Song': '.song',
+    'SongMatch': '.song_match',
+}
+
+
+def __getattr__(name: str):
+    module_name = __exports.get(name)
+    if module_name is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__exports))
+
+
+class _LazyModule(ModuleType):
+    """Package module type giving Python 3.6 the module ``__getattr__`` and ``__dir__`` of Python 3.7."""
+
+    def __getattr__(self, name: str):
+        return __getattr__(name)
+
+    def __dir__(self):
+        return __dir__()
+
+
+if version_info < (3, 7):
+    modules[__name__].__class__ = _LazyModule
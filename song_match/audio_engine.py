@@ -0,0 +1,149 @@
+"""Module containing :class:`~song_match.audio_engine.AudioEngine`."""
+
+from collections import deque
+from time import perf_counter
+from typing import Deque
+
+from pygame.mixer import Channel
+from pygame.mixer import Sound
+from pygame.mixer import get_init
+from pygame.mixer import set_num_channels
+from pygame.mixer import set_reserved
+
+#: Number of channels reserved for notes, one per cube on the mat.
+NUM_NOTE_CHANNELS = 3
+
+#: Number of channels reserved for game sounds like the collect point sound.
+NUM_EFFECT_CHANNELS = 2
+
+#: Number of recent play calls kept for latency measurements.
+MAX_LATENCY_SAMPLES = 256
+
+
+class AudioEngine:
+    """Plays notes and game sounds on channels opened once, when the mixer starts.
+
+    Each cube plays on its own note channel, so a note never waits for a free channel
+    and re-tapping a cube cuts its previous note like re-striking a piano key.
+    Game sounds play on separate effect channels, so they can never take a note's channel.
+
+    If the mixer was started without :meth:`~song_match.audio_engine.AudioEngine.open_channels`,
+    sounds play on any free channel instead.
+    """
+
+    def __init__(self):
+        self.buffer = None  # Number of samples in the mixer's buffer
+        self.frequency = None  # Sample rate of the mixer in Hz
+        self.play_times = deque(maxlen=MAX_LATENCY_SAMPLES)  # type: Deque[float]
+        self.__note_channels = []
+        self.__effect_channels = []
+        self.__next_note_channel = 0
+        self.__effect_started_at = []  # Time each effect channel last started playing
+
+    def open_channels(self, buffer: int) -> None:
+        """Reserve the note and effect channels of an initialized mixer.
+
+        Does nothing if the mixer isn't initialized.
+
+        :param buffer: The buffer size the mixer was initialized with.
+        :return: None
+        """
+        mixer_settings = get_init()
+        if mixer_settings is None:
+            return
+        self.frequency = mixer_settings[0]
+        self.buffer = buffer
+        num_channels = NUM_NOTE_CHANNELS + NUM_EFFECT_CHANNELS
+        set_num_channels(num_channels)
+        set_reserved(num_channels)  # Keep Sound.play() from stealing our channels
+        channels = [Channel(i) for i in range(num_channels)]
+        self.__note_channels = channels[:NUM_NOTE_CHANNELS]
+        self.__effect_channels = channels[NUM_NOTE_CHANNELS:]
+        self.__effect_started_at = [0.0] * NUM_EFFECT_CHANNELS
+
+    @property
+    def is_open(self) -> bool:
+        """Property for accessing whether the note and effect channels are open.
+
+        :return: Whether the channels are open.
+        """
+        return len(self.__note_channels) > 0
+
+    def play_note(self, sound: Sound, channel_index: int = None) -> None:
+        """Play a note on a note channel.
+
+        :param sound: The sound of the note.
+        :param channel_index: Index of the note channel, usually the cube's mat position minus one.
+                              Defaults to cycling through the note channels.
+        :return: None
+        """
+        if not self.is_open:
+            return self.__play_timed(sound.play)
+        if channel_index is None:
+            channel_index = self.__next_note_channel
+            self.__next_note_channel = (channel_index + 1) % NUM_NOTE_CHANNELS
+        channel = self.__note_channels[channel_index % NUM_NOTE_CHANNELS]
+        self.__play_timed(lambda: channel.play(sound))
+
+    def play_effect(self, sound: Sound) -> None:
+        """Play a game sound on an effect channel.
+
+        Uses an idle effect channel if there is one,
+        otherwise cuts the effect that started playing first.
+
+        :param sound: The game sound.
+        :return: None
+        """
+        if not self.is_open:
+            return self.__play_timed(sound.play)
+        index = self.__get_effect_channel_index()
+        self.__effect_started_at[index] = perf_counter()
+        channel = self.__effect_channels[index]
+        self.__play_timed(lambda: channel.play(sound))
+
+    @property
+    def buffer_latency(self) -> float:
+        """Property for accessing the time in seconds the mixer takes to play through one buffer.
+
+        A sample queued just after the mixer filled its buffer waits this long before it's heard.
+
+        :return: Buffer latency in seconds, or None if the channels aren't open.
+        """
+        if self.buffer is None:
+            return None
+        return self.buffer / self.frequency
+
+    def get_play_latency(self) -> float:
+        """Get the worst-case delay in seconds from calling play to the first sample being output.
+
+        pygame doesn't report when a sample reaches the audio device,
+        so this is the slowest recent play call plus one buffer of latency.
+
+        :return: Delay in seconds, or None if nothing has played on open channels.
+        """
+        if self.buffer_latency is None or len(self.play_times) == 0:
+            return None
+        return max(self.play_times) + self.buffer_latency
+
+    def __get_effect_channel_index(self) -> int:
+        for i, channel in enumerate(self.__effect_channels):
+            if not channel.get_busy():
+                return i
+        started_at = self.__effect_started_at
+        return started_at.index(min(started_at))
+
+    def __play_timed(self, play) -> None:
+        started_at = perf_counter()
+        play()
+        self.play_times.append(perf_counter() - started_at)
+
+
+__audio_engine = AudioEngine()
+
+
+def get_audio_engine() -> AudioEngine:
+    """Get the process-wide :class:`~song_match.audio_engine.AudioEngine`.
+
+    :return: :class:`~song_match.audio_engine.AudioEngine`
+    """
+    return __audio_engine
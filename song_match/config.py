@@ -2,12 +2,24 @@ import os
 
 from pygame.mixer import init
 
+from song_match.audio_engine import get_audio_engine
+
 #: Root directory of the package to help load ``.wav`` files.
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+#: Sample rate of the mixer in Hz.
+#: Override per deployment with the ``SONG_MATCH_AUDIO_FREQUENCY`` environment variable.
+AUDIO_FREQUENCY = int(os.environ.get('SONG_MATCH_AUDIO_FREQUENCY', 44100))
+
+#: Number of samples in the mixer's buffer. Smaller buffers lower latency,
+#: but may crackle on slow machines.
+#: Override per deployment with the ``SONG_MATCH_AUDIO_BUFFER`` environment variable.
+AUDIO_BUFFER = int(os.environ.get('SONG_MATCH_AUDIO_BUFFER', 512))
+
 
 def init_mixer() -> None:
-    """Initializes pygame's mixer module by calling :func:`~pygame.mixer.init`.
+    """Initializes pygame's mixer module by calling :func:`~pygame.mixer.init`,
+    then opens the channels of the :class:`~song_match.audio_engine.AudioEngine`.
 
     See https://www.pygame.org/docs/ref/mixer.html#pygame.mixer.init.
 
@@ -15,4 +27,5 @@ def init_mixer() -> None:
 
     :return: None
     """
-    init(frequency=44100, size=-16, channels=1, buffer=1024)
+    init(frequency=AUDIO_FREQUENCY, size=-16, channels=1, buffer=AUDIO_BUFFER)
+    get_audio_engine().open_channels(AUDIO_BUFFER)
@@ -7,5 +7,8 @@
 from .lights import ORANGE_LIGHT
 from .lights import RED_LIGHT
 from .lights import YELLOW_LIGHT
+from .note_cube import FEEDBACK_MODES
+from .note_cube import LIGHT_FIRST
 from .note_cube import NoteCube
+from .note_cube import SOUND_FIRST
 from .note_cubes import NoteCubes
@@ -0,0 +1,218 @@
+"""Module containing :class:`~song_match.cube.light_animator.LightAnimator`
+and the light patterns it plays.
+
+A :class:`~song_match.cube.light_animator.LightPattern` is a precomputed table of frames,
+where each frame sets the four corners of a cube.
+Build patterns with :func:`chaser`, :func:`flash`, :func:`pulse` and :func:`solid`.
+"""
+
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from asyncio import ensure_future
+from asyncio import wait
+from math import cos
+from math import floor
+from math import pi
+from typing import Dict, Sequence, Tuple
+
+from cozmo.lights import Color
+from cozmo.lights import Light
+from cozmo.lights import off_light
+
+Frame = Tuple[Light, Light, Light, Light]
+
+# Time in seconds a frame may be shown early, so frames due at nearly the same time share a wakeup
+_FRAME_TOLERANCE = 0.005
+
+
+class LightPattern:
+    """Table of frames to show on a cube, one after the other."""
+
+    __slots__ = ('frames', 'frame_duration', 'repeat')
+
+    def __init__(self, frames: Sequence[Frame], frame_duration: float, repeat: bool = False):
+        if len(frames) == 0:
+            raise ValueError('A light pattern needs at least one frame.')
+        if repeat and frame_duration <= 0:
+            raise ValueError('A repeating light pattern needs a positive frame duration.')
+        self.frames = tuple(frames)
+        self.frame_duration = frame_duration  # Time in seconds each frame is shown
+        self.repeat = repeat  # Whether to loop until stopped, instead of finishing after the last frame
+
+    @property
+    def duration(self) -> float:
+        """Property for accessing the time in seconds the pattern takes to play through once."""
+        return len(self.frames) * self.frame_duration
+
+
+def chaser(light: Light, frame_duration: float = 0.1) -> LightPattern:
+    """Rotate ``light`` around the corners of the cube until stopped.
+
+    :param light: The light to rotate.
+    :param frame_duration: Time in seconds before moving to the next corner.
+    :return: :class:`~song_match.cube.light_animator.LightPattern`
+    """
+    frames = []
+    for i in range(4):
+        corners = [off_light] * 4
+        corners[i] = light
+        frames.append(tuple(corners))
+    return LightPattern(frames, frame_duration, repeat=True)
+
+
+def flash(light: Light, num_times: int, frame_duration: float = 0.15) -> LightPattern:
+    """Turn the cube off and back on to ``light`` a number of times.
+
+    :param light: The light to flash.
+    :param num_times: The number of times to flash the light.
+    :param frame_duration: Time in seconds between turning the light on and off.
+    :return: :class:`~song_match.cube.light_animator.LightPattern`
+    """
+    frames = [(off_light,) * 4, (light,) * 4] * num_times
+    return LightPattern(frames, frame_duration)
+
+
+def pulse(light: Light, period: float = 1.0, num_steps: int = 10) -> LightPattern:
+    """Fade ``light`` out and back in until stopped.
+
+    :param light: The light to pulse.
+    :param period: Time in seconds of one fade out and in.
+    :param num_steps: The number of frames in each period.
+    :return: :class:`~song_match.cube.light_animator.LightPattern`
+    """
+    int_color = light.on_color.int_color
+    rgb = ((int_color >> 24) & 0xff, (int_color >> 16) & 0xff, (int_color >> 8) & 0xff)
+    frames = []
+    for step in range(num_steps):
+        brightness = (1 + cos(2 * pi * step / num_steps)) / 2
+        color = Color(rgb=tuple(int(round(channel * brightness)) for channel in rgb))
+        frames.append((Light(on_color=color),) * 4)
+    return LightPattern(frames, period / num_steps, repeat=True)
+
+
+def solid(light: Light, duration: float = 0.0) -> LightPattern:
+    """Show ``light`` on every corner of the cube.
+
+    :param light: The light to show.
+    :param duration: Time in seconds before the pattern finishes. The light stays on afterwards.
+    :return: :class:`~song_match.cube.light_animator.LightPattern`
+    """
+    return LightPattern([(light,) * 4], duration)
+
+
+class _Animation:
+    __slots__ = ('note_cube', 'pattern', 'started_at', 'frame_index', 'future')
+
+    def __init__(self, note_cube, pattern: LightPattern, started_at: float, future: Future):
+        self.note_cube = note_cube
+        self.pattern = pattern
+        self.started_at = started_at
+        self.frame_index = None  # Index of the frame last shown
+        self.future = future  # Done when the pattern finishes or is stopped
+
+
+class LightAnimator:
+    """Plays :class:`~song_match.cube.light_animator.LightPattern` on cubes from a single task.
+
+    The task wakes once for each frame that's due, across every cube,
+    and exits when no patterns are playing.
+    """
+
+    def __init__(self, loop: AbstractEventLoop):
+        self._loop = loop
+        self.num_wakeups = 0  # Number of times the task woke up to show frames
+        self.num_frames = 0  # Number of frames shown
+        self.__animations = {}  # type: Dict[int, _Animation]
+        self.__task = None
+        self.__wakeup = None
+
+    def play(self, note_cube, pattern: LightPattern) -> Future:
+        """Play a pattern on a cube, replacing any pattern already playing on it.
+
+        :param note_cube: :class:`~song_match.cube.note_cube.NoteCube`
+        :param pattern: :class:`~song_match.cube.light_animator.LightPattern`
+        :return: Future done when the pattern finishes, or is stopped.
+        """
+        self.stop(note_cube)
+        animation = _Animation(note_cube, pattern, self._loop.time(), self._loop.create_future())
+        self.__animations[note_cube.cube_id] = animation
+        animation.future.add_done_callback(lambda future: self.stop(note_cube, future))  # Stop if cancelled
+        self.__show_frame(animation, 0)
+        if self.__task is None:
+            self.__task = ensure_future(self.__run(), loop=self._loop)
+        else:
+            self.__wake_up()  # Recompute when the next frame is due
+        return animation.future
+
+    def stop(self, note_cube, future: Future = None) -> None:
+        """Stop the pattern playing on a cube. The cube keeps showing its current frame.
+
+        :param note_cube: :class:`~song_match.cube.note_cube.NoteCube`
+        :param future: Only stop the pattern if it's the one :meth:`play` returned this future for.
+        :return: None
+        """
+        animation = self.__animations.get(note_cube.cube_id)
+        if animation is None or (future is not None and animation.future is not future):
+            return
+        self.__finish(animation)
+
+    def is_playing(self, note_cube) -> bool:
+        """Get whether a pattern is playing on a cube.
+
+        :param note_cube: :class:`~song_match.cube.note_cube.NoteCube`
+        :return: Whether a pattern is playing.
+        """
+        return note_cube.cube_id in self.__animations
+
+    async def __run(self) -> None:
+        try:
+            while len(self.__animations) > 0:
+                next_frame_at = self.__show_due_frames(self._loop.time())
+                if next_frame_at is None:
+                    break
+                self.__wakeup = self._loop.create_future()
+                await wait([self.__wakeup], timeout=max(next_frame_at - self._loop.time(), 0))
+                self.num_wakeups += 1
+        finally:
+            self.__task = None
+            self.__wakeup = None
+
+    def __show_due_frames(self, now: float) -> float:
+        """Show the frame due on each cube, and finish patterns that are done.
+
+        :return: Loop time the next frame is due, or None if no patterns are left.
+        """
+        next_frame_at = None
+        for animation in list(self.__animations.values()):
+            pattern = animation.pattern
+            elapsed = now - animation.started_at
+            if pattern.frame_duration > 0:
+                frame_count = int(floor((elapsed + _FRAME_TOLERANCE) / pattern.frame_duration))
+            else:
+                frame_count = len(pattern.frames)
+            if not pattern.repeat and frame_count >= len(pattern.frames):
+                self.__finish(animation)
+                continue
+            self.__show_frame(animation, frame_count % len(pattern.frames))
+            frame_at = animation.started_at + (frame_count + 1) * pattern.frame_duration
+            if next_frame_at is None or frame_at < next_frame_at:
+                next_frame_at = frame_at
+        return next_frame_at
+
+    def __show_frame(self, animation: _Animation, frame_index: int) -> None:
+        if animation.frame_index == frame_index:
+            return
+        animation.frame_index = frame_index
+        animation.note_cube.set_light_corners(*animation.pattern.frames[frame_index])
+        self.num_frames += 1
+
+    def __finish(self, animation: _Animation) -> None:
+        del self.__animations[animation.note_cube.cube_id]
+        if not animation.future.done():
+            animation.future.set_result(None)
+        if len(self.__animations) == 0:
+            self.__wake_up()  # Let the task exit
+
+    def __wake_up(self) -> None:
+        if self.__wakeup is not None and not self.__wakeup.done():
+            self.__wakeup.set_result(None)
@@ -0,0 +1,94 @@
+"""Module containing :class:`~song_match.cube.light_buffer.LightBuffer`."""
+
+from asyncio import AbstractEventLoop
+from typing import Dict, Tuple
+
+from cozmo.lights import Light
+from cozmo.objects import LightCube
+
+LightKey = Tuple[int, int, int, int, int, int]
+CornersKey = Tuple[LightKey, LightKey, LightKey, LightKey]
+
+
+def get_light_key(light: Light) -> LightKey:
+    """Get a key that's equal for lights that look the same.
+
+    :param light: :class:`~cozmo.lights.Light`
+    :return: Tuple of the light's colors and periods.
+    """
+    return (light.on_color.int_color, light.off_color.int_color,
+            light.on_period_ms, light.off_period_ms,
+            light.transition_on_period_ms, light.transition_off_period_ms)
+
+
+class LightBuffer:
+    """Buffers light updates to cubes, sending at most one command per cube each loop tick.
+
+    Updates to a cube in the same loop tick are merged into the last one,
+    and updates that match the lights last sent to the cube are dropped.
+    """
+
+    def __init__(self, loop: AbstractEventLoop):
+        self._loop = loop
+        self.num_sent = 0  # Number of light commands sent to cubes
+        self.num_merged = 0  # Number of updates replaced by a later update in the same loop tick
+        self.num_redundant = 0  # Number of updates dropped for matching the lights already on the cube
+        self.__pending = {}  # type: Dict[int, Tuple[LightCube, Tuple[Light, ...], CornersKey]]
+        self.__sent = {}  # type: Dict[int, CornersKey]
+        self.__flush_handle = None
+
+    def set_light_corners(self, cube: LightCube, light1: Light, light2: Light, light3: Light, light4: Light) -> None:
+        """Buffer setting each corner of a cube to a separate light.
+
+        :param cube: :class:`~cozmo.objects.LightCube`
+        :return: None
+        """
+        lights = (light1, light2, light3, light4)
+        key = (get_light_key(light1), get_light_key(light2), get_light_key(light3), get_light_key(light4))
+        if cube.cube_id in self.__pending:
+            self.num_merged += 1
+        self.__pending[cube.cube_id] = (cube, lights, key)
+        if self.__flush_handle is None:
+            self.__flush_handle = self._loop.call_soon(self.flush)
+
+    def set_lights(self, cube: LightCube, light: Light) -> None:
+        """Buffer setting all four corners of a cube to ``light``.
+
+        :param cube: :class:`~cozmo.objects.LightCube`
+        :param light: :class:`~cozmo.lights.Light`
+        :return: None
+        """
+        self.set_light_corners(cube, light, light, light, light)
+
+    def flush(self) -> None:
+        """Send the pending update of each cube, unless it matches the lights already on the cube.
+
+        Called automatically on the next loop tick after an update.
+
+        :return: None
+        """
+        if self.__flush_handle is not None:
+            self.__flush_handle.cancel()
+            self.__flush_handle = None
+        pending, self.__pending = self.__pending, {}
+        for cube_id, (cube, lights, key) in pending.items():
+            if self.__sent.get(cube_id) == key:
+                self.num_redundant += 1
+                continue
+            cube.set_light_corners(*lights)
+            self.__sent[cube_id] = key
+            self.num_sent += 1
+
+    def forget(self) -> None:
+        """Forget the lights last sent to each cube, so the next update is always sent.
+
+        Call if something else may have changed the cube lights, like a cube reconnecting.
+
+        :return: None
+        """
+        self.__sent.clear()
+
+    @property
+    def num_suppressed(self) -> int:
+        """Property for accessing the number of updates that weren't sent to a cube."""
+        return self.num_merged + self.num_redundant
@@ -1,49 +1,108 @@
 """Module containing :class:`~song_match.cube.note_cube.NoteCube`."""
 
 import asyncio
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from asyncio import get_event_loop
 from asyncio import sleep
+from asyncio import wait
 
 from cozmo.lights import Light, off_light
 from cozmo.objects import LightCube
 
+from song_match.game_constants import FEEDBACK_MODES
+from song_match.game_constants import LIGHT_FIRST
+from song_match.game_constants import SOUND_FIRST
 from song_match.song import Note
 from song_match.song import Song
-from .util import get_light_cube
+from song_match.tap_latency import LIGHT_OFF
+from song_match.tap_latency import LIGHT_ON
+from song_match.tap_latency import SOUND_START
+from song_match.tap_latency import TapTrace
+from .light_animator import LightAnimator
+from .light_animator import LightPattern
+from .light_animator import chaser
+from .light_animator import flash as flash_pattern
+from .light_buffer import LightBuffer
+
+#: Default time in seconds a cube blinks for when playing its note.
+BLINK_DURATION = 0.125
 
 
 class NoteCube:
-    """Wrapper class for a :class:`~cozmo.objects.LightCube` to play a note when tapped."""
+    """Wrapper class for a :class:`~cozmo.objects.LightCube` to play a note when tapped.
+
+    Get the one instance for each cube from :meth:`~song_match.song_robot.SongRobot.get_note_cube`,
+    so state like a running light chaser is shared by everything using the cube.
+    Blinks and light patterns run on ``loop``, the event loop of the robot. Defaults to the current event loop.
+    """
+
+    __slots__ = ('_cube', '_song', '_feedback_mode', '_light_buffer', '_light_animator', '_light_chaser', '_blink',
+                 '_loop')
 
     _BLINK_TIME = 0.1  # Controls how long the cube blinks for in seconds
 
-    def __init__(self, cube: LightCube, song: Song):
+    def __init__(self, cube: LightCube, song: Song, feedback_mode: str = LIGHT_FIRST,
+                 light_buffer: LightBuffer = None, light_animator: LightAnimator = None,
+                 loop: AbstractEventLoop = None):
+        if feedback_mode not in FEEDBACK_MODES:
+            raise ValueError('Invalid feedback mode {}.'.format(feedback_mode))
         self._cube = cube
         self._song = song
-        self._light_chaser = None
+        self._feedback_mode = feedback_mode
+        self._loop = get_event_loop() if loop is None else loop
+        self._light_buffer = light_buffer  # None sends light commands straight to the cube
+        self._light_animator = LightAnimator(self._loop) if light_animator is None else light_animator
+        self._light_chaser = None  # Future of the running light chaser pattern
+        self._blink = None  # Running sound first blink, so the next tap can cancel it
 
     @classmethod
     def of(cls, song_robot, cube_id: int) -> 'NoteCube':
-        """Static factory method for creating a :class:`~song_match.cube.note_cube.NoteCube`
-        from :class:`~song_match.song_robot.SongRobot`.
+        """Static factory method for getting the :class:`~song_match.cube.note_cube.NoteCube`
+        of a cube from :class:`~song_match.song_robot.SongRobot`.
 
         :param song_robot: :class:`~song_match.song_robot.SongRobot`
         :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
         """
-        cube = get_light_cube(song_robot, cube_id)
-        return NoteCube(cube, song_robot.song)
+        return song_robot.get_note_cube(cube_id)
 
-    async def blink_and_play_note(self, blink_duration=0.125) -> None:
+    async def blink_and_play_note(self, blink_duration=BLINK_DURATION, trace: TapTrace = None) -> None:
         """Blink the cube and play the corresponding note.
 
+        In :data:`LIGHT_FIRST` mode the note plays halfway through the blink.
+        In :data:`SOUND_FIRST` mode the note plays right away,
+        and the blink runs as a task that the next blink of the same cube cancels.
+        Either way, returns once the blink finishes or is cancelled.
+
         :param blink_duration: How long the cube blinks for in seconds.
+        :param trace: :class:`~song_match.tap_latency.TapTrace` to mark the light and sound stages on.
         :return: None
         """
+        if self._feedback_mode == SOUND_FIRST:
+            return await self.__play_note_and_blink(blink_duration, trace)
         sleep_duration = blink_duration / 2
-        self._cube.set_lights_off()
+        self.set_lights_off()
+        if trace is not None:
+            trace.mark(LIGHT_OFF)
         await sleep(sleep_duration)
         self._song.play_note(self.cube_id)
+        if trace is not None:
+            trace.mark(SOUND_START)
         await sleep(sleep_duration)
         self.turn_on_light()
+        if trace is not None:
+            trace.mark(LIGHT_ON)
+
+    def get_sound_delay(self, blink_duration: float = BLINK_DURATION) -> float:
+        """Get the time from calling :meth:`~song_match.cube.note_cube.NoteCube.blink_and_play_note`
+        to the note starting.
+
+        :param blink_duration: How long the cube blinks for in seconds.
+        :return: Delay in seconds.
+        """
+        if self._feedback_mode == SOUND_FIRST:
+            return 0.0
+        return blink_duration / 2
 
     def turn_on_light(self) -> None:
         """Turn on the light for the cube assigned in :class:`~song_match.song.song.Song`.
@@ -58,14 +117,38 @@ class NoteCube:
 
         :return: None
         """
-        self._cube.set_lights_off()
+        if self._light_buffer is None:
+            self._cube.set_lights_off()
+        else:
+            self._light_buffer.set_lights(self._cube, off_light)
 
     def set_lights(self, light: Light) -> None:
         """Wrapper method for :meth:`~cozmo.objects.LightCube.set_lights`.
 
         :return: None
         """
-        self._cube.set_lights(light)
+        if self._light_buffer is None:
+            self._cube.set_lights(light)
+        else:
+            self._light_buffer.set_lights(self._cube, light)
+
+    def set_light_corners(self, light1: Light, light2: Light, light3: Light, light4: Light) -> None:
+        """Wrapper method for :meth:`~cozmo.objects.LightCube.set_light_corners`.
+
+        :return: None
+        """
+        if self._light_buffer is None:
+            self._cube.set_light_corners(light1, light2, light3, light4)
+        else:
+            self._light_buffer.set_light_corners(self._cube, light1, light2, light3, light4)
+
+    def play_lights(self, pattern: LightPattern) -> Future:
+        """Play a light pattern on the cube, replacing any pattern already playing on it.
+
+        :param pattern: :class:`~song_match.cube.light_animator.LightPattern`
+        :return: Future done when the pattern finishes, or is replaced or stopped.
+        """
+        return self._light_animator.play(self, pattern)
 
     async def flash(self, light: Light, num_times: int, delay=0.15) -> None:
         """Flash a light a certain number of times.
@@ -75,37 +158,24 @@ class NoteCube:
         :param delay: Time in seconds between turning the light on and off.
         :return: None
         """
-        for _ in range(num_times):
-            self.set_lights_off()
-            await sleep(delay)
-            self.set_lights(light)
-            await sleep(delay)
+        await self.play_lights(flash_pattern(light, num_times, delay))
 
     def start_light_chaser(self, delay: float = 0.1) -> None:
         """Rotates the cube's color around the light corners in a continuous loop.
 
         :param delay: Time awaited before moving the rotating lights.
         """
-        if self._light_chaser:
+        if self._light_chaser is not None and not self._light_chaser.done():
             raise ValueError('Light chaser already running.')
-
-        async def _chaser():
-            while True:
-                for i in range(4):
-                    colors = [off_light] * 4
-                    colors[i] = self._song.get_cube_light(self.cube_id)
-                    self._cube.set_light_corners(*colors)
-                    await asyncio.sleep(delay, loop=self._cube._loop)
-
-        self._light_chaser = asyncio.ensure_future(_chaser(), loop=self._cube._loop)
+        self._light_chaser = self.play_lights(chaser(self._song.get_cube_light(self.cube_id), delay))
 
     def stop_light_chaser(self) -> None:
         """Ends the light chaser effect.
 
         :return: None
         """
-        if self._light_chaser:
-            self._light_chaser.cancel()
+        if self._light_chaser is not None:
+            self._light_animator.stop(self, self._light_chaser)
             self._light_chaser = None
         self.turn_on_light()
 
@@ -124,3 +194,24 @@ class NoteCube:
         :return: :attr:`~cozmo.objects.LightCube.cube_id`
         """
         return self._cube.cube_id
+
+    async def __play_note_and_blink(self, blink_duration: float, trace: TapTrace = None) -> None:
+        self._song.play_note(self.cube_id)
+        if trace is not None:
+            trace.mark(SOUND_START)
+        if self._blink is not None:
+            self._blink.cancel()
+        blink = asyncio.ensure_future(self.__blink(blink_duration, trace), loop=self._loop)
+        self._blink = blink
+        await wait([blink])  # Unlike awaiting the blink, doesn't raise if the next tap cancels it
+        if self._blink is blink:
+            self._blink = None
+
+    async def __blink(self, blink_duration: float, trace: TapTrace = None) -> None:
+        self.set_lights_off()
+        if trace is not None:
+            trace.mark(LIGHT_OFF)
+        await sleep(blink_duration)
+        self.turn_on_light()
+        if trace is not None:
+            trace.mark(LIGHT_ON)
@@ -1,34 +1,33 @@
 """Module containing :class:`~song_match.cube.note_cubes.NoteCubes`."""
 
+from asyncio import gather
 from asyncio import sleep
 from typing import List
 
 from cozmo.lights import off_light, green_light, red_light, Light
-from cozmo.objects import LightCube
 
 from song_match.song import Song
-from song_match.song_robot import SongRobot
+from .light_animator import flash
 from .note_cube import NoteCube
-from .util import get_light_cubes
 
 
 class NoteCubes:
     """Container class for three :class:`~song_match.cube.note_cube.NoteCube`."""
 
+    __slots__ = ('_note_cubes', '_song')
+
     def __init__(self, note_cubes: List[NoteCube], song: Song):
         self._note_cubes = note_cubes
         self._song = song
 
     @staticmethod
-    def of(song_robot: SongRobot) -> 'NoteCubes':
-        """Static factory method for creating :class:`~song_match.cube.note_cubes.NoteCubes`
-        from :class:`~song_match.song_robot.SongRobot`.
+    def of(song_robot) -> 'NoteCubes':
+        """Static factory method for getting the :class:`~song_match.cube.note_cubes.NoteCubes`
+        of :class:`~song_match.song_robot.SongRobot`.
 
         :param song_robot: :class:`~song_match.song_robot.SongRobot`
         """
-        light_cubes = get_light_cubes(song_robot)
-        note_cubes = get_note_cubes(light_cubes, song_robot.song)
-        return NoteCubes(note_cubes, song_robot.song)
+        return song_robot.note_cubes
 
     def turn_on_lights(self) -> None:
         """Turn on the light for each note cube.
@@ -48,11 +47,8 @@ class NoteCubes:
         :param delay: Time in seconds between turning the light on and off.
         :return: None
         """
-        for _ in range(num_times):
-            self.set_lights_off()
-            await sleep(delay)
-            self.set_lights(green_light)
-            await sleep(delay)
+        pattern = flash(green_light, num_times, delay)
+        await gather(*[note_cube.play_lights(pattern) for note_cube in self._note_cubes])
         self.turn_on_lights()
 
     async def flash_lights(self, num_times: int = 4, delay=0.15) -> None:
@@ -62,11 +58,8 @@ class NoteCubes:
         :param delay: Time in seconds between turning the light on and off.
         :return: None
         """
-        for _ in range(num_times):
-            self.set_lights_off()
-            await sleep(delay)
-            self.turn_on_lights()
-            await sleep(delay)
+        await gather(*[note_cube.play_lights(flash(self._song.get_cube_light(note_cube.cube_id), num_times, delay))
+                       for note_cube in self._note_cubes])
 
     def set_lights(self, light: Light) -> None:
         """Call :meth:`~cozmo.objects.LightCube.set_lights` for each cube.
@@ -170,12 +163,3 @@ class NoteCubes:
         """Convenience method to get a note cube."""
         return next(cube for cube in self._note_cubes if cube.cube_id == cube_id)
 
-
-def get_note_cubes(light_cubes: List[LightCube], song: Song) -> List[NoteCube]:
-    """Convert a list of light cubes to note cubes.
-
-    :param light_cubes: A list of three :class:`~cozmo.objects.LightCube` instances.
-    :param song: :class:`~song_match.song.song.Song`
-    :return: A list of three :class:`~song_match.cube.note_cube.NoteCube` instances.
-    """
-    return list(map(lambda cube: NoteCube(cube, song), light_cubes))
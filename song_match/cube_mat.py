@@ -1,7 +1,37 @@
+from array import array
+from functools import update_wrapper
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Tuple
 
 from cozmo.objects import LightCubeIDs, LightCube
+from cozmo.util import Pose
+
+
+# Number of entries in each lookup array, one per cube plus the unused index 0
+_LAYOUT_SIZE = len(LightCubeIDs) + 1
+
+
+class _default_instance_method:
+    """Decorator for a method that runs on :meth:`CubeMat.get_default` when called on the class.
+
+    Keeps the class level API working, like ``CubeMat.cube_id_to_position(cube_id)``.
+
+    The first access on an instance stores the bound method on the instance,
+    so later calls skip this descriptor and cost the same as a plain method call.
+    """
+
+    def __init__(self, method: Callable):
+        self.__method = method
+        update_wrapper(self, method)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.__method.__get__(owner.get_default(), owner)
+        bound_method = self.__method.__get__(instance, owner)
+        instance.__dict__[self.__method.__name__] = bound_method
+        return bound_method
 
 
 class CubeMat:
@@ -33,31 +63,104 @@ class CubeMat:
     * 2 -> 1
     * 1 -> 2
     * 3 -> 3
+
+    Both conversions are kept in fixed-size byte arrays, indexed by cube ID and mat position,
+    and are filled in place when :meth:`~song_match.cube_mat.CubeMat.order_cubes_by_position` runs,
+    so each lookup takes constant time and allocates nothing.
+
+    The pose of each cube when it was ordered is kept too,
+    see :meth:`~song_match.cube_mat.CubeMat.get_pose`.
+
+    Anything else derived from the cube order can stay consistent with it
+    by registering a listener with :meth:`~song_match.cube_mat.CubeMat.add_order_listener`.
+
+    Each game has its own instance, held by :class:`~song_match.song_match.SongMatch`
+    and :class:`~song_match.song_robot.SongRobot`, and plays its song through
+    :meth:`~song_match.song.song.Song.with_cube_mat`, so games in the same process can have different layouts.
+    Calling the methods on the class uses a shared default instance, see
+    :meth:`~song_match.cube_mat.CubeMat.get_default`.
     """
-    __cube_order = None  # type: Dict[int, int]
+    __default = None  # type: CubeMat
+
+    def __init__(self):
+        self.__positions = None  # type: Tuple[int, ...]
+        # Index 0 is unused, and 0 marks a cube or position that wasn't ordered yet
+        self.__cube_id_to_position = array('B', bytes(_LAYOUT_SIZE))
+        self.__position_to_cube_id = array('B', bytes(_LAYOUT_SIZE))
+        self.__poses = {}  # type: Dict[int, Pose]
+        self.__order_listeners = []  # type: List[Callable[[Tuple[int, ...]], None]]
 
     @classmethod
-    def get_positions(cls) -> List[int]:
-        """Get a list of mat positions ordered by cube ID.
+    def get_default(cls) -> 'CubeMat':
+        """Get the default instance, used when the methods are called on the class.
 
-        :return: A list of mat positions ordered by cube ID.
+        :return: :class:`~song_match.cube_mat.CubeMat`
         """
-        return list(cls.__cube_order.values())
+        if cls.__default is None:
+            cls.__default = cls()
+        return cls.__default
 
-    @classmethod
-    def order_cubes_by_position(cls, song_robot) -> None:
+    @_default_instance_method
+    def get_positions(self) -> Tuple[int, ...]:
+        """Get the cube IDs ordered by mat position, from left to right.
+
+        :return: A tuple of :attr:`~cozmo.objects.LightCube.cube_id` ordered by mat position.
+        """
+        return self.__positions
+
+    @_default_instance_method
+    def get_pose(self, cube_id: int) -> Pose:
+        """Get the pose of a cube when the cubes were last ordered by position.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :return: :class:`~cozmo.util.Pose`, or None if the cubes weren't ordered yet.
+        """
+        return self.__poses.get(cube_id)
+
+    @_default_instance_method
+    def add_order_listener(self, listener: Callable[[Tuple[int, ...]], None]) -> None:
+        """Register a listener called whenever the cubes are ordered by position.
+
+        The listener is called with the cube IDs ordered by mat position,
+        see :meth:`~song_match.cube_mat.CubeMat.get_positions`.
+
+        :param listener: Callable taking a tuple of cube IDs.
+        :return: None
+        """
+        self.__order_listeners.append(listener)
+
+    @_default_instance_method
+    def remove_order_listener(self, listener: Callable[[Tuple[int, ...]], None]) -> None:
+        """Remove a listener registered with :meth:`~song_match.cube_mat.CubeMat.add_order_listener`.
+
+        :param listener: The registered listener.
+        :return: None
+        """
+        self.__order_listeners.remove(listener)
+
+    @_default_instance_method
+    def order_cubes_by_position(self, song_robot) -> None:
         """Assign each cube ID to a mat position.
 
         :param song_robot: :class:`~song_match.song_robot.SongRobot`
         :return: None
         """
-        cubes = cls.get_light_cubes(song_robot)
+        cubes = self.get_light_cubes(song_robot)
+        self.__poses = {cube.cube_id: cube.pose for cube in cubes}
         sorted_cubes = sorted(cubes, key=lambda cube: cube.pose.position.y)
         sorted_cube_ids = list(map(lambda cube: cube.cube_id, sorted_cubes))
-        cls.__cube_order = dict(zip(LightCubeIDs, sorted_cube_ids))
-
-    @classmethod
-    def get_light_cubes(cls, song_robot) -> List[LightCube]:
+        self.__set_cube_order(sorted_cube_ids)
+
+    def __set_cube_order(self, sorted_cube_ids: List[int]) -> None:
+        for position, cube_id in enumerate(sorted_cube_ids, start=1):
+            self.__cube_id_to_position[cube_id] = position
+            self.__position_to_cube_id[position] = cube_id
+        self.__positions = tuple(sorted_cube_ids)
+        for listener in self.__order_listeners:
+            listener(self.__positions)
+
+    @staticmethod
+    def get_light_cubes(song_robot) -> List[LightCube]:
         """Convenience method to get a list of light cubes.
 
         Note:
@@ -68,22 +171,20 @@ class CubeMat:
         """
         return list(song_robot.robot.world.light_cubes.values())
 
-    @classmethod
-    def position_to_cube_id(cls, cube_id: int) -> int:
+    @_default_instance_method
+    def position_to_cube_id(self, position: int) -> int:
         """Maps a mat position to a :attr:`~cozmo.objects.LightCube.cube_id`.
 
-        :param cube_id: The ordered cube ID.
+        :param position: The mat position.
         :return: :attr:`~cozmo.objects.LightCube.cube_id`
         """
-        cube_ids = list(cls.__cube_order.keys())
-        order = list(cls.__cube_order.values())
-        return cube_ids[order.index(cube_id)]
+        return self.__position_to_cube_id[position]
 
-    @classmethod
-    def cube_id_to_position(cls, cube_id: int) -> int:
+    @_default_instance_method
+    def cube_id_to_position(self, cube_id: int) -> int:
         """Maps the :attr:`~cozmo.objects.LightCube.cube_id` to a mat position.
 
         :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
-        :return: The ordered cube ID.
+        :return: The mat position.
         """
-        return cls.__cube_order[cube_id]
+        return self.__cube_id_to_position[cube_id]
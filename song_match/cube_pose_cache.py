@@ -0,0 +1,93 @@
+"""Module containing :class:`~song_match.cube_pose_cache.CubePoseCache`."""
+
+from time import monotonic
+from typing import Callable, Dict, Tuple
+
+from cozmo.util import Pose
+
+#: Default time in seconds before a cached pose is too old to turn to without looking for the cube again.
+MAX_POSE_AGE = 5.0
+
+
+class CubePoseCache:
+    """Keeps the last pose each cube was observed at, and when.
+
+    Add :meth:`~song_match.cube_pose_cache.CubePoseCache.on_object_observed` as a handler for
+    :class:`~cozmo.objects.EvtObjectObserved` to keep the poses up to date.
+    """
+
+    def __init__(self, clock: Callable[[], float] = monotonic, max_age: float = MAX_POSE_AGE):
+        self.clock = clock  # Monotonic clock observations are timed with, like the event loop's time
+        self.max_age = max_age  # Time in seconds before a pose is stale
+        self.num_updates = 0  # Number of observations recorded
+        self.num_hits = 0  # Number of fresh poses returned by get_fresh_pose
+        self.num_stale = 0  # Number of times get_fresh_pose found a stale or missing pose
+        self.__poses = {}  # type: Dict[int, Tuple[Pose, float]]
+
+    def on_object_observed(self, evt, **kwargs) -> None:
+        """Handler for :class:`~cozmo.objects.EvtObjectObserved` recording the pose of observed cubes.
+
+        :param evt: :class:`~cozmo.objects.EvtObjectObserved`
+        :return: None
+        """
+        cube_id = getattr(evt.obj, 'cube_id', None)
+        if cube_id is not None:
+            self.update(cube_id, evt.obj.pose if evt.pose is None else evt.pose)
+
+    def update(self, cube_id: int, pose: Pose) -> None:
+        """Record that a cube was observed at a pose just now.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :param pose: :class:`~cozmo.util.Pose`
+        :return: None
+        """
+        self.__poses[cube_id] = (pose, self.clock())
+        self.num_updates += 1
+
+    def get_pose(self, cube_id: int) -> Pose:
+        """Get the last pose a cube was observed at, however old.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :return: :class:`~cozmo.util.Pose`, or None if the cube wasn't observed.
+        """
+        pose, _ = self.__poses.get(cube_id, (None, None))
+        return pose
+
+    def get_fresh_pose(self, cube_id: int) -> Pose:
+        """Get the last pose a cube was observed at, if it isn't stale.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :return: :class:`~cozmo.util.Pose`, or None if the pose is stale or the cube wasn't observed.
+        """
+        if self.is_stale(cube_id):
+            self.num_stale += 1
+            return None
+        self.num_hits += 1
+        return self.get_pose(cube_id)
+
+    def get_age(self, cube_id: int) -> float:
+        """Get how long ago a cube was last observed.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :return: Age in seconds, or None if the cube wasn't observed.
+        """
+        if cube_id not in self.__poses:
+            return None
+        _, observed_at = self.__poses[cube_id]
+        return self.clock() - observed_at
+
+    def is_stale(self, cube_id: int) -> bool:
+        """Get whether a cube's pose is too old to rely on, or missing.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :return: Whether the cube has to be observed again.
+        """
+        age = self.get_age(cube_id)
+        return age is None or age > self.max_age
+
+    def clear(self) -> None:
+        """Forget every pose.
+
+        :return: None
+        """
+        self.__poses.clear()
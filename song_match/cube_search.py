@@ -0,0 +1,105 @@
+"""Module containing :class:`~song_match.cube_search.CubeSearchMetrics`,
+and helpers to plan the turns Cozmo makes while searching for a cube.
+"""
+
+from itertools import repeat
+from math import atan2
+from math import degrees as to_degrees
+from typing import Iterator, List
+
+from cozmo.util import Angle
+from cozmo.util import Pose
+from cozmo.util import degrees
+
+#: Angle in degrees Cozmo turns between looks once he's past where the cube should be.
+SEARCH_STEP = 30
+
+
+def get_heading(robot_pose: Pose, cube_pose: Pose) -> float:
+    """Get the heading Cozmo faces a cube at, to turn to with ``is_absolute=True``.
+
+    :param robot_pose: :attr:`~cozmo.robot.Robot.pose`
+    :param cube_pose: :attr:`~cozmo.objects.LightCube.pose`
+    :return: Angle in degrees from -180 to 180.
+    """
+    dx = cube_pose.position.x - robot_pose.position.x
+    dy = cube_pose.position.y - robot_pose.position.y
+    return to_degrees(atan2(dy, dx))
+
+
+def get_relative_heading(robot_pose: Pose, cube_pose: Pose) -> float:
+    """Get the angle Cozmo has to turn to face a cube.
+
+    :param robot_pose: :attr:`~cozmo.robot.Robot.pose`
+    :param cube_pose: :attr:`~cozmo.objects.LightCube.pose`
+    :return: Angle in degrees from -180 to 180. Positive angles turn left.
+    """
+    heading = get_heading(robot_pose, cube_pose) - robot_pose.rotation.angle_z.degrees
+    return (heading + 180) % 360 - 180
+
+
+def get_search_turns(relative_heading: float = None) -> Iterator[Angle]:
+    """Get the turns to make while searching for a cube, in order.
+
+    With a known heading, first turn straight to it,
+    then keep stepping in the same direction in case the cube moved further along.
+    Otherwise, step left.
+
+    :param relative_heading: Angle in degrees to where the cube last was,
+                             see :func:`~song_match.cube_search.get_relative_heading`.
+    :return: Endless iterator of relative turns.
+    """
+    if relative_heading is None:
+        yield from repeat(degrees(SEARCH_STEP))
+        return
+    yield degrees(relative_heading)
+    step = SEARCH_STEP if relative_heading >= 0 else -SEARCH_STEP
+    yield from repeat(degrees(step))
+
+
+class CubeSearchMetrics:
+    """Collects how long each search for a cube took, and how many turns it needed."""
+
+    def __init__(self):
+        self.search_times = []  # type: List[float]
+        self.turn_counts = []  # type: List[int]
+
+    def record(self, search_time: float, num_turns: int) -> None:
+        """Add a finished search.
+
+        :param search_time: Time in seconds the search took.
+        :param num_turns: Number of turns Cozmo made.
+        :return: None
+        """
+        self.search_times.append(search_time)
+        self.turn_counts.append(num_turns)
+
+    def clear(self) -> None:
+        """Remove every recorded search.
+
+        :return: None
+        """
+        self.search_times.clear()
+        self.turn_counts.clear()
+
+    def __len__(self) -> int:
+        return len(self.search_times)
+
+    @property
+    def mean_search_time(self) -> float:
+        """Property for accessing the mean time in seconds a search took, or None if there were none."""
+        if len(self) == 0:
+            return None
+        return sum(self.search_times) / len(self)
+
+    @property
+    def mean_num_turns(self) -> float:
+        """Property for accessing the mean number of turns a search needed, or None if there were none."""
+        if len(self) == 0:
+            return None
+        return sum(self.turn_counts) / len(self)
+
+    @property
+    def max_num_turns(self) -> int:
+        """Property for accessing the most turns a search needed."""
+        return max(self.turn_counts, default=0)
@@ -2,7 +2,11 @@
   * :class:`~song_match.effect.effect.Effect` - Abstract base class for game effects.
   * :class:`~song_match.effect.factory.EffectFactory` - Factory for creating
     :class:`~song_match.effect.effect.Effect` instances.
+  * :mod:`~song_match.effect.registry` - Registry mapping effect types to
+    :class:`~song_match.effect.effect.Effect` classes.
 """
 
 from .effect import Effect
 from .factory import EffectFactory
+from .registry import get_effect_types
+from .registry import register_effect
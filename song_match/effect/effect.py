@@ -2,14 +2,35 @@ from abc import ABC
 
 from song_match.cube import NoteCubes
 from song_match.song_robot import SongRobot
+from .registry import register_effect
 
 
 class Effect(ABC):
-    """Abstract base class for game effects."""
+    """Abstract base class for game effects.
+
+    Subclasses register themselves with :func:`~song_match.effect.registry.register_effect`
+    under their class name without the ``Effect`` suffix.
+    """
 
     def __init__(self, song_robot: SongRobot):
         self._song_robot = song_robot
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        effect_type = cls.__name__
+        if effect_type.endswith('Effect'):
+            effect_type = effect_type[:-len('Effect')]
+        register_effect(effect_type, cls)
+
+    def prepare(self) -> None:
+        """Get everything the effect needs ready before the first round, so playing it doesn't have to.
+
+        Creates the note cubes. Subclasses also decode their sounds.
+
+        :return: None
+        """
+        self._note_cubes  # Creates the note cubes on first access
+
     @property
-    def _note_cubes(self):
-        return NoteCubes.of(self._song_robot)
+    def _note_cubes(self) -> NoteCubes:
+        return self._song_robot.note_cubes
@@ -1,12 +1,21 @@
 from cozmo.anim import Triggers
 
 from song_match.effect.effect import Effect
+from song_match.sound_effects import get_collect_point_sound
 from song_match.sound_effects import play_collect_point_sound
 
 
 class CorrectSequenceEffect(Effect):
     """Played when either a player or Cozmo matches a sequence of notes correctly."""
 
+    def prepare(self) -> None:
+        """Create the note cubes and decode ``collect-point.wav``.
+
+        :return: None
+        """
+        super().prepare()
+        get_collect_point_sound()
+
     async def play(self, is_sequence_long: bool = False, is_player: bool = True) -> None:
         """Play the correct sequence effect.
 
@@ -6,11 +6,20 @@ from cozmo.anim import Triggers
 
 from song_match.effect.effect import Effect
 from song_match.player import Player
+from song_match.sound_effects import get_collect_point_sound
 from song_match.sound_effects import play_collect_point_sound
 
 
 class GameOverEffect(Effect):
 
+    def prepare(self) -> None:
+        """Create the note cubes and decode ``collect-point.wav``.
+
+        :return: None
+        """
+        super().prepare()
+        get_collect_point_sound()
+
     async def play(self, winners: List[Player], did_cozmo_win: bool = True) -> AnimationTrigger:
         """Play the game over effect.
 
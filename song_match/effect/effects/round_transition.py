@@ -1,12 +1,21 @@
 from asyncio import sleep
 
 from song_match.effect import Effect
+from song_match.sound_effects import get_level_complete_sound
 from song_match.sound_effects import play_level_complete_sound
 
 
 class RoundTransitionEffect(Effect):
     """Played when transitioning between rounds of the game."""
 
+    def prepare(self) -> None:
+        """Create the note cubes and decode ``level-complete.wav``.
+
+        :return: None
+        """
+        super().prepare()
+        get_level_complete_sound()
+
     async def play(self) -> None:
         """Play the round transition effect.
 
@@ -1,12 +1,21 @@
 from cozmo.anim import Triggers
 
 from song_match.effect import Effect
+from song_match.sound_effects import get_wrong_buzzer_sound
 from song_match.sound_effects import play_wrong_buzzer_sound
 
 
 class WrongNoteEffect(Effect):
     """Played when either a player or Cozmo plays the wrong note."""
 
+    def prepare(self) -> None:
+        """Create the note cubes and decode ``wrong-buzzer.wav``.
+
+        :return: None
+        """
+        super().prepare()
+        get_wrong_buzzer_sound()
+
     async def play(self, cube_id: int, is_player: bool = True) -> None:
         """Play the wrong note effect.
 
@@ -1,31 +1,44 @@
-from song_match.exceptions import InvalidEffectType
+from typing import Dict
+
 from song_match.song_robot import SongRobot
-from .effects import CorrectSequenceEffect
-from .effects import RoundTransitionEffect
-from .effects import WrongNoteEffect
-from .effects import GameOverEffect
+from . import effects  # Importing the built in effects registers them
+from .effect import Effect
+from .registry import get_effect_class
+from .registry import get_effect_types
+
 
 class EffectFactory:
-    """Factory for creating :class:`~song_match.effect.effect.Effect` instances."""
+    """Factory for creating :class:`~song_match.effect.effect.Effect` instances.
+
+    Holds one instance of each effect type for its :class:`~song_match.song_robot.SongRobot`.
+    """
 
     def __init__(self, song_robot: SongRobot):
         self._song_robot = song_robot
+        self._effects = {}  # type: Dict[str, Effect]
 
-    def create(self, effect_type: str):
+    def create(self, effect_type: str) -> Effect:
         """Factory method for creating effects.
+        Returns the same instance every time it's called with the same effect type.
 
         Usage: :code:`create('WrongNote')`
 
-        :param effect_type: Upper camel case class name of the effect.
+        :param effect_type: Upper camel case class name of the effect, without the ``Effect`` suffix.
         :return: :class:`~song_match.effect.effect.Effect`
         """
-        if effect_type == 'CorrectSequence':
-            return CorrectSequenceEffect(self._song_robot)
-        elif effect_type == 'WrongNote':
-            return WrongNoteEffect(self._song_robot)
-        elif effect_type == 'RoundTransition':
-            return RoundTransitionEffect(self._song_robot)
-        elif effect_type == 'GameOver':
-            return GameOverEffect(self._song_robot)
-        else:
-            raise InvalidEffectType(effect_type)
+        effect = self._effects.get(effect_type)
+        if effect is None:
+            effect_class = get_effect_class(effect_type)
+            effect = effect_class(self._song_robot)
+            self._effects[effect_type] = effect
+        return effect
+
+    def prepare(self) -> None:
+        """Create every registered effect and call its :meth:`~song_match.effect.effect.Effect.prepare` hook.
+
+        Call once the cubes are connected, before the first round.
+
+        :return: None
+        """
+        for effect_type in get_effect_types():
+            self.create(effect_type).prepare()
@@ -0,0 +1,90 @@
+"""Registry mapping effect types to :class:`~song_match.effect.effect.Effect` classes.
+
+Subclasses of :class:`~song_match.effect.effect.Effect` register themselves
+under their class name without the ``Effect`` suffix.
+For example, ``WrongNoteEffect`` is registered as ``'WrongNote'``.
+
+Third-party packages can add effects through the ``song_match.effects`` entry point group::
+
+    setup(
+        ...
+        entry_points={
+            'song_match.effects': ['Confetti = my_package.confetti:ConfettiEffect']
+        }
+    )
+"""
+
+from typing import Dict, List, Type
+
+from song_match.exceptions import DuplicateEffectType
+from song_match.exceptions import InvalidEffectType
+
+#: Entry point group third-party effects are registered under.
+ENTRY_POINT_GROUP = 'song_match.effects'
+
+__effect_classes = {}  # type: Dict[str, Type]
+__loaded_entry_points = False
+
+
+def register_effect(effect_type: str, effect_class: Type) -> None:
+    """Register an effect class under an effect type.
+
+    :param effect_type: Upper camel case name of the effect. For example, ``'WrongNote'``.
+    :param effect_class: Subclass of :class:`~song_match.effect.effect.Effect`.
+    :return: None
+    """
+    registered_class = __effect_classes.get(effect_type)
+    if registered_class is not None and registered_class is not effect_class:
+        raise DuplicateEffectType(effect_type)
+    __effect_classes[effect_type] = effect_class
+
+
+def get_effect_class(effect_type: str) -> Type:
+    """Get the effect class registered under an effect type.
+
+    Loads the ``song_match.effects`` entry points the first time an effect type isn't found.
+
+    :param effect_type: Upper camel case name of the effect. For example, ``'WrongNote'``.
+    :return: Subclass of :class:`~song_match.effect.effect.Effect`.
+    """
+    effect_class = __effect_classes.get(effect_type)
+    if effect_class is None:
+        load_entry_points()
+        effect_class = __effect_classes.get(effect_type)
+    if effect_class is None:
+        raise InvalidEffectType(effect_type)
+    return effect_class
+
+
+def get_effect_types() -> List[str]:
+    """Get every registered effect type, including those from entry points.
+
+    :return: List of effect types in the order they were registered.
+    """
+    load_entry_points()
+    return list(__effect_classes.keys())
+
+
+def load_entry_points() -> None:
+    """Register the effects of the ``song_match.effects`` entry points. Only loads them once.
+
+    :return: None
+    """
+    global __loaded_entry_points
+    if __loaded_entry_points:
+        return
+    __loaded_entry_points = True
+    for entry_point in _get_entry_points(ENTRY_POINT_GROUP):
+        register_effect(entry_point.name, entry_point.load())
+
+
+def _get_entry_points(group: str) -> list:
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        from pkg_resources import iter_entry_points
+        return list(iter_entry_points(group))
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, 'select'):  # Python >= 3.10
+        return list(all_entry_points.select(group=group))
+    return list(all_entry_points.get(group, []))
@@ -1,6 +1,10 @@
 """Package containing custom exceptions."""
 
+from .exceptions import DuplicateEffectType
+from .exceptions import DuplicateSongKey
 from .exceptions import InvalidEffectType
 from .exceptions import InvalidGameEffectSound
 from .exceptions import InvalidNote
+from .exceptions import InvalidSongFile
+from .exceptions import InvalidSongKey
 from .exceptions import MixerNotInitialized
@@ -45,3 +45,51 @@ class InvalidGameEffectSound(ValueError):
     @staticmethod
     def _message(game_effect_sound: str) -> str:
         return 'Invalid game effect sound "' + game_effect_sound + '".'
+
+
+class DuplicateEffectType(ValueError):
+    """Raise if registering an effect type that's already registered to a different effect."""
+
+    def __init__(self, effect_type):
+        message = self._message(effect_type)
+        super(DuplicateEffectType, self).__init__(message)
+
+    @staticmethod
+    def _message(effect_type: str) -> str:
+        return 'Effect type "' + effect_type + '" is already registered.'
+
+
+class InvalidSongKey(ValueError):
+    """Raise if an invalid song key occurs."""
+
+    def __init__(self, key):
+        message = self._message(key)
+        super(InvalidSongKey, self).__init__(message)
+
+    @staticmethod
+    def _message(key: str) -> str:
+        return 'Invalid song key "' + key + '".'
+
+
+class DuplicateSongKey(ValueError):
+    """Raise if registering a song key that's already registered to a different song."""
+
+    def __init__(self, key):
+        message = self._message(key)
+        super(DuplicateSongKey, self).__init__(message)
+
+    @staticmethod
+    def _message(key: str) -> str:
+        return 'Song key "' + key + '" is already registered.'
+
+
+class InvalidSongFile(ValueError):
+    """Raise if a song file can't be compiled."""
+
+    def __init__(self, path, reason):
+        message = self._message(path, reason)
+        super(InvalidSongFile, self).__init__(message)
+
+    @staticmethod
+    def _message(path: str, reason: str) -> str:
+        return 'Invalid song file "' + path + '": ' + reason
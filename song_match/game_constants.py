@@ -6,3 +6,21 @@ TIME_IN_BETWEEN_PLAYERS_AND_COZMO = 1
 
 #: The number of notes you start with in the sequence
 STARTING_POSITION = 3
+
+#: Chance, per note in the sequence, that Cozmo hesitates before each note he plays
+COZMO_CHANCE_FOR_ERROR = .01
+
+#: Chance, per note in the sequence, that Cozmo plays the wrong note after hesitating
+COZMO_CHANCE_TO_PLAY_WRONG_NOTE = .1
+
+#: Multiplies Cozmo's chance to play the wrong note when the sequence is long
+LONG_SEQUENCE_DIFFICULTY = 1.5
+
+#: Feedback mode turning the cube's light off, then playing the note halfway through the blink.
+LIGHT_FIRST = 'light-first'
+
+#: Feedback mode playing the note right away, and blinking the cube alongside it.
+SOUND_FIRST = 'sound-first'
+
+#: Every feedback mode of :meth:`~song_match.cube.note_cube.NoteCube.blink_and_play_note`.
+FEEDBACK_MODES = (LIGHT_FIRST, SOUND_FIRST)
@@ -0,0 +1,53 @@
+"""Module containing :class:`~song_match.game_result.GameResult`."""
+
+from typing import Dict, List
+
+from .player import Player
+from .sequence_scheduler import SequenceTiming
+from .tap_latency import TapLatencyMetrics
+
+
+class GameResult:
+    """How a finished game of :class:`~song_match.song_match.SongMatch` went.
+
+    Returned by :meth:`~song_match.song_match.SongMatch.play`.
+    """
+
+    def __init__(self,
+                 players: List[Player],
+                 cozmo_strikes: int,
+                 did_cozmo_win: bool,
+                 num_rounds: int,
+                 game_time: float,
+                 tap_latency: TapLatencyMetrics,
+                 sequence_timings: List[SequenceTiming]):
+        self.players = players  # Human players, with the strikes they ended with
+        self.cozmo_strikes = cozmo_strikes  # Number of wrong notes Cozmo tapped
+        self.did_cozmo_win = did_cozmo_win
+        self.num_rounds = num_rounds  # Number of rounds started, including the last one
+        self.game_time = game_time  # Time in seconds from setting up the game to the end of the results
+        self.tap_latency = tap_latency
+        self.sequence_timings = sequence_timings
+
+    @property
+    def winners(self) -> List[Player]:
+        """Property for accessing the players who won the game."""
+        return [player for player in self.players if player.did_win]
+
+    @property
+    def strikes(self) -> Dict[int, int]:
+        """Property for accessing the number of strikes of each player, by player ID."""
+        return {player.id: player.num_wrong for player in self.players}
+
+    def format(self) -> str:
+        """Format the outcome of the game as one line.
+
+        :return: The line.
+        """
+        winners = [str(player) for player in self.winners] + (['Cozmo'] if self.did_cozmo_win else [])
+        strikes = ', '.join('{}: {}'.format(player, player.num_wrong) for player in self.players)
+        return '{} won after {} rounds in {:.1f} s. Strikes: {}, Cozmo: {}'.format(
+            ', '.join(winners) or 'Nobody', self.num_rounds, self.game_time, strikes, self.cozmo_strikes)
+
+    def __repr__(self):
+        return '<GameResult rounds={} winners={}>'.format(self.num_rounds, self.winners)
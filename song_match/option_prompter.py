@@ -5,7 +5,6 @@ from cozmo.objects import EvtObjectTapped
 from cozmo.objects import LightCubeIDs
 
 from .cube import NoteCubes
-from .cube_mat import CubeMat
 from .song_robot import SongRobot
 from .sound_effects import play_collect_point_sound
 
@@ -32,11 +31,11 @@ class OptionPrompter:
 
         await self._song_robot.say_text(prompt).wait_for_completed()
         sleep(1)
-        for i, cube_id in enumerate(LightCubeIDs):
+        for i, mat_position in enumerate(LightCubeIDs):
             prompt = options[i]
             await self._song_robot.say_text(prompt).wait_for_completed()
-            mat_position = CubeMat.cube_id_to_position(cube_id)
-            action = await self._song_robot.tap_cube(mat_position)
+            cube_id = self._song_robot.cube_mat.position_to_cube_id(mat_position)
+            action = await self._song_robot.tap_cube(cube_id)
             await action.wait_for_completed()
 
         note_cubes = NoteCubes.of(self._song_robot)
@@ -48,4 +47,4 @@ class OptionPrompter:
         play_collect_point_sound()
         await note_cubes.flash_single_cube_green(cube_id)
         await sleep(1)
-        return CubeMat.cube_id_to_position(cube_id)
+        return self._song_robot.cube_mat.cube_id_to_position(cube_id)
@@ -0,0 +1,99 @@
+"""Module containing :class:`~song_match.preloader.Preloader`."""
+
+from asyncio import AbstractEventLoop
+from asyncio import gather
+from asyncio import get_event_loop
+from concurrent.futures import Executor
+from time import monotonic
+from typing import Callable, List
+
+from .song import Song
+from .sound_effects import get_collect_point_sound
+from .sound_effects import get_level_complete_sound
+from .sound_effects import get_wrong_buzzer_sound
+
+
+class Preloader:
+    """Decodes the samples a game needs in a thread pool, off the event loop.
+
+    Start preloading with :meth:`~song_match.preloader.Preloader.start`
+    before waiting on something slow, like Cozmo finding his cubes,
+    then :meth:`~song_match.preloader.Preloader.wait` before the first round.
+    """
+
+    def __init__(self, song: Song, executor: Executor = None):
+        self._song = song
+        self._executor = executor  # None uses the loop's default thread pool
+        self._future = None
+        self._finish_times = []  # Monotonic time each job finished
+
+        self.started_at = None  # Monotonic time preloading started
+        self.wait_time = None  # Time in seconds the game waited on preloading
+
+    def start(self, loop: AbstractEventLoop = None) -> None:
+        """Start decoding the song's notes and the game sounds in a thread pool.
+
+        :param loop: The event loop to schedule the work on. Defaults to the current event loop.
+        :return: None
+        """
+        if self._future is not None:
+            raise ValueError('Preloading already started.')
+        loop = get_event_loop() if loop is None else loop
+        self.started_at = monotonic()
+        futures = [loop.run_in_executor(self._executor, self.__timed(job)) for job in self.__get_jobs()]
+        self._future = gather(*futures)
+
+    async def wait(self) -> None:
+        """Wait until every sample is decoded.
+
+        :return: None
+        """
+        if self._future is None:
+            self.start()
+        wait_started_at = monotonic()
+        await self._future
+        self.wait_time = monotonic() - wait_started_at
+
+    @property
+    def finished_at(self) -> float:
+        """Property for accessing when preloading finished.
+
+        :return: Monotonic time the last sample finished decoding, or None if not finished.
+        """
+        if not self.is_finished:
+            return None
+        return max(self._finish_times)
+
+    @property
+    def duration(self) -> float:
+        """Property for accessing how long preloading took in seconds.
+
+        :return: Time in seconds from starting to finishing preloading, or None if not finished.
+        """
+        finished_at = self.finished_at
+        if finished_at is None:
+            return None
+        return finished_at - self.started_at
+
+    @property
+    def is_finished(self) -> bool:
+        """Property for accessing whether every sample is decoded.
+
+        :return: Whether preloading finished.
+        """
+        return self._future is not None and self._future.done()
+
+    def __get_jobs(self) -> List[Callable[[], None]]:
+        return [
+            self._song.load_notes,
+            get_collect_point_sound,
+            get_level_complete_sound,
+            get_wrong_buzzer_sound
+        ]
+
+    def __timed(self, job: Callable) -> Callable[[], None]:
+        def _job():
+            job()
+            self._finish_times.append(monotonic())
+
+        return _job
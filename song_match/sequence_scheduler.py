@@ -0,0 +1,107 @@
+"""Module containing :class:`~song_match.sequence_scheduler.SequenceScheduler`."""
+
+from asyncio import AbstractEventLoop
+from asyncio import ensure_future
+from asyncio import gather
+from asyncio import get_event_loop
+from asyncio import sleep
+from typing import Awaitable, Callable, List
+
+from .song import Note
+from .tap_latency import RECEIVED
+from .tap_latency import SOUND_START
+from .tap_latency import TapTrace
+
+
+class SequenceTiming:
+    """When each note of a sequence was meant to start, and when it actually started."""
+
+    def __init__(self, notes: List[Note], target_onsets: List[float]):
+        self.notes = notes
+        self.target_onsets = target_onsets  # Loop time each note was scheduled to start
+        self.onsets = []  # Loop time each note actually started
+
+    @property
+    def onset_errors(self) -> List[float]:
+        """Property for accessing how late each note started compared to its scheduled time.
+
+        :return: Error in seconds per note played.
+        """
+        return [onset - target for onset, target in zip(self.onsets, self.target_onsets)]
+
+    @property
+    def inter_onset_errors(self) -> List[float]:
+        """Property for accessing the error of the time between each note and the note before it.
+
+        :return: Actual minus expected time between onsets in seconds, per note after the first.
+        """
+        errors = []
+        for i in range(1, len(self.onsets)):
+            actual = self.onsets[i] - self.onsets[i - 1]
+            expected = self.target_onsets[i] - self.target_onsets[i - 1]
+            errors.append(actual - expected)
+        return errors
+
+    @property
+    def max_inter_onset_error(self) -> float:
+        """Property for accessing the largest absolute inter-onset error.
+
+        :return: Error in seconds, or 0 for sequences of one note.
+        """
+        return max((abs(error) for error in self.inter_onset_errors), default=0.0)
+
+
+class SequenceScheduler:
+    """Plays a sequence of notes at absolute times computed from their durations.
+
+    Onsets are scheduled on the event loop's clock from the start of the sequence,
+    so time spent blinking cubes or waiting on actions is absorbed
+    instead of adding up over the sequence.
+    """
+
+    def __init__(self, loop: AbstractEventLoop = None):
+        self._loop = get_event_loop() if loop is None else loop
+
+    async def play(self,
+                   notes: List[Note],
+                   play_note: Callable[[Note, TapTrace], Awaitable[None]],
+                   sound_delay: float = 0.0,
+                   pipelined: bool = False) -> SequenceTiming:
+        """Play a sequence of notes on schedule, then wait until the last note's duration is up.
+
+        :param notes: The notes to play.
+        :param play_note: Coroutine function playing a note,
+                          which marks :data:`~song_match.tap_latency.SOUND_START` on the trace.
+        :param sound_delay: Time in seconds from calling ``play_note`` to the note starting.
+                            ``play_note`` is called this much early.
+        :param pipelined: Whether to call ``play_note`` for the next note on schedule,
+                          even if playing the previous note hasn't finished.
+        :return: :class:`~song_match.sequence_scheduler.SequenceTiming`
+        """
+        start = self._loop.time() + sound_delay
+        target_onsets = []
+        for note in notes:
+            target_onsets.append(start)
+            start += note.duration
+        timing = SequenceTiming(notes, target_onsets)
+
+        traces = []
+        pending = []
+        try:
+            for note, target_onset in zip(notes, target_onsets):
+                await sleep(max(target_onset - sound_delay - self._loop.time(), 0))
+                trace = TapTrace(self._loop.time)
+                traces.append(trace)
+                if pipelined:
+                    pending.append(ensure_future(play_note(note, trace), loop=self._loop))
+                else:
+                    await play_note(note, trace)
+            await gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()  # Stop notes still playing if another note failed, no-op for finished notes
+
+        # Fall back to when play_note was called if it doesn't mark when the note started
+        timing.onsets = [trace.timestamps.get(SOUND_START, trace.timestamps[RECEIVED]) for trace in traces]
+        await sleep(max(start - self._loop.time(), 0))
+        return timing
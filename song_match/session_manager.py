@@ -0,0 +1,95 @@
+"""Module containing :class:`~song_match.session_manager.SessionManager`."""
+
+from asyncio import AbstractEventLoop
+from asyncio import gather
+from asyncio import get_event_loop
+from typing import List
+
+from cozmo.robot import Robot
+
+from .game_result import GameResult
+from .song_match import SongMatch
+from .tap_latency import TapLatencyMetrics
+
+
+class Session:
+    """A game hosted by :class:`~song_match.session_manager.SessionManager`, and how it went."""
+
+    def __init__(self, name: str, song_match: SongMatch, robot: Robot):
+        self.name = name
+        self.song_match = song_match
+        self.robot = robot
+        self.started_at = None  # Loop time the game started
+        self.finished_at = None  # Loop time the game ended
+        self.result = None  # type: GameResult
+        self.error = None  # Exception that ended the game early, if any
+
+    @property
+    def is_finished(self) -> bool:
+        """Property for accessing whether the game ended."""
+        return self.finished_at is not None
+
+    @property
+    def game_time(self) -> float:
+        """Property for accessing how long the game took in seconds, or None if it didn't end."""
+        if not self.is_finished:
+            return None
+        return self.finished_at - self.started_at
+
+    @property
+    def tap_latency(self) -> TapLatencyMetrics:
+        """Property for accessing the :class:`~song_match.tap_latency.TapLatencyMetrics` of the game."""
+        return self.song_match.tap_latency
+
+    def __repr__(self):
+        return '<Session {}>'.format(self.name)
+
+
+class SessionManager:
+    """Hosts independent :class:`~song_match.song_match.SongMatch` games on one event loop,
+    one per robot, so one process can run every table in a room.
+
+    Each game keeps its own :class:`~song_match.cube_mat.CubeMat` and metrics,
+    while decoded samples are shared through :func:`~song_match.sound_effects.get_sample_cache`.
+    A game that fails ends on its own, without stopping the other games.
+    """
+
+    def __init__(self, loop: AbstractEventLoop = None):
+        self._loop = get_event_loop() if loop is None else loop
+        self.__sessions = []  # type: List[Session]
+
+    def add_session(self, song_match: SongMatch, robot: Robot, name: str = None) -> Session:
+        """Add a game to host.
+
+        :param song_match: :class:`~song_match.song_match.SongMatch` of the game.
+        :param robot: The :class:`~cozmo.robot.Robot` playing the game, connected on the manager's loop.
+        :param name: Name of the session. Defaults to ``table-<number>``.
+        :return: :class:`~song_match.session_manager.Session`
+        """
+        if name is None:
+            name = 'table-{}'.format(len(self.__sessions) + 1)
+        session = Session(name, song_match, robot)
+        self.__sessions.append(session)
+        return session
+
+    @property
+    def sessions(self) -> List[Session]:
+        """Property for accessing every :class:`~song_match.session_manager.Session`, in the order added."""
+        return list(self.__sessions)
+
+    async def run(self) -> List[Session]:
+        """Play every game at the same time, until they all end.
+
+        :return: Every :class:`~song_match.session_manager.Session`, with its outcome.
+        """
+        await gather(*[self.__run_session(session) for session in self.__sessions])
+        return self.sessions
+
+    async def __run_session(self, session: Session) -> None:
+        session.started_at = self._loop.time()
+        try:
+            session.result = await session.song_match.play(session.robot)
+        except Exception as exception:
+            session.error = exception
+        finally:
+            session.finished_at = self._loop.time()
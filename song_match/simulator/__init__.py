@@ -0,0 +1,21 @@
+"""Headless stand-ins for Cozmo and his cubes to play Song Match without hardware.
+
+* :class:`~song_match.simulator.robot.SimulatedRobot` - Stands in for :class:`~cozmo.robot.Robot`.
+* :class:`~song_match.simulator.world.SimulatedWorld` - Stands in for :class:`~cozmo.world.World`.
+* :class:`~song_match.simulator.cube.SimulatedLightCube` - Stands in for :class:`~cozmo.objects.LightCube`.
+* :class:`~song_match.simulator.players.SongPlayers` - Taps the cubes in place of the human players.
+* :class:`~song_match.simulator.run.Simulation` - Runs a program against a simulated robot.
+* :func:`~song_match.simulator.run.run_program` - Stands in for :func:`cozmo.run_program`.
+* :class:`~song_match.simulator.clock.VirtualClockEventLoop` - Event loop that skips over sleeps.
+"""
+
+from .action import ActionLatencies
+from .action import SimulatedAction
+from .clock import VirtualClockEventLoop
+from .cube import SimulatedLightCube
+from .players import SongPlayers
+from .players import get_round_positions
+from .robot import SimulatedRobot
+from .run import Simulation
+from .run import run_program
+from .world import SimulatedWorld
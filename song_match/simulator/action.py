@@ -0,0 +1,68 @@
+"""Module containing :class:`~song_match.simulator.action.SimulatedAction`."""
+
+from asyncio import AbstractEventLoop
+from asyncio import shield
+from asyncio import sleep
+
+
+class ActionLatencies:
+    """How long each kind of simulated action takes in seconds."""
+
+    def __init__(self,
+                 animation: float = 1.0,
+                 say_text: float = 1.0,
+                 turn: float = 0.5,
+                 find_cubes: float = 1.0,
+                 tap: float = 0.3):
+        self.animation = animation  # play_anim and play_anim_trigger
+        self.say_text = say_text
+        self.turn = turn  # turn_in_place
+        self.find_cubes = find_cubes  # wait_until_num_objects_visible
+        self.tap = tap  # Time for a player to tap a cube once the game waits for a tap
+
+    @classmethod
+    def instant(cls) -> 'ActionLatencies':
+        """Static factory method for latencies where every action completes immediately.
+
+        :return: :class:`~song_match.simulator.action.ActionLatencies`
+        """
+        return cls(animation=0, say_text=0, turn=0, find_cubes=0, tap=0)
+
+
+class SimulatedAction:
+    """Stands in for :class:`~cozmo.action.Action`, completing after a fixed latency.
+
+    The action starts as soon as it's created, like actions started with ``in_parallel=True``.
+    """
+
+    def __init__(self, name: str, latency: float, loop: AbstractEventLoop):
+        self.name = name
+        self.latency = latency
+        self._task = loop.create_task(sleep(latency))
+
+    @property
+    def is_completed(self) -> bool:
+        """Property for accessing whether the action completed.
+
+        :return: Whether the action completed.
+        """
+        return self._task.done()
+
+    async def wait_for_completed(self, timeout=None) -> 'SimulatedAction':
+        """Wait until the action completes.
+
+        :param timeout: Ignored. Accepted for compatibility with :meth:`~cozmo.action.Action.wait_for_completed`.
+        :return: :class:`~song_match.simulator.action.SimulatedAction`
+        """
+        await shield(self._task)
+        return self
+
+    def abort(self) -> None:
+        """Abort the action.
+
+        :return: None
+        """
+        self._task.cancel()
+
+    def __repr__(self):
+        return '<SimulatedAction {}>'.format(self.name)
@@ -0,0 +1,455 @@
+"""Batch simulator for the outcomes of many seeded games.
+
+Rather than playing each game through :class:`~song_match.song_match.SongMatch`,
+the game rules are replayed round by round over arrays of games at once,
+so hundreds of thousands of games take seconds.
+Games are split into chunks and fanned out across a process pool.
+
+Usage::
+
+    python -m song_match.simulator.batch --games 100000 --players 2 --format csv
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from csv import DictWriter
+from json import dumps
+from sys import stdout
+from typing import List, Sequence
+
+import numpy as np
+
+from song_match.game_constants import COZMO_CHANCE_FOR_ERROR
+from song_match.game_constants import COZMO_CHANCE_TO_PLAY_WRONG_NOTE
+from song_match.game_constants import FEEDBACK_MODES
+from song_match.game_constants import LIGHT_FIRST
+from song_match.game_constants import LONG_SEQUENCE_DIFFICULTY
+from song_match.game_constants import MAX_STRIKES
+from song_match.game_constants import SOUND_FIRST
+from song_match.game_constants import STARTING_POSITION
+from song_match.game_constants import TIME_IN_BETWEEN_PLAYERS_AND_COZMO
+from song_match.song import Song
+from song_match.song_registry import create_song
+from song_match.song_registry import get_song_keys
+from .action import ActionLatencies
+from .players import get_round_positions
+
+
+class DifficultySetting:
+    """The parameters that decide how hard a game is.
+
+    Defaults match the live game, see :mod:`~song_match.game_constants`.
+    """
+
+    def __init__(self,
+                 name: str,
+                 player_accuracy: float = .95,
+                 cozmo_chance_for_error: float = COZMO_CHANCE_FOR_ERROR,
+                 cozmo_chance_to_play_wrong_note: float = COZMO_CHANCE_TO_PLAY_WRONG_NOTE,
+                 long_sequence_difficulty: float = LONG_SEQUENCE_DIFFICULTY,
+                 max_strikes: int = MAX_STRIKES,
+                 starting_position: int = STARTING_POSITION):
+        self.name = name
+        self.player_accuracy = player_accuracy  # Chance a player taps each note correctly
+        self.cozmo_chance_for_error = cozmo_chance_for_error
+        self.cozmo_chance_to_play_wrong_note = cozmo_chance_to_play_wrong_note
+        self.long_sequence_difficulty = long_sequence_difficulty
+        self.max_strikes = max_strikes
+        self.starting_position = starting_position
+
+    def get_cozmo_chance_to_fail_note(self, sequence_length: int, is_sequence_long: bool) -> float:
+        """Get the chance that Cozmo plays any single note of a sequence wrong.
+
+        Mirrors :meth:`~song_match.song_robot.SongRobot.play_notes`,
+        which draws once for an error and then once more for playing the wrong note.
+
+        :param sequence_length: The length of the sequence Cozmo plays.
+        :param is_sequence_long: Whether the sequence is long.
+        :return: Probability from 0 to 1.
+        """
+        chance_for_error = min(1.0, self.cozmo_chance_for_error * sequence_length)
+        difficulty = self.cozmo_chance_to_play_wrong_note
+        if is_sequence_long:
+            difficulty *= self.long_sequence_difficulty
+        chance_to_play_wrong_note = min(1.0, difficulty * sequence_length)
+        return chance_for_error * chance_to_play_wrong_note
+
+
+#: Named difficulty settings. Normal matches the live game, and Cozmo makes mistakes more often on easy.
+DIFFICULTY_SETTINGS = {
+    'easy': DifficultySetting('easy',
+                              cozmo_chance_for_error=COZMO_CHANCE_FOR_ERROR * 2,
+                              cozmo_chance_to_play_wrong_note=COZMO_CHANCE_TO_PLAY_WRONG_NOTE * 2),
+    'normal': DifficultySetting('normal'),
+    'hard': DifficultySetting('hard',
+                              cozmo_chance_for_error=COZMO_CHANCE_FOR_ERROR / 2,
+                              cozmo_chance_to_play_wrong_note=COZMO_CHANCE_TO_PLAY_WRONG_NOTE / 2),
+}
+
+
+class TimeModel:
+    """How long each part of a game takes in seconds.
+
+    Defaults match a game against :class:`~song_match.simulator.robot.SimulatedRobot`
+    with the given :class:`~song_match.simulator.action.ActionLatencies` and feedback mode,
+    see :mod:`~song_match.cube.note_cube`.
+    """
+
+    _BLINK_DURATION = 0.125  # See NoteCube.blink_and_play_note
+    _FLASH_DURATION = 3 * 2 * 0.15  # Cubes flash 3 times with a 0.15 s delay
+    _LIGHT_CHASER_DURATION = 2 + 1  # Light chasers run for 2 s, then the round transition waits 1 s
+    _NOTE_DELAY = 0.25  # See SongRobot.play_note
+
+    def __init__(self, latencies: ActionLatencies = None, feedback_mode: str = LIGHT_FIRST):
+        if feedback_mode not in FEEDBACK_MODES:
+            raise ValueError('Invalid feedback mode {}.'.format(feedback_mode))
+        latencies = ActionLatencies() if latencies is None else latencies
+        self.setup = latencies.find_cubes
+        self.round_transition = self._LIGHT_CHASER_DURATION
+        self.sound_delay = self.__get_sound_delay(feedback_mode)
+        self.player_prompt = latencies.say_text
+        self.tap = latencies.tap
+        self.effect = max(latencies.animation, self._FLASH_DURATION)
+        self.between_players_and_cozmo = TIME_IN_BETWEEN_PLAYERS_AND_COZMO
+        self.cozmo_note = max(latencies.animation, self._NOTE_DELAY + self._BLINK_DURATION)
+        self.game_over = latencies.say_text
+
+    @classmethod
+    def __get_sound_delay(cls, feedback_mode: str) -> float:
+        """Mirrors NoteCube.get_sound_delay."""
+        if feedback_mode == SOUND_FIRST:
+            return 0.0
+        return cls._BLINK_DURATION / 2
+
+
+class SongProfile:
+    """The parts of a :class:`~song_match.song.song.Song` the batch simulator needs.
+
+    Holds no :class:`~song_match.song.note.Note` instances, so it's cheap to send to worker processes.
+    """
+
+    def __init__(self, name: str, note_durations: Sequence[float], long_marker: int, starting_position: int,
+                 round_positions: Sequence[int]):
+        self.name = name
+        self.note_durations = list(note_durations)
+        self.long_marker = long_marker
+        self.starting_position = starting_position
+        self.round_positions = list(round_positions)
+
+    @classmethod
+    def of(cls, name: str, song: Song, starting_position: int = STARTING_POSITION) -> 'SongProfile':
+        """Static factory method for creating a :class:`~song_match.simulator.batch.SongProfile`
+        from a :class:`~song_match.song.song.Song`.
+
+        :param name: Name of the song in the results.
+        :param song: :class:`~song_match.song.song.Song`
+        :param starting_position: The number of notes in the first round.
+        """
+        note_durations = [note.duration for note in song.get_sequence()]
+        round_positions = get_round_positions(song, starting_position)
+        return cls(name, note_durations, song.get_long_difficulty_marker(), starting_position, round_positions)
+
+    def get_playback_time(self, sequence_length: int, sound_delay: float) -> float:
+        """Get how long the game takes to play the first notes of the song.
+
+        Notes are played on the song's tempo by :class:`~song_match.sequence_scheduler.SequenceScheduler`.
+
+        :param sequence_length: The number of notes to play.
+        :param sound_delay: Time from blinking the first cube to its note starting.
+        :return: Time in seconds.
+        """
+        return sound_delay + sum(self.note_durations[:sequence_length])
+
+
+class BatchResult:
+    """Totals for a batch of games of one song, difficulty setting, and number of players.
+
+    Results of separate chunks of games are combined with :meth:`~song_match.simulator.batch.BatchResult.merge`.
+    """
+
+    def __init__(self, song: str, setting: str, num_players: int, num_rounds: int):
+        self.song = song
+        self.setting = setting
+        self.num_players = num_players
+        self.num_games = 0
+        self.player_wins = 0  # Number of players, summed over every game, that won
+        self.cozmo_wins = 0
+        self.total_rounds = 0
+        self.total_duration = 0.0
+        self.rounds_histogram = np.zeros(num_rounds + 1, dtype=np.int64)  # Number of games by rounds played
+        self.player_eliminations = np.zeros(num_rounds, dtype=np.int64)  # Players struck out by round
+        self.cozmo_eliminations = np.zeros(num_rounds, dtype=np.int64)
+
+    def merge(self, other: 'BatchResult') -> 'BatchResult':
+        """Add the totals of another batch of the same song, setting, and number of players.
+
+        :param other: :class:`~song_match.simulator.batch.BatchResult`
+        :return: This :class:`~song_match.simulator.batch.BatchResult`
+        """
+        self.num_games += other.num_games
+        self.player_wins += other.player_wins
+        self.cozmo_wins += other.cozmo_wins
+        self.total_rounds += other.total_rounds
+        self.total_duration += other.total_duration
+        self.rounds_histogram += other.rounds_histogram
+        self.player_eliminations += other.player_eliminations
+        self.cozmo_eliminations += other.cozmo_eliminations
+        return self
+
+    @property
+    def player_win_rate(self) -> float:
+        """Property for accessing the fraction of players that won."""
+        return self.player_wins / (self.num_games * self.num_players)
+
+    @property
+    def cozmo_win_rate(self) -> float:
+        """Property for accessing the fraction of games Cozmo won."""
+        return self.cozmo_wins / self.num_games
+
+    @property
+    def mean_rounds(self) -> float:
+        """Property for accessing the mean number of rounds played per game."""
+        return self.total_rounds / self.num_games
+
+    @property
+    def mean_duration(self) -> float:
+        """Property for accessing the mean duration of a game in seconds."""
+        return self.total_duration / self.num_games
+
+    def to_dict(self) -> dict:
+        """Convert the results to a dictionary of plain values, for writing as JSON or CSV.
+
+        :return: Dictionary of results.
+        """
+        return {
+            'song': self.song,
+            'setting': self.setting,
+            'num_players': self.num_players,
+            'num_games': self.num_games,
+            'player_win_rate': self.player_win_rate,
+            'cozmo_win_rate': self.cozmo_win_rate,
+            'mean_rounds': self.mean_rounds,
+            'mean_duration': self.mean_duration,
+            'rounds_histogram': self.rounds_histogram.tolist(),
+            'player_eliminations': self.player_eliminations.tolist(),
+            'cozmo_eliminations': self.cozmo_eliminations.tolist(),
+        }
+
+
+def simulate_games(profile: SongProfile,
+                   setting: DifficultySetting,
+                   num_players: int,
+                   num_games: int,
+                   seed: int = None,
+                   time_model: TimeModel = None) -> BatchResult:
+    """Simulate a batch of games at once, replaying the rules of :class:`~song_match.song_match.SongMatch`.
+
+    Each round, every player still in the game tries to match the notes,
+    then Cozmo does, and the game ends once as many players as there are humans have struck out.
+
+    :param profile: :class:`~song_match.simulator.batch.SongProfile`
+    :param setting: :class:`~song_match.simulator.batch.DifficultySetting`
+    :param num_players: The number of human players.
+    :param num_games: The number of games to simulate.
+    :param seed: Seed for the random number generator.
+    :param time_model: :class:`~song_match.simulator.batch.TimeModel`
+    :return: :class:`~song_match.simulator.batch.BatchResult`
+    """
+    time_model = TimeModel() if time_model is None else time_model
+    random_state = np.random.RandomState(seed)
+    max_strikes = setting.max_strikes
+    num_rounds = len(profile.round_positions)
+    result = BatchResult(profile.name, setting.name, num_players, num_rounds)
+
+    num_wrong = np.zeros((num_games, num_players), dtype=np.int64)
+    cozmo_num_wrong = np.zeros(num_games, dtype=np.int64)
+    in_game = np.ones(num_games, dtype=bool)
+    rounds = np.zeros(num_games, dtype=np.int64)
+    duration = np.full(num_games, time_model.setup)
+    player_prompt = time_model.player_prompt if num_players > 1 else 0
+
+    def is_game_over():
+        num_out_of_game = (num_wrong == max_strikes).sum(axis=1) + (cozmo_num_wrong == max_strikes)
+        return num_out_of_game >= num_players
+
+    for round_index, sequence_length in enumerate(profile.round_positions):
+        rounds[in_game] += 1
+        duration[in_game] += time_model.round_transition + profile.get_playback_time(sequence_length,
+                                                                                       time_model.sound_delay)
+        for player_index in range(num_players):
+            is_turn = in_game & (num_wrong[:, player_index] < max_strikes)
+            first_wrong = _get_first_wrong_note(random_state, 1 - setting.player_accuracy, num_games)
+            failed = is_turn & (first_wrong <= sequence_length)
+            num_taps = np.where(failed, first_wrong, sequence_length)
+            duration[is_turn] += player_prompt + num_taps[is_turn] * time_model.tap + time_model.effect
+            num_wrong[failed, player_index] += 1
+            result.player_eliminations[round_index] += np.count_nonzero(
+                failed & (num_wrong[:, player_index] == max_strikes))
+        in_game &= ~is_game_over()
+
+        duration[in_game] += time_model.between_players_and_cozmo
+        is_turn = in_game & (cozmo_num_wrong < max_strikes)
+        is_sequence_long = sequence_length > profile.long_marker
+        chance_to_fail_note = setting.get_cozmo_chance_to_fail_note(sequence_length, is_sequence_long)
+        first_wrong = _get_first_wrong_note(random_state, chance_to_fail_note, num_games)
+        failed = is_turn & (first_wrong <= sequence_length)
+        num_notes = np.where(failed, first_wrong, sequence_length)
+        duration[is_turn] += num_notes[is_turn] * time_model.cozmo_note + time_model.effect
+        cozmo_num_wrong[failed] += 1
+        result.cozmo_eliminations[round_index] += np.count_nonzero(failed & (cozmo_num_wrong == max_strikes))
+        in_game &= ~is_game_over()
+
+    song_length = len(profile.note_durations)
+    duration += time_model.game_over + profile.get_playback_time(song_length, time_model.sound_delay)
+
+    result.num_games = num_games
+    result.player_wins = int(np.count_nonzero(num_wrong < max_strikes))
+    result.cozmo_wins = int(np.count_nonzero(cozmo_num_wrong < max_strikes))
+    result.total_rounds = int(rounds.sum())
+    result.total_duration = float(duration.sum())
+    result.rounds_histogram += np.bincount(rounds, minlength=num_rounds + 1)
+    return result
+
+
+def _get_first_wrong_note(random_state: np.random.RandomState, chance_to_fail_note: float,
+                          num_games: int) -> np.ndarray:
+    """Draw the 1-based index of the first wrong note when each note fails independently."""
+    if chance_to_fail_note <= 0:
+        return np.full(num_games, np.iinfo(np.int64).max, dtype=np.int64)
+    if chance_to_fail_note >= 1:
+        return np.ones(num_games, dtype=np.int64)
+    uniform = 1 - random_state.random_sample(num_games)  # (0, 1] to avoid log(0)
+    return (np.floor(np.log(uniform) / np.log1p(-chance_to_fail_note)) + 1).astype(np.int64)
+
+
+def run_batch(profiles: List[SongProfile],
+              settings: List[DifficultySetting],
+              num_players: int = 1,
+              num_games: int = 10000,
+              seed: int = 0,
+              max_workers: int = None,
+              chunk_size: int = 10000,
+              time_model: TimeModel = None) -> List[BatchResult]:
+    """Simulate ``num_games`` games for every song and difficulty setting across a process pool.
+
+    :param profiles: A :class:`~song_match.simulator.batch.SongProfile` for each song.
+    :param settings: The :class:`~song_match.simulator.batch.DifficultySetting` instances to simulate.
+    :param num_players: The number of human players.
+    :param num_games: The number of games per song and setting.
+    :param seed: Seed the seed of every chunk of games is drawn from.
+    :param max_workers: The number of worker processes. Defaults to the number of processors.
+    :param chunk_size: The number of games each worker simulates at once.
+    :param time_model: :class:`~song_match.simulator.batch.TimeModel`
+    :return: A :class:`~song_match.simulator.batch.BatchResult` for every song and setting.
+    """
+    chunk_sizes = [chunk_size] * (num_games // chunk_size)
+    if num_games % chunk_size:
+        chunk_sizes.append(num_games % chunk_size)
+
+    seeds = np.random.RandomState(seed).randint(0, 2 ** 31 - 1, size=len(profiles) * len(settings) * len(chunk_sizes))
+    seeds = iter(seeds.tolist())
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for profile in profiles:
+            for setting in settings:
+                futures = [executor.submit(simulate_games, profile, setting, num_players, size, next(seeds),
+                                           time_model)
+                           for size in chunk_sizes]
+                results.append(futures)
+
+        merged = []
+        for futures in results:
+            batch_result = futures[0].result()
+            for future in futures[1:]:
+                batch_result.merge(future.result())
+            merged.append(batch_result)
+    return merged
+
+
+def get_song_profiles() -> List[SongProfile]:
+    """Get a :class:`~song_match.simulator.batch.SongProfile` for each song in :mod:`~song_match.song_registry`.
+
+    :return: A list of :class:`~song_match.simulator.batch.SongProfile`, named by song key.
+    """
+    return [SongProfile.of(key, create_song(key)) for key in get_song_keys()]
+
+
+def get_difficulty_settings(names: Sequence[str], player_accuracy: float = None) -> List[DifficultySetting]:
+    """Get named difficulty settings from :data:`~song_match.simulator.batch.DIFFICULTY_SETTINGS`.
+
+    :param names: The names of the settings.
+    :param player_accuracy: Chance a player taps each note correctly, overriding each setting's accuracy.
+                            The shared settings are copied rather than changed.
+    :return: A list of :class:`~song_match.simulator.batch.DifficultySetting`.
+    """
+    settings = [DIFFICULTY_SETTINGS[name] for name in names]
+    if player_accuracy is None:
+        return settings
+    overridden_settings = []
+    for setting in settings:
+        setting = copy(setting)
+        setting.player_accuracy = player_accuracy
+        overridden_settings.append(setting)
+    return overridden_settings
+
+
+def write_csv(results: List[BatchResult], file=stdout) -> None:
+    """Write results as CSV, with histograms as space separated counts.
+
+    :param results: A list of :class:`~song_match.simulator.batch.BatchResult`.
+    :param file: File to write to.
+    :return: None
+    """
+    rows = [result.to_dict() for result in results]
+    for row in rows:
+        for key, value in row.items():
+            if isinstance(value, list):
+                row[key] = ' '.join(map(str, value))
+    writer = DictWriter(file, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def write_json(results: List[BatchResult], file=stdout) -> None:
+    """Write results as a JSON list.
+
+    :param results: A list of :class:`~song_match.simulator.batch.BatchResult`.
+    :param file: File to write to.
+    :return: None
+    """
+    file.write(dumps([result.to_dict() for result in results], indent=2))
+    file.write('\n')
+
+
+def main() -> None:
+    arg_parser = ArgumentParser(description='Simulate many games of Song Match to tune difficulty.')
+    arg_parser.add_argument('-n', '--games', type=int, default=10000,
+                            help='The number of games per song and setting. Defaults to 10000.')
+    arg_parser.add_argument('-p', '--players', type=int, choices=range(1, 4), default=1,
+                            help='The number of players. Defaults to 1.')
+    arg_parser.add_argument('-a', '--accuracy', type=float, default=None,
+                            help='Chance a player taps each note correctly. Defaults to each setting\'s accuracy.')
+    arg_parser.add_argument('--settings', nargs='+', choices=list(DIFFICULTY_SETTINGS.keys()),
+                            default=list(DIFFICULTY_SETTINGS.keys()), help='The difficulty settings to simulate.')
+    arg_parser.add_argument('--seed', type=int, default=0, help='Seed for reproducible results. Defaults to 0.')
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help='The number of worker processes. Defaults to the number of processors.')
+    arg_parser.add_argument('--feedback', dest='feedback_mode', choices=FEEDBACK_MODES, default=LIGHT_FIRST,
+                            help='The feedback mode of the cubes, for game durations. Defaults to light-first.')
+    arg_parser.add_argument('--format', choices=['csv', 'json'], default='csv', help='Output format.')
+    args = arg_parser.parse_args()
+
+    settings = get_difficulty_settings(args.settings, player_accuracy=args.accuracy)
+    time_model = TimeModel(feedback_mode=args.feedback_mode)
+    results = run_batch(get_song_profiles(), settings, num_players=args.players, num_games=args.games,
+                        seed=args.seed, max_workers=args.workers, time_model=time_model)
+    if args.format == 'csv':
+        write_csv(results)
+    else:
+        write_json(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Module containing :class:`~song_match.simulator.clock.VirtualClockEventLoop`."""
+
+from asyncio import SelectorEventLoop
+from selectors import DefaultSelector
+
+
+class VirtualClockEventLoop(SelectorEventLoop):
+    """Event loop with a virtual clock that skips ahead instead of waiting.
+
+    Whenever the loop would block until its next timer, like the end of an :func:`asyncio.sleep`,
+    the clock jumps straight to that timer. Callbacks still run in the same order as in real time,
+    so a game that sleeps for minutes finishes in milliseconds.
+
+    I/O and work finished in other threads, like :func:`~asyncio.AbstractEventLoop.run_in_executor`,
+    is still picked up. The loop only truly blocks when there are no timers left to skip to.
+    """
+
+    def __init__(self):
+        super().__init__(selector=_VirtualClockSelector(self))
+        self._virtual_time = 0.0
+
+    def time(self) -> float:
+        """Get the current time of the virtual clock.
+
+        :return: Virtual time in seconds since the loop was created.
+        """
+        return self._virtual_time
+
+    @property
+    def elapsed(self) -> float:
+        """Property for accessing how much virtual time passed.
+
+        :return: Time in seconds the loop would have taken in real time.
+        """
+        return self._virtual_time
+
+    def _advance(self, seconds: float) -> None:
+        self._virtual_time += seconds
+
+
+class _VirtualClockSelector(DefaultSelector):
+    """Selector that advances the virtual clock rather than blocking for ``timeout``."""
+
+    def __init__(self, loop: VirtualClockEventLoop):
+        super().__init__()
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if timeout is None:
+            return super().select(None)  # Nothing scheduled, wait for I/O or another thread
+        events = super().select(0)
+        if not events and timeout > 0:
+            self._loop._advance(timeout)
+        return events
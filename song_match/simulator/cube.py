@@ -0,0 +1,49 @@
+"""Module containing :class:`~song_match.simulator.cube.SimulatedLightCube`."""
+
+from asyncio import AbstractEventLoop
+
+from cozmo.lights import Light
+from cozmo.lights import off_light
+from cozmo.util import Pose
+
+
+class SimulatedLightCube:
+    """Stands in for :class:`~cozmo.objects.LightCube`.
+
+    Keeps the lights last sent to each corner, and counts the light commands sent.
+    Whether the cube is visible is kept up to date by :class:`~song_match.simulator.world.SimulatedWorld`.
+    """
+
+    def __init__(self, cube_id: int, pose: Pose, loop: AbstractEventLoop):
+        self.cube_id = cube_id
+        self.pose = pose
+        self.lights = (off_light, off_light, off_light, off_light)
+        self.num_light_commands = 0
+        self.is_visible = False
+        self._loop = loop
+
+    def set_lights(self, light: Light) -> None:
+        """Set all four corners of the cube to ``light``.
+
+        :param light: :class:`~cozmo.lights.Light`
+        :return: None
+        """
+        self.set_light_corners(light, light, light, light)
+
+    def set_lights_off(self) -> None:
+        """Turn off all four corners of the cube.
+
+        :return: None
+        """
+        self.set_lights(off_light)
+
+    def set_light_corners(self, light1: Light, light2: Light, light3: Light, light4: Light) -> None:
+        """Set each corner of the cube to a separate light.
+
+        :return: None
+        """
+        self.lights = (light1, light2, light3, light4)
+        self.num_light_commands += 1
+
+    def __repr__(self):
+        return '<SimulatedLightCube {}>'.format(self.cube_id)
@@ -0,0 +1,136 @@
+"""Estimates how likely Cozmo is to get through each round of a song, without playing any games.
+
+Usage::
+
+    python -m song_match.simulator.estimator --setting normal
+"""
+
+from argparse import ArgumentParser
+
+import numpy as np
+
+from .batch import DIFFICULTY_SETTINGS
+from .batch import DifficultySetting
+from .batch import SongProfile
+from .batch import get_song_profiles
+
+
+class CozmoErrorEstimator:
+    """Computes the chance Cozmo plays each round of a song correctly, and survives a full game.
+
+    Uses the same parameters as :meth:`~song_match.song_robot.SongRobot.play_notes`
+    through :class:`~song_match.simulator.batch.DifficultySetting`.
+    Chances are computed exactly, and can be cross-checked by sampling batches of rounds.
+
+    Survival assumes Cozmo plays every round of the song,
+    in other words that the human players never end the game early.
+    """
+
+    def __init__(self, profile: SongProfile, setting: DifficultySetting = DIFFICULTY_SETTINGS['normal']):
+        self._profile = profile
+        self._setting = setting
+        self._sequence_lengths = np.array(profile.round_positions, dtype=np.int64)
+
+    @property
+    def sequence_lengths(self) -> np.ndarray:
+        """Property for accessing the number of notes Cozmo plays each round."""
+        return self._sequence_lengths
+
+    def get_note_failure_chances(self) -> np.ndarray:
+        """Get the chance Cozmo plays any single note wrong, for each round.
+
+        :return: Array of probabilities, one per round.
+        """
+        return np.array([
+            self._setting.get_cozmo_chance_to_fail_note(length, length > self._profile.long_marker)
+            for length in self._sequence_lengths
+        ])
+
+    def get_round_survival_chances(self) -> np.ndarray:
+        """Get the exact chance Cozmo plays every note of each round correctly.
+
+        :return: Array of probabilities, one per round.
+        """
+        return (1 - self.get_note_failure_chances()) ** self._sequence_lengths
+
+    def get_strike_distribution(self) -> np.ndarray:
+        """Get the exact distribution of Cozmo's strikes after each round.
+
+        Once Cozmo reaches the maximum number of strikes he stops playing,
+        so the last column only ever grows.
+
+        :return: Array of shape (rounds, max strikes + 1),
+            where element [r, k] is the chance Cozmo has k strikes after round r.
+        """
+        max_strikes = self._setting.max_strikes
+        distribution = np.zeros(max_strikes + 1)
+        distribution[0] = 1
+        rows = []
+        for survival_chance in self.get_round_survival_chances():
+            next_distribution = np.zeros_like(distribution)
+            next_distribution[:max_strikes] += distribution[:max_strikes] * survival_chance
+            next_distribution[1:] += distribution[:max_strikes] * (1 - survival_chance)
+            next_distribution[max_strikes] += distribution[max_strikes]
+            distribution = next_distribution
+            rows.append(distribution)
+        return np.array(rows)
+
+    def get_in_game_chances(self) -> np.ndarray:
+        """Get the exact chance Cozmo is still in the game after each round.
+
+        :return: Array of probabilities, one per round.
+        """
+        return 1 - self.get_strike_distribution()[:, -1]
+
+    def get_game_survival_chance(self) -> float:
+        """Get the exact chance Cozmo finishes the song without striking out.
+
+        :return: Probability from 0 to 1.
+        """
+        return float(self.get_in_game_chances()[-1])
+
+    def sample_round_survival_chances(self, num_samples: int = 100000, seed: int = None) -> np.ndarray:
+        """Estimate the chance Cozmo survives each round by sampling batches of rounds.
+
+        Each note draws once for an error and once for playing the wrong note,
+        like :meth:`~song_match.song_robot.SongRobot.play_notes`.
+
+        :param num_samples: The number of rounds to sample per round of the song.
+        :param seed: Seed for the random number generator.
+        :return: Array of estimated probabilities, one per round.
+        """
+        random_state = np.random.RandomState(seed)
+        setting = self._setting
+        chances = []
+        for length in self._sequence_lengths:
+            chance_for_error = setting.cozmo_chance_for_error * length
+            difficulty = setting.cozmo_chance_to_play_wrong_note
+            if length > self._profile.long_marker:
+                difficulty *= setting.long_sequence_difficulty
+            error = random_state.random_sample((num_samples, length)) < chance_for_error
+            wrong_note = random_state.random_sample((num_samples, length)) < difficulty * length
+            survived = ~(error & wrong_note).any(axis=1)
+            chances.append(survived.mean())
+        return np.array(chances)
+
+
+def main() -> None:
+    arg_parser = ArgumentParser(description='Print the chance Cozmo gets through each round of every song.')
+    arg_parser.add_argument('--setting', choices=list(DIFFICULTY_SETTINGS.keys()), default='normal',
+                            help='The difficulty setting. Defaults to normal.')
+    args = arg_parser.parse_args()
+
+    setting = DIFFICULTY_SETTINGS[args.setting]
+    for profile in get_song_profiles():
+        estimator = CozmoErrorEstimator(profile, setting)
+        print('{} ({}): chance Cozmo finishes the song {:.3f}'.format(
+            profile.name, setting.name, estimator.get_game_survival_chance()))
+        print('{:>6}{:>8}{:>16}{:>16}'.format('round', 'notes', 'survive round', 'still in game'))
+        rows = zip(estimator.sequence_lengths, estimator.get_round_survival_chances(), estimator.get_in_game_chances())
+        for round_number, (length, survival_chance, in_game_chance) in enumerate(rows, start=1):
+            print('{:>6}{:>8}{:>16.3f}{:>16.3f}'.format(round_number, length, survival_chance, in_game_chance))
+        print()
+
+
+if __name__ == '__main__':
+    main()
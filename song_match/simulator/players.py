@@ -0,0 +1,78 @@
+"""Module containing :class:`~song_match.simulator.players.SongPlayers`."""
+
+from random import Random
+from typing import Iterator, List
+
+from cozmo.objects import LightCubeIDs
+
+from song_match.cube_mat import CubeMat
+from song_match.game_constants import MAX_STRIKES
+from song_match.game_constants import STARTING_POSITION
+from song_match.song import Song
+
+
+class SongPlayers:
+    """Taps the cubes in place of the human players of a game.
+
+    Iterating yields the :attr:`~cozmo.objects.LightCube.cube_id` of each tap,
+    in the order :class:`~song_match.song_match.SongMatch` waits for them.
+    Each player taps the right note with a probability of ``accuracy``.
+    Cube IDs are looked up through ``cube_mat``, which should be the
+    :attr:`~song_match.song_match.SongMatch.cube_mat` of the game. Defaults to the song's own.
+    """
+
+    def __init__(self, song: Song, num_players: int, accuracy: float = 1.0, seed: int = None,
+                 select_num_players: bool = False, cube_mat: CubeMat = None):
+        self._song = song if cube_mat is None else song.with_cube_mat(cube_mat)
+        self._num_players = num_players
+        self._accuracy = accuracy
+        self._random = Random(seed)
+        self._select_num_players = select_num_players  # Whether to answer the number of players prompt
+
+    def __iter__(self) -> Iterator[int]:
+        if self._select_num_players:
+            yield self._song.cube_mat.position_to_cube_id(self._num_players)
+
+        num_wrong = [0] * self._num_players
+        for position in get_round_positions(self._song):
+            notes = self._song.get_sequence_slice(position)
+            for player_index in range(self._num_players):
+                if num_wrong[player_index] >= MAX_STRIKES:
+                    continue
+                for note in notes:
+                    cube_id = self._song.get_cube_id(note)
+                    if self._random.random() >= self._accuracy:
+                        num_wrong[player_index] += 1
+                        yield cube_id % len(LightCubeIDs) + 1
+                        break
+                    yield cube_id
+
+
+def get_round_positions(song: Song, starting_position: int = STARTING_POSITION) -> List[int]:
+    """Get the number of notes played each round of a game.
+
+    Mirrors how :class:`~song_match.song_match.SongMatch` advances through a song.
+
+    :param song: :class:`~song_match.song.song.Song`
+    :param starting_position: The number of notes in the first round.
+    :return: The position in the sequence of notes for each round.
+    """
+    positions = []
+    position = starting_position
+    played_final_round = False
+    medium, long = song.get_difficulty_markers()
+    while song.is_not_finished(position):
+        positions.append(position)
+        if position < medium:
+            position += 1
+        elif position < long:
+            position += 2
+        else:
+            position += 3
+
+        if position >= song.length and not played_final_round:
+            played_final_round = True
+            position = song.length
+        elif played_final_round:
+            position = song.length + 1
+    return positions
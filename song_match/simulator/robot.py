@@ -0,0 +1,77 @@
+"""Module containing :class:`~song_match.simulator.robot.SimulatedRobot`."""
+
+from asyncio import AbstractEventLoop
+from typing import List
+
+from cozmo.util import Angle
+from cozmo.util import Pose
+from cozmo.util import degrees
+
+from .action import ActionLatencies
+from .action import SimulatedAction
+from .world import SimulatedWorld
+
+
+class SimulatedRobot:
+    """Stands in for :class:`~cozmo.robot.Robot`.
+
+    Every action completes after the latency configured in
+    :class:`~song_match.simulator.action.ActionLatencies`.
+    Cozmo turns in place at the origin, and looks around once each turn finishes.
+    """
+
+    def __init__(self, world: SimulatedWorld, loop: AbstractEventLoop, latencies: ActionLatencies = None):
+        self.world = world
+        self.loop = loop
+        self.pose_angle = degrees(0)
+        self.actions = []  # type: List[SimulatedAction]
+        self._latencies = ActionLatencies() if latencies is None else latencies
+
+    def play_anim(self, name: str, **kwargs) -> SimulatedAction:
+        """Stands in for :meth:`~cozmo.robot.Robot.play_anim`.
+
+        :param name: The name of the animation.
+        :return: :class:`~song_match.simulator.action.SimulatedAction`
+        """
+        return self.__start_action(name, self._latencies.animation)
+
+    def play_anim_trigger(self, trigger, **kwargs) -> SimulatedAction:
+        """Stands in for :meth:`~cozmo.robot.Robot.play_anim_trigger`.
+
+        :param trigger: The animation trigger.
+        :return: :class:`~song_match.simulator.action.SimulatedAction`
+        """
+        return self.__start_action(str(trigger), self._latencies.animation)
+
+    def say_text(self, text: str, **kwargs) -> SimulatedAction:
+        """Stands in for :meth:`~cozmo.robot.Robot.say_text`.
+
+        :param text: The text to say.
+        :return: :class:`~song_match.simulator.action.SimulatedAction`
+        """
+        return self.__start_action('say_text: ' + text, self._latencies.say_text)
+
+    def turn_in_place(self, angle: Angle, is_absolute: bool = False, **kwargs) -> SimulatedAction:
+        """Stands in for :meth:`~cozmo.robot.Robot.turn_in_place`.
+
+        :param angle: The angle to turn.
+        :param is_absolute: Whether ``angle`` is an absolute heading or relative to the current heading.
+        :return: :class:`~song_match.simulator.action.SimulatedAction`
+        """
+        self.pose_angle = angle if is_absolute else self.pose_angle + angle
+        action = self.__start_action('turn_in_place: {:.0f}'.format(angle.degrees), self._latencies.turn)
+        action._task.add_done_callback(lambda task: self.world.observe(self.pose))
+        return action
+
+    @property
+    def pose(self) -> Pose:
+        """Stands in for :attr:`~cozmo.robot.Robot.pose`.
+
+        :return: :class:`~cozmo.util.Pose` at the origin, facing :attr:`pose_angle`.
+        """
+        return Pose(0, 0, 0, angle_z=self.pose_angle)
+
+    def __start_action(self, name: str, latency: float) -> SimulatedAction:
+        action = SimulatedAction(name, latency, self.loop)
+        self.actions.append(action)
+        return action
@@ -0,0 +1,94 @@
+"""Module containing :class:`~song_match.simulator.run.Simulation` and :func:`~song_match.simulator.run.run_program`."""
+
+from asyncio import Task
+from asyncio import gather
+from asyncio import new_event_loop
+from asyncio import set_event_loop
+from time import monotonic
+from typing import Callable, Iterable, Sequence
+
+from .action import ActionLatencies
+from .clock import VirtualClockEventLoop
+from .robot import SimulatedRobot
+from .world import DEFAULT_Y_POSITIONS
+from .world import SimulatedWorld
+
+try:
+    from asyncio import all_tasks
+except ImportError:  # Python < 3.7
+    all_tasks = Task.all_tasks
+
+
+class Simulation:
+    """Runs a program against a simulated robot and reports how long it took.
+
+    With ``virtual_clock`` the program runs on a
+    :class:`~song_match.simulator.clock.VirtualClockEventLoop`,
+    so sleeps and action latencies pass instantly while keeping their order.
+    """
+
+    def __init__(self,
+                 taps: Iterable[int],
+                 latencies: ActionLatencies = None,
+                 y_positions: Sequence[float] = DEFAULT_Y_POSITIONS,
+                 virtual_clock: bool = False):
+        self.loop = VirtualClockEventLoop() if virtual_clock else new_event_loop()
+        self.world = SimulatedWorld(taps, self.loop, latencies=latencies, y_positions=y_positions)
+        self.robot = SimulatedRobot(self.world, self.loop, latencies=latencies)
+        self.game_time = None  # Time in seconds the program took on the loop's clock
+        self.wall_time = None  # Time in seconds the program actually took
+        self._latencies = latencies
+
+    def add_robot(self, taps: Iterable[int], y_positions: Sequence[float] = DEFAULT_Y_POSITIONS) -> SimulatedRobot:
+        """Add another simulated robot with its own cubes, on the same loop.
+
+        For example, to host several tables with :class:`~song_match.session_manager.SessionManager`.
+
+        :param taps: Iterable of :attr:`~cozmo.objects.LightCube.cube_id` tapped on the robot's cubes.
+        :param y_positions: Distance of each cube to the left of the robot in millimeters, ordered by cube ID.
+        :return: :class:`~song_match.simulator.robot.SimulatedRobot`
+        """
+        world = SimulatedWorld(taps, self.loop, latencies=self._latencies, y_positions=y_positions)
+        return SimulatedRobot(world, self.loop, latencies=self._latencies)
+
+    def run(self, program: Callable):
+        """Run a program until it completes, then close the loop.
+
+        :param program: Coroutine function taking a robot, for example :meth:`~song_match.song_match.SongMatch.play`.
+        :return: The result of the program.
+        """
+        set_event_loop(self.loop)
+        started_at = self.loop.time()
+        wall_started_at = monotonic()
+        try:
+            return self.loop.run_until_complete(program(self.robot))
+        finally:
+            self.game_time = self.loop.time() - started_at
+            self.wall_time = monotonic() - wall_started_at
+            self.__cancel_pending_tasks()
+            set_event_loop(None)
+            self.loop.close()
+
+    def __cancel_pending_tasks(self) -> None:
+        tasks = all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(gather(*tasks, return_exceptions=True))
+
+
+def run_program(program: Callable,
+                taps: Iterable[int],
+                latencies: ActionLatencies = None,
+                y_positions: Sequence[float] = DEFAULT_Y_POSITIONS,
+                virtual_clock: bool = False):
+    """Run a program against a simulated robot. Stands in for :func:`cozmo.run_program`.
+
+    :param program: Coroutine function taking a robot, for example :meth:`~song_match.song_match.SongMatch.play`.
+    :param taps: Iterable of :attr:`~cozmo.objects.LightCube.cube_id` tapped each time the program waits for a tap.
+    :param latencies: :class:`~song_match.simulator.action.ActionLatencies`
+    :param y_positions: Distance of each cube to the left of Cozmo in millimeters, ordered by cube ID.
+    :param virtual_clock: Whether to skip over sleeps and latencies instead of waiting them out.
+    :return: The result of the program.
+    """
+    simulation = Simulation(taps, latencies=latencies, y_positions=y_positions, virtual_clock=virtual_clock)
+    return simulation.run(program)
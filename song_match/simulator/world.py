@@ -0,0 +1,179 @@
+"""Module containing :class:`~song_match.simulator.world.SimulatedWorld`."""
+
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from asyncio import ensure_future
+from asyncio import iscoroutine
+from asyncio import sleep
+from asyncio import wait_for
+from collections import defaultdict
+from typing import Dict, Iterable, Sequence
+
+from cozmo.event import Handler
+from cozmo.objects import EvtObjectObserved
+from cozmo.objects import EvtObjectTapped
+from cozmo.objects import LightCubeIDs
+from cozmo.util import Pose
+from cozmo.util import degrees
+
+from song_match.cube_search import get_relative_heading
+from .action import ActionLatencies
+from .cube import SimulatedLightCube
+
+#: Default distance of each cube to the left of Cozmo in millimeters, ordered by cube ID.
+DEFAULT_Y_POSITIONS = (0, 80, -80)
+
+#: Horizontal field of view of Cozmo's camera in degrees.
+FIELD_OF_VIEW = 58
+
+_CUBE_DISTANCE = 200  # Distance of the cubes in front of Cozmo in millimeters
+
+
+class SimulatedWorld:
+    """Stands in for :class:`~cozmo.world.World`.
+
+    Taps are drawn from ``taps``, an iterable of :attr:`~cozmo.objects.LightCube.cube_id`,
+    each time the game waits for :class:`~cozmo.objects.EvtObjectTapped`.
+
+    Cubes within :data:`FIELD_OF_VIEW` of Cozmo are visible,
+    and dispatch :class:`~cozmo.objects.EvtObjectObserved` whenever Cozmo looks around,
+    see :meth:`~song_match.simulator.world.SimulatedWorld.observe`.
+    """
+
+    def __init__(self,
+                 taps: Iterable[int],
+                 loop: AbstractEventLoop,
+                 latencies: ActionLatencies = None,
+                 y_positions: Sequence[float] = DEFAULT_Y_POSITIONS):
+        self._taps = iter(taps)
+        self._loop = loop
+        self._latencies = ActionLatencies() if latencies is None else latencies
+        self._handlers = defaultdict(list)
+        self._waiters = defaultdict(list)
+        self.light_cubes = self.__get_light_cubes(y_positions)  # type: Dict[int, SimulatedLightCube]
+        self.num_taps = 0
+        self._robot_pose = Pose(0, 0, 0, angle_z=degrees(0))  # Pose Cozmo last looked around from
+        self.observe(self._robot_pose)
+
+    def get_light_cube(self, cube_id: int) -> SimulatedLightCube:
+        """Stands in for :meth:`~cozmo.world.World.get_light_cube`.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :return: :class:`~song_match.simulator.cube.SimulatedLightCube`
+        """
+        return self.light_cubes[cube_id]
+
+    def add_event_handler(self, event, handler) -> Handler:
+        """Stands in for :meth:`~cozmo.event.Dispatcher.add_event_handler`.
+
+        :param event: The :class:`~cozmo.event.Event` class to handle.
+        :param handler: Function or coroutine function called with the event.
+        :return: :class:`~cozmo.event.Handler` to disable the handler with.
+        """
+        self._handlers[event].append(handler)
+        return Handler(self, event, handler)
+
+    def remove_event_handler(self, event, handler) -> None:
+        """Stands in for :meth:`~cozmo.event.Dispatcher.remove_event_handler`.
+
+        :param event: The :class:`~cozmo.event.Event` class the handler was added for.
+        :param handler: The handler passed to :meth:`add_event_handler`.
+        :return: None
+        """
+        self._handlers[event].remove(handler)
+
+    async def wait_for(self, event, timeout=30):
+        """Stands in for :meth:`~cozmo.event.Dispatcher.wait_for`.
+
+        Waiting for :class:`~cozmo.objects.EvtObjectTapped` taps the next cube from ``taps``.
+
+        :param event: The :class:`~cozmo.event.Event` class to wait for.
+        :param timeout: Maximum time to wait for the event. Pass None to wait indefinitely.
+        :return: The :class:`~cozmo.event.Event` instance that was dispatched.
+        """
+        future = self._loop.create_future()
+        self._waiters[event].append(future)
+        if event is EvtObjectTapped:
+            ensure_future(self.__tap_next(), loop=self._loop)
+        if timeout:
+            return await wait_for(future, timeout)
+        return await future
+
+    async def wait_until_num_objects_visible(self, num: int, object_type=None, timeout=None) -> int:
+        """Stands in for :meth:`~cozmo.world.World.wait_until_num_objects_visible`.
+
+        :param num: The number of objects to wait for.
+        :return: The number of objects seen.
+        """
+        await sleep(self._latencies.find_cubes)
+        self.observe(self._robot_pose)
+        return min(num, len(self.light_cubes))
+
+    def set_taps(self, taps: Iterable[int]) -> None:
+        """Replace the taps still to come, for example to deal the taps of the next game on the same robot.
+
+        :param taps: Iterable of :attr:`~cozmo.objects.LightCube.cube_id` tapped each time a tap is waited for.
+        :return: None
+        """
+        self._taps = iter(taps)
+
+    def tap(self, cube_id: int) -> None:
+        """Tap a cube, dispatching :class:`~cozmo.objects.EvtObjectTapped` immediately.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id` of the cube to tap.
+        :return: None
+        """
+        self.num_taps += 1
+        cube = self.light_cubes[cube_id]
+        self.dispatch_event(EvtObjectTapped(obj=cube, tap_count=1, tap_duration=0, tap_intensity=0))
+
+    def observe(self, robot_pose: Pose) -> None:
+        """Update which cubes are visible to Cozmo,
+        dispatching :class:`~cozmo.objects.EvtObjectObserved` for each visible cube.
+
+        :param robot_pose: :attr:`~song_match.simulator.robot.SimulatedRobot.pose`
+        :return: None
+        """
+        self._robot_pose = robot_pose
+        for cube in self.light_cubes.values():
+            cube.is_visible = abs(get_relative_heading(robot_pose, cube.pose)) <= FIELD_OF_VIEW / 2
+            if cube.is_visible:
+                self.dispatch_event(EvtObjectObserved(obj=cube, pose=cube.pose))
+
+    def dispatch_event(self, event) -> None:
+        """Dispatch an event to registered handlers, then to anything waiting for it.
+
+        :param event: :class:`~cozmo.event.Event` instance.
+        :return: None
+        """
+        event_class = type(event)
+        for handler in list(self._handlers[event_class]):
+            result = handler(event, **event._params())
+            if iscoroutine(result):
+                ensure_future(result, loop=self._loop)
+
+        waiters = self._waiters.pop(event_class, [])
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(event)
+
+    async def __tap_next(self) -> None:
+        await sleep(self._latencies.tap)
+        try:
+            cube_id = next(self._taps)
+        except StopIteration:
+            self.__fail_waiters(EvtObjectTapped, RuntimeError('Ran out of simulated taps.'))
+            return
+        self.tap(cube_id)
+
+    def __fail_waiters(self, event_class, exception: Exception) -> None:
+        for waiter in self._waiters.pop(event_class, []):  # type: Future
+            if not waiter.done():
+                waiter.set_exception(exception)
+
+    def __get_light_cubes(self, y_positions: Sequence[float]) -> Dict[int, SimulatedLightCube]:
+        light_cubes = {}
+        for cube_id, y in zip(LightCubeIDs, y_positions):
+            pose = Pose(_CUBE_DISTANCE, y, 0, angle_z=degrees(0))
+            light_cubes[cube_id] = SimulatedLightCube(cube_id, pose, self._loop)
+        return light_cubes
@@ -1,10 +1,12 @@
 """
 * :class:`~song_match.song.note.Note` - Represents a musical note.
 * :class:`~song_match.song.song.Song` - Represents a song.
+* :class:`~song_match.song.file_song.FileSong` - A song loaded from a song file.
 """
 
 from .song import Note
 from .song import Song
+from .file_song import FileSong
 from .songs import HotCrossBuns
 from .songs import MaryHadALittleLamb
 from .songs import RainRainGoAway
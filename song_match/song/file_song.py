@@ -0,0 +1,74 @@
+"""Module containing :class:`~song_match.song.file_song.FileSong`."""
+
+from typing import List
+
+from cozmo.lights import Color, Light
+
+from song_match.cube_mat import CubeMat
+from song_match.songbook import CACHE_DIR
+from song_match.songbook import CompiledSong
+from song_match.songbook import load_compiled_song
+from .note import EIGHTH_NOTE
+from .note import HALF_NOTE
+from .note import Note
+from .note import QUARTER_NOTE
+from .note import WHOLE_NOTE
+from .song import Song
+
+# Maps each note value of a song file to the time the note is held for
+_DURATIONS = {1: WHOLE_NOTE, 2: HALF_NOTE, 4: QUARTER_NOTE, 8: EIGHTH_NOTE}
+
+
+class FileSong(Song):
+    """A song loaded from a song file, see :mod:`~song_match.songbook`.
+
+    Notes of the sequence with the same pitch and duration share one :class:`~song_match.song.note.Note` instance.
+    """
+
+    def __init__(self, compiled_song: CompiledSong, cube_mat: CubeMat = None):
+        super(FileSong, self).__init__(cube_mat)
+        self.compiled_song = compiled_song  # type: CompiledSong
+
+    @property
+    def title(self) -> str:
+        """Property for accessing the title of the song.
+
+        :return: The title of the song.
+        """
+        return self.compiled_song.title
+
+    @property
+    def _notes(self) -> List[Note]:
+        return [Note(note) for note in self.compiled_song.notes]
+
+    @property
+    def _sequence(self) -> List[Note]:
+        notes = self.compiled_song.notes
+        shared_notes = {}
+        sequence = []
+        for pitch, note_value in zip(self.compiled_song.pitches, self.compiled_song.note_values):
+            note = shared_notes.get((pitch, note_value))
+            if note is None:
+                note = Note(notes[pitch], _DURATIONS[note_value])
+                shared_notes[(pitch, note_value)] = note
+            sequence.append(note)
+        return sequence
+
+    @property
+    def _cube_lights(self) -> List[Light]:
+        return [Light(on_color=Color(int_color=int_color)) for int_color in self.compiled_song.lights]
+
+    @property
+    def _difficulty_markers(self) -> List[int]:
+        return list(self.compiled_song.difficulty_markers)
+
+
+def load_song(path: str, cube_mat: CubeMat = None, cache_dir: str = CACHE_DIR) -> FileSong:
+    """Load a song from a song file.
+
+    :param path: Path to the song file.
+    :param cube_mat: Layout of the cubes the song is played on.
+    :param cache_dir: Directory compiled songs are cached in, see :func:`~song_match.songbook.load_compiled_song`.
+    :return: :class:`~song_match.song.file_song.FileSong`
+    """
+    return FileSong(load_compiled_song(path, cache_dir), cube_mat)
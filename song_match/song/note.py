@@ -1,7 +1,7 @@
 """Module containing :class:`~song_match.song.note.Note`."""
 
-from pygame.mixer import Sound
-
+from song_match.audio_engine import get_audio_engine
+from song_match.sound_effects import get_piano_note_sound
 from song_match.sound_effects import get_piano_note_sound_path
 
 EIGHTH_NOTE = .2  #: Time for eighth note.
@@ -13,17 +13,27 @@ WHOLE_NOTE = HALF_NOTE * 2  #: Time for whole note.
 class Note:
     """Represents a musical note."""
 
+    __slots__ = ('duration', 'note')
+
     def __init__(self, note: str, duration: int = QUARTER_NOTE):
         self.duration = duration
         self.note = note
-        self.__sound = Sound(get_piano_note_sound_path(note))
+        get_piano_note_sound_path(note)  # Raises InvalidNote for notes without a sound
+
+    def load(self) -> None:
+        """Decode the sound of the note into the sample cache, so playing it doesn't have to.
+
+        :return: None
+        """
+        get_piano_note_sound(self.note)
 
-    def play(self) -> None:
-        """Play the note.
+    def play(self, channel_index: int = None) -> None:
+        """Play the note on a note channel of the :class:`~song_match.audio_engine.AudioEngine`.
 
+        :param channel_index: Index of the note channel. Defaults to the next note channel.
         :return: None
         """
-        self.__sound.play()
+        get_audio_engine().play_note(get_piano_note_sound(self.note), channel_index)
 
     def __eq__(self, other):
         return isinstance(other, Note) and self.note == other.note
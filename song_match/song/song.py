@@ -1,6 +1,8 @@
 """Module containing :class:`~song_match.song.song.Song`."""
 
 from abc import ABC, abstractmethod
+from copy import copy
+from typing import Dict
 from typing import List
 
 from cozmo.lights import Light
@@ -20,17 +22,57 @@ class Song(ABC):
     2. ``_sequence`` - A sequence of :class:`~song_match.song.note.Note` instances that make up the song.
     3. ``_cube_lights`` - A list of 3 :class:`~cozmo.lights.Light` instances.
     4. ``_difficulty_markers`` - A list of indices where the song ramps up in difficulty.
+
+    Each abstract property is evaluated at most once per instance, on first use,
+    and the result is reused for the lifetime of the song.
+    This keeps :class:`~song_match.song.note.Note` construction off the path of every tap and round.
+
+    Cube IDs are mapped to notes through :attr:`~song_match.song.song.Song.cube_mat`,
+    the layout of the cubes in the game the song is played in.
+    Games sharing a song each play it through their own copy, see :meth:`~song_match.song.song.Song.with_cube_mat`.
     """
 
+    def __init__(self, cube_mat: CubeMat = None):
+        self.__memo = {}
+        # Layout of the cubes the song is played on. SongRobot passes its own; defaults to the class level CubeMat.
+        self.cube_mat = CubeMat.get_default() if cube_mat is None else cube_mat
+
+    def with_cube_mat(self, cube_mat: CubeMat) -> 'Song':
+        """Get a copy of the song that maps cube IDs to notes through another layout of the cubes.
+
+        The copy shares the note tables of the song, so they are still built and loaded only once.
+
+        :param cube_mat: Layout of the cubes the copy is played on.
+        :return: :class:`~song_match.song.song.Song`
+        """
+        if cube_mat is self.cube_mat:
+            return self
+        song = copy(self)
+        song.cube_mat = cube_mat
+        return song
+
+    def load_notes(self) -> None:
+        """Build the note tables of the song, and decode the sound of each note.
+
+        Safe to call from a worker thread before the game starts.
+
+        :return: None
+        """
+        self.__get_note_indices()
+        self.__get_cube_lights()
+        self.__get_difficulty_markers()
+        for note in self.__get_notes() + self.__get_sequence():
+            note.load()
+
     def get_note(self, cube_id: int) -> Note:
         """Get the :class:`~song_match.song.note.Note` for a corresponding cube.
 
         :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
         :return: The :class:`~song_match.song.note.Note` of the cube.
         """
-        mat_position = CubeMat.cube_id_to_position(cube_id)
+        mat_position = self.cube_mat.cube_id_to_position(cube_id)
         index = self._get_index(mat_position)
-        return self._notes[index]
+        return self.__get_notes()[index]
 
     def play_note(self, cube_id: int) -> None:
         """Play the note for a corresponding cube.
@@ -39,7 +81,8 @@ class Song(ABC):
         :return: None
         """
         note = self.get_note(cube_id)
-        return note.play()
+        channel_index = self.cube_mat.cube_id_to_position(cube_id) - 1  # Each cube plays on its own channel
+        return note.play(channel_index)
 
     def get_cube_light(self, cube_id: int) -> Light:
         """Get the :class:`~cozmo.lights.Light` for a corresponding cube.
@@ -48,7 +91,7 @@ class Song(ABC):
         :return: :class:`~cozmo.lights.Light` for the corresponding cube.
         """
         index = self._get_index_from_mat_position(cube_id)
-        return self._cube_lights[index]
+        return self.__get_cube_lights()[index]
 
     def get_cube_id(self, note: Note) -> int:
         """Get the Cube ID for a corresponding note.
@@ -56,15 +99,15 @@ class Song(ABC):
         :param note: The :class:`~song_match.song.note.Note` of the song.
         :return: :attr:`~cozmo.objects.LightCube.cube_id`
         """
-        cube_id = self._notes.index(note) + 1
-        return CubeMat.cube_id_to_position(cube_id)
+        mat_position = self.__get_note_indices()[note.note] + 1
+        return self.cube_mat.position_to_cube_id(mat_position)
 
     def get_sequence(self) -> List[Note]:
         """Get the sequence of notes.
 
         :return: A sequence of notes.
         """
-        return self._sequence
+        return self.__get_sequence()
 
     def get_sequence_slice(self, end: int) -> List[Note]:
         """Get a slice of the sequence up to and including end.
@@ -72,7 +115,7 @@ class Song(ABC):
         :param end: The end position of the sequence.
         :return: A sequence of notes up until a certain position.
         """
-        return self._sequence[0:end]
+        return self.__get_sequence()[0:end]
 
     def is_not_finished(self, position: int) -> bool:
         """Returns whether or not the song is finished based upon the position in the sequence.
@@ -103,14 +146,14 @@ class Song(ABC):
 
         :return: A list of difficulty markers.
         """
-        return self._difficulty_markers
+        return self.__get_difficulty_markers()
 
     def get_medium_difficulty_marker(self) -> int:
         """Get the medium difficulty length marker.
 
         :return: Medium difficulty marker.
         """
-        medium_marker, long_marker = self._difficulty_markers
+        medium_marker, long_marker = self.__get_difficulty_markers()
         return medium_marker
 
     def get_long_difficulty_marker(self) -> int:
@@ -118,7 +161,7 @@ class Song(ABC):
 
         :return: Long difficulty marker.
         """
-        medium_marker, long_marker = self._difficulty_markers
+        medium_marker, long_marker = self.__get_difficulty_markers()
         return long_marker
 
     def is_sequence_long(self, sequence_length: int) -> bool:
@@ -138,16 +181,44 @@ class Song(ABC):
 
         :return: The length of the song.
         """
-        return len(self._sequence)
+        return len(self.__get_sequence())
+
+    def __get_notes(self) -> List[Note]:
+        return self.__memoize('_notes')
+
+    def __get_note_indices(self) -> Dict[str, int]:
+        try:
+            return self.__memo['note_indices']
+        except KeyError:
+            note_indices = {note.note: i for i, note in enumerate(self.__get_notes())}
+            self.__memo['note_indices'] = note_indices
+            return note_indices
+
+    def __get_sequence(self) -> List[Note]:
+        return self.__memoize('_sequence')
+
+    def __get_cube_lights(self) -> List[Light]:
+        return self.__memoize('_cube_lights')
+
+    def __get_difficulty_markers(self) -> List[int]:
+        return self.__memoize('_difficulty_markers')
+
+    def __memoize(self, name: str):
+        """Evaluate the abstract property ``name`` once and cache the result."""
+        try:
+            return self.__memo[name]
+        except KeyError:
+            value = getattr(self, name)
+            self.__memo[name] = value
+            return value
 
     @staticmethod
     def _get_index(cube_id: int):
         return cube_id - 1
 
-    @classmethod
-    def _get_index_from_mat_position(cls, cube_id: int):
-        mat_position = CubeMat.cube_id_to_position(cube_id)
-        return cls._get_index(mat_position)
+    def _get_index_from_mat_position(self, cube_id: int):
+        mat_position = self.cube_mat.cube_id_to_position(cube_id)
+        return self._get_index(mat_position)
 
     @property
     @abstractmethod
@@ -1,7 +1,6 @@
 """Module containing :class:`~song_match.song_match.SongMatch`."""
 
 from asyncio import sleep
-from sys import exit
 from typing import Callable, List
 
 from cozmo.anim import AnimationTrigger
@@ -10,6 +9,7 @@ from cozmo.objects import LightCube
 from cozmo.robot import Robot
 
 from .config import init_mixer
+from .cube import LIGHT_FIRST
 from .cube import NoteCube
 from .cube import NoteCubes
 from .cube_mat import CubeMat
@@ -17,53 +17,121 @@ from .effect import EffectFactory
 from .game_constants import MAX_STRIKES
 from .game_constants import STARTING_POSITION
 from .game_constants import TIME_IN_BETWEEN_PLAYERS_AND_COZMO
+from .game_result import GameResult
 from .option_prompter import OptionPrompter
 from .player import Player
+from .preloader import Preloader
+from .sequence_scheduler import SequenceScheduler
+from .sequence_scheduler import SequenceTiming
 from .song import MaryHadALittleLamb
 from .song import Note
 from .song import Song
 from .song_robot import SongRobot
+from .tap_latency import NOTE_LOOKUP
+from .tap_latency import TapLatencyMetrics
+from .tap_latency import TapTrace
 
 
 class SongMatch:
     """Main game class."""
 
-    def __init__(self, song: Song = None, num_players: int = None):
-        self._song = MaryHadALittleLamb() if song is None else song
+    def __init__(self, song: Song = None, num_players: int = None, feedback_mode: str = LIGHT_FIRST,
+                 pipelined: bool = False, cube_mat: CubeMat = None):
+        # Layout of the cubes in this game. The song is played through it without being changed.
+        self.cube_mat = CubeMat() if cube_mat is None else cube_mat
+        self._song = (MaryHadALittleLamb() if song is None else song).with_cube_mat(self.cube_mat)
         self._num_players = num_players
+        self._feedback_mode = feedback_mode
+        self._pipelined = pipelined  # Whether Cozmo overlaps his tap animations, see SongRobot.play_notes
 
         self._song_robot = None
         self._note_cubes = None
         self._effect_factory = None
         self._players = None
+        self._preloader = None
+        self._tap_latency = TapLatencyMetrics()
+        self._sequence_scheduler = None
+        self._sequence_timings = []  # Timing of each sequence of notes played
+
+        self._tap_handler = None  # Handler of EvtObjectTapped, disabled when the game ends
+        self._num_rounds = 0  # Number of rounds started in the current game
+        self._started_at = None  # Loop time the current game started
 
         self._prevent_tap = True  # Flag to prevent player from interrupting game by tapping cubes
         self._played_final_round = False  # Keep track of whether the final round has been played
 
         init_mixer()
 
-    async def play(self, robot: Robot) -> None:
+    async def play(self, robot: Robot) -> GameResult:
         """Play the Song Match game.
 
         Pass this function into :func:`cozmo.run_program`.
 
+        Returns once the game is over, so the same process can go on to play another game
+        with a new :class:`~song_match.song_match.SongMatch`.
+
         :param robot: Cozmo Robot instance.
         :type robot: :class:`~cozmo.robot.Robot`
-        :return: None
+        :return: :class:`~song_match.game_result.GameResult`
         """
-        self._song_robot = SongRobot(robot, self._song)
+        self._started_at = robot.loop.time()
+        self._num_rounds = 0
+        self._played_final_round = False
+        self._song_robot = SongRobot(robot, self._song, self._feedback_mode, cube_mat=self.cube_mat)
         self._note_cubes = NoteCubes.of(self._song_robot)
         self._effect_factory = EffectFactory(self._song_robot)
-        await self.__setup()
-        await self.__init_game_loop()
+        self._preloader = Preloader(self._song)
+        self._preloader.start(robot.loop)
+        self._tap_latency = TapLatencyMetrics(clock=robot.loop.time)
+        self._sequence_scheduler = SequenceScheduler(robot.loop)
+        self._sequence_timings = []
+        try:
+            await self.__setup()
+            await self._preloader.wait()
+            self._effect_factory.prepare()
+            await self.__init_game_loop()
+            return await self.__play_end_game_results()
+        finally:
+            self.__teardown()
+
+    @property
+    def preloader(self) -> Preloader:
+        """Property for accessing the :class:`~song_match.preloader.Preloader` of the current game.
+
+        Reports how long decoding the game's samples took, and how long setup waited on it.
+        """
+        return self._preloader
+
+    @property
+    def tap_latency(self) -> TapLatencyMetrics:
+        """Property for accessing the :class:`~song_match.tap_latency.TapLatencyMetrics` of the current game.
+
+        Reports how long each tap took to be heard and seen, from the tap event arriving.
+        """
+        return self._tap_latency
+
+    @property
+    def sequence_timings(self) -> List[SequenceTiming]:
+        """Property for accessing the :class:`~song_match.sequence_scheduler.SequenceTiming`
+        of each sequence of notes played in the current game.
+
+        Reports how far each note started from the song's tempo.
+        """
+        return self._sequence_timings
 
     async def __setup(self) -> None:
         await self._song_robot.world.wait_until_num_objects_visible(3, object_type=LightCube)
-        CubeMat.order_cubes_by_position(self._song_robot)
-        self._song_robot.world.add_event_handler(EvtObjectTapped, self.__tap_handler)
+        self._song_robot.cube_mat.order_cubes_by_position(self._song_robot)
+        self._tap_handler = self._song_robot.world.add_event_handler(EvtObjectTapped, self.__tap_handler)
         self._note_cubes.turn_on_lights()
         self._players = await self.__setup_players(self._song_robot)
 
+    def __teardown(self) -> None:
+        if self._tap_handler is not None:
+            self._tap_handler.disable()
+            self._tap_handler = None
+        self._song_robot.close()
+
     async def __setup_players(self, song_robot: SongRobot) -> List[Player]:
         num_players = self._num_players
         if num_players is None:
@@ -84,43 +152,45 @@ class SongMatch:
     async def __tap_handler(self, evt, obj=None, tap_count=None, **kwargs) -> None:
         if self._prevent_tap:
             return
-        cube = evt.obj
-        note_cube = NoteCube(cube, self._song)
-        await note_cube.blink_and_play_note()
+        trace = self._tap_latency.start_trace()
+        note_cube = self._song_robot.get_note_cube(evt.obj.cube_id)
+        trace.mark(NOTE_LOOKUP)
+        await note_cube.blink_and_play_note(trace=trace)
+        self._tap_latency.record(trace)
 
     async def __init_game_loop(self) -> None:
         current_position = STARTING_POSITION
         while self._song.is_not_finished(current_position):
+            self._num_rounds += 1
             await self.__play_round_transition_effect()
 
             notes = self._song.get_sequence_slice(current_position)
             await self.__play_notes(notes)
 
             await self.__wait_for_players_to_match_notes(current_position)
+            if self.__is_game_over():
+                return
 
             await sleep(TIME_IN_BETWEEN_PLAYERS_AND_COZMO)
 
             await self.__wait_for_cozmo_to_match_notes(current_position)
-
-            await self.__check_for_game_over()
+            if self.__is_game_over():
+                return
 
             current_position = self.__update_position(current_position)
 
-        await self.__play_end_game_results()
-
     async def __wait_for_players_to_match_notes(self, current_position: int) -> None:
         for i, player in enumerate(self._players):
             if player.num_wrong < MAX_STRIKES:
                 await self.__player_turn_prompt(player)
                 await self.__wait_for_player_to_match_notes(current_position, i)
-        await self.__check_for_game_over()
 
     async def __wait_for_player_to_match_notes(self, current_position: int, player_index: int) -> None:
         num_notes_played = 0
         notes = self._song.get_sequence_slice(current_position)
         while num_notes_played != current_position:
             event = await self.__lift_tap_guard(lambda: self._song_robot.world.wait_for(EvtObjectTapped))
-            tapped_cube = NoteCube(event.obj, self._song)
+            tapped_cube = self._song_robot.get_note_cube(event.obj.cube_id)
             correct_note = notes[num_notes_played]
 
             if tapped_cube.note != correct_note:
@@ -146,7 +216,8 @@ class SongMatch:
     async def __wait_for_cozmo_to_match_notes(self, current_position: int) -> None:
         if self._song_robot.num_wrong < MAX_STRIKES:
             notes = self._song.get_sequence_slice(current_position)
-            played_correct_sequence, note = await self._song_robot.play_notes(notes, with_error=True)
+            played_correct_sequence, note = await self._song_robot.play_notes(notes, with_error=True,
+                                                                              pipelined=self._pipelined)
             if played_correct_sequence:
                 await self.__play_correct_sequence_effect(current_position, is_player=False)
             else:
@@ -154,24 +225,28 @@ class SongMatch:
                 wrong_cube_id = self._song.get_cube_id(note)
                 await self.__play_wrong_note_effect(wrong_cube_id, is_player=False)
 
-    async def __check_for_game_over(self) -> None:
+    def __is_game_over(self) -> bool:
         all_players = self._players + [self._song_robot]
         out_of_game_players = self.__get_out_of_game_players(all_players)
         num_of_players_out_of_game = len(out_of_game_players)
-        if num_of_players_out_of_game >= len(self._players):
-            await self.__play_end_game_results()
+        return num_of_players_out_of_game >= len(self._players)
 
     @staticmethod
     def __get_out_of_game_players(all_players: list) -> list:
         return [player for player in all_players if player.num_wrong == MAX_STRIKES]
 
-    async def __play_end_game_results(self) -> None:
+    async def __play_end_game_results(self) -> GameResult:
         winners = await self.__get_winners()
         animation = await self.__play_game_over_effect(winners, did_cozmo_win=self._song_robot.did_win)
         await self.__play_notes(self._song.get_sequence())
         await animation.wait_for_completed()
-        sleep(1)
-        exit(0)
+        return GameResult(players=self._players,
+                          cozmo_strikes=self._song_robot.num_wrong,
+                          did_cozmo_win=self._song_robot.did_win,
+                          num_rounds=self._num_rounds,
+                          game_time=self._song_robot.robot.loop.time() - self._started_at,
+                          tap_latency=self._tap_latency,
+                          sequence_timings=self._sequence_timings)
 
     async def __get_winners(self) -> List[Player]:
         return [player for player in self._players if player.did_win]
@@ -194,14 +269,17 @@ class SongMatch:
         return await effect.play(winners, did_cozmo_win=did_cozmo_win)
 
     async def __play_notes(self, notes: List[Note]) -> None:
-        for note in notes:
-            await self.__play_note(note)
-            await sleep(note.duration)
+        sound_delay = self.__get_note_cube(notes[0]).get_sound_delay()
+        timing = await self._sequence_scheduler.play(notes, self.__play_note, sound_delay=sound_delay)
+        self._sequence_timings.append(timing)
+
+    async def __play_note(self, note: Note, trace: TapTrace = None) -> None:
+        note_cube = self.__get_note_cube(note)
+        await note_cube.blink_and_play_note(trace=trace)
 
-    async def __play_note(self, note: Note) -> None:
+    def __get_note_cube(self, note: Note) -> NoteCube:
         cube_id = self._song.get_cube_id(note)
-        note_cube = NoteCube.of(self._song_robot, cube_id)
-        await note_cube.blink_and_play_note()
+        return self._song_robot.get_note_cube(cube_id)
 
     def __update_position(self, current_position: int) -> int:
         current_position = self.__increment_current_position(current_position)
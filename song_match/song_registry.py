@@ -0,0 +1,120 @@
+"""Registry mapping song keys to :class:`~song_match.song.song.Song` subclasses.
+
+Songs are registered by the module and name of their class, without importing it,
+so listing the songs, like when parsing arguments, loads neither cozmo nor pygame.
+Only the song that gets played is imported and instantiated, see :func:`create_song`.
+
+Songs can also be registered from song files, see :func:`register_song_file` and :func:`load_songbook`.
+Song files are compiled when they're registered, see :mod:`~song_match.songbook`.
+"""
+
+import os
+from collections import OrderedDict
+from importlib import import_module
+from typing import Dict, List, Tuple, Type
+
+from song_match.exceptions import DuplicateSongKey
+from song_match.exceptions import InvalidSongKey
+from song_match.songbook import CACHE_DIR
+from song_match.songbook import is_song_file
+from song_match.songbook import load_compiled_song
+
+# Maps each song key to its title, the module and name of its class, and the arguments to instantiate it with
+__songs = OrderedDict()  # type: Dict[str, Tuple[str, str, str, tuple]]
+
+
+def register_song(key: str, title: str, module_name: str, class_name: str) -> None:
+    """Register a song under a key.
+
+    :param key: Short name of the song. For example, ``'hcb'``.
+    :param title: Title of the song. For example, ``'Hot Cross Buns'``.
+    :param module_name: Absolute name of the module the song's class is defined in.
+    :param class_name: Name of the song's :class:`~song_match.song.song.Song` subclass.
+    :return: None
+    """
+    __register(key, (title, module_name, class_name, ()))
+
+
+def register_song_file(key: str, path: str, cache_dir: str = CACHE_DIR) -> None:
+    """Compile a song file, and register it under a key.
+
+    :param key: Short name of the song. For example, ``'hcb'``.
+    :param path: Path to the song file.
+    :param cache_dir: Directory compiled songs are cached in, see :func:`~song_match.songbook.load_compiled_song`.
+    :return: None
+    """
+    compiled_song = load_compiled_song(path, cache_dir)
+    __register(key, (compiled_song.title, 'song_match.song.file_song', 'FileSong', (compiled_song,)))
+
+
+def load_songbook(directory: str, cache_dir: str = CACHE_DIR) -> List[str]:
+    """Register every song file in a directory, each under the name of its file without the extension.
+
+    :param directory: Path to the directory.
+    :param cache_dir: Directory compiled songs are cached in, see :func:`~song_match.songbook.load_compiled_song`.
+    :return: List of the registered song keys, in alphabetical order.
+    """
+    keys = []
+    for file_name in sorted(os.listdir(directory)):
+        if is_song_file(file_name):
+            key = os.path.splitext(file_name)[0]
+            register_song_file(key, os.path.join(directory, file_name), cache_dir)
+            keys.append(key)
+    return keys
+
+
+def get_song_keys() -> List[str]:
+    """Get every registered song key.
+
+    :return: List of song keys in the order they were registered.
+    """
+    return list(__songs.keys())
+
+
+def get_song_title(key: str) -> str:
+    """Get the title of the song registered under a key.
+
+    :param key: Short name of the song. For example, ``'hcb'``.
+    :return: The title of the song.
+    """
+    title, _, _, _ = __get_song(key)
+    return title
+
+
+def get_song_class(key: str) -> Type:
+    """Import the class of the song registered under a key.
+
+    :param key: Short name of the song. For example, ``'hcb'``.
+    :return: Subclass of :class:`~song_match.song.song.Song`.
+    """
+    _, module_name, class_name, _ = __get_song(key)
+    return getattr(import_module(module_name), class_name)
+
+
+def create_song(key: str):
+    """Import and instantiate the song registered under a key.
+
+    :param key: Short name of the song. For example, ``'hcb'``.
+    :return: :class:`~song_match.song.song.Song`
+    """
+    _, _, _, args = __get_song(key)
+    return get_song_class(key)(*args)
+
+
+def __register(key: str, song: Tuple[str, str, str, tuple]) -> None:
+    registered_song = __songs.get(key)
+    if registered_song is not None and registered_song != song:
+        raise DuplicateSongKey(key)
+    __songs[key] = song
+
+
+def __get_song(key: str) -> Tuple[str, str, str, tuple]:
+    song = __songs.get(key)
+    if song is None:
+        raise InvalidSongKey(key)
+    return song
+
+
+register_song('hcb', 'Hot Cross Buns', 'song_match.song.songs.hot_cross_buns', 'HotCrossBuns')
+register_song('mhall', 'Mary Had A Little Lamb', 'song_match.song.songs.mary_had_a_little_lamb', 'MaryHadALittleLamb')
+register_song('rrga', 'Rain Rain Go Away', 'song_match.song.songs.rain_rain_go_away', 'RainRainGoAway')
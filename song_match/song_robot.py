@@ -1,12 +1,16 @@
 """Module containing :class:`~song_match.song_robot.SongRobot`."""
 
-from asyncio import TimeoutError
+from asyncio import AbstractEventLoop
+from asyncio import FIRST_COMPLETED
+from asyncio import ensure_future
 from asyncio import sleep
+from asyncio import wait
 from random import random
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 from cozmo.anim import Animation
 from cozmo.anim import AnimationTrigger
+from cozmo.objects import EvtObjectObserved
 from cozmo.objects import LightCube1Id, LightCube2Id, LightCube3Id
 from cozmo.objects import LightCubeIDs
 from cozmo.robot import Robot, world
@@ -14,9 +18,26 @@ from cozmo.robot import SayText
 from cozmo.util import degrees
 
 from song_match.cube_mat import CubeMat
+from .cube import LIGHT_FIRST
 from .cube import NoteCube
+from .cube import NoteCubes
+from .cube.light_animator import LightAnimator
+from .cube.light_buffer import LightBuffer
+from .cube.util import get_light_cube
+from .cube.util import get_light_cubes
+from .cube_pose_cache import CubePoseCache
+from .cube_search import CubeSearchMetrics
+from .cube_search import get_heading
+from .cube_search import get_relative_heading
+from .cube_search import get_search_turns
+from .game_constants import COZMO_CHANCE_FOR_ERROR
+from .game_constants import COZMO_CHANCE_TO_PLAY_WRONG_NOTE
+from .game_constants import LONG_SEQUENCE_DIFFICULTY
 from .game_constants import MAX_STRIKES
+from .sequence_scheduler import SequenceScheduler
+from .sequence_scheduler import SequenceTiming
 from .song import Song, Note
+from .tap_latency import TapTrace
 
 
 class SongRobot:
@@ -24,22 +45,62 @@ class SongRobot:
 
     _NOTE_DELAY = 0.25  # Time to delay blinking the cube and playing the note
     _SLEEP_TIME = 0.1  # Time to sleep for while animation finishes
+    _OBSERVE_TIME = 0.1  # Time to look for a cube after each turn while searching for it
 
-    def __init__(self, robot: Robot, song: Song):
+    def __init__(self, robot: Robot, song: Song, feedback_mode: str = LIGHT_FIRST, cube_mat: CubeMat = None):
         self._robot = robot
-        self._song = song
+        # Layout of this robot's cubes. Defaults to the class level CubeMat.
+        self.cube_mat = CubeMat.get_default() if cube_mat is None else cube_mat
+        # The song played on this robot's layout, leaving the given song untouched for other games
+        self._song = song if song is None else song.with_cube_mat(self.cube_mat)
+        # Maps (cube_id, prev_cube_id) to a tap animation. Rebuilt whenever this robot's cubes are ordered.
+        self._tap_animation_lookup = None  # type: Dict[Tuple[int, int], str]
+        if self.cube_mat.get_positions() is not None:
+            self._on_cube_order_changed(self.cube_mat.get_positions())
+        self.cube_mat.add_order_listener(self._on_cube_order_changed)
+        self.feedback_mode = feedback_mode  # How cubes blink and play notes, see song_match.cube.note_cube
         self._prev_cube_id = None  # Keep track of previously tapped cube
         self._initial_angle = robot.pose_angle
         self.num_wrong = 0  # Keep track of the number of wrong notes Cozmo taps
+        self.sequence_timings = []  # type: List[SequenceTiming]
+        self._sequence_scheduler = None
+        self._prev_action = None  # Tap animation of the previous pipelined note
+        self._prev_contact = None  # Future done once the previous pipelined tap reaches the cube
+        self.light_buffer = LightBuffer(robot.loop)  # Coalesces the light commands of every note cube
+        self.light_animator = LightAnimator(robot.loop)  # Plays the light patterns of every note cube
+        self._note_cube_map = {}  # type: Dict[int, NoteCube]
+        self._note_cubes = None
+        self.cube_search_metrics = CubeSearchMetrics()  # Time and turns taken by each turn_to_cube
+        self.cube_poses = CubePoseCache(robot.loop.time)  # Where each cube was last observed
+        self._observed_handler = self.world.add_event_handler(EvtObjectObserved, self.cube_poses.on_object_observed)
+
+    def close(self) -> None:
+        """Stop listening to the robot's world and cube mat, once the game is over.
+
+        Lets the next game on the same robot start with a new :class:`~song_match.song_robot.SongRobot`.
 
-    async def play_notes(self, notes: List[Note], with_error=False) -> Tuple[bool, Union[None, Note]]:
+        :return: None
+        """
+        self._observed_handler.disable()
+        self.cube_mat.remove_order_listener(self._on_cube_order_changed)
+
+    async def play_notes(self, notes: List[Note], with_error=False,
+                         pipelined=False) -> Tuple[bool, Union[None, Note]]:
         """Make Cozmo play a series of notes.
 
+        By default Cozmo finishes each tap animation before starting the next one.
+        When pipelined, each tap animation starts as soon as the previous tap reaches its cube,
+        and the notes play on the song's tempo,
+        with their timing recorded in :attr:`~song_match.song_robot.SongRobot.sequence_timings`.
+
         :param notes: The series of notes to play.
         :param with_error: Whether to play the series of notes with a chance for error.
+        :param pipelined: Whether to overlap each tap animation with the next tap.
         :return: Whether cozmo played the correct notes and the incorrect note he played if any.
         :rtype: Tuple[bool, Union[None, Note]]
         """
+        if pipelined:
+            return await self.__play_notes_pipelined(notes, with_error)
         for note in notes:
             sequence_length = len(notes)
             error = self.__get_chance_for_error(sequence_length)
@@ -58,7 +119,7 @@ class SongRobot:
         :return: None
         """
         cube_id = self._song.get_cube_id(note)
-        note_cube = NoteCube.of(self, cube_id)
+        note_cube = self.get_note_cube(cube_id)
         action = await self.tap_cube(cube_id)
         await sleep(self._NOTE_DELAY)
         await note_cube.blink_and_play_note()
@@ -88,51 +149,174 @@ class SongRobot:
 
         return played_correct_note, self._song.get_note(cube_id)
 
+    async def __play_notes_pipelined(self, notes: List[Note], with_error: bool) -> Tuple[bool, Union[None, Note]]:
+        notes_to_play, wrong_note = self.__get_notes_to_play(notes, with_error)
+        if self._sequence_scheduler is None:
+            self._sequence_scheduler = SequenceScheduler(self._robot.loop)
+        note_cube = self.get_note_cube(self._song.get_cube_id(notes_to_play[0]))
+        sound_delay = self._NOTE_DELAY + note_cube.get_sound_delay()
+        timing = await self._sequence_scheduler.play(notes_to_play, self.__play_note_pipelined,
+                                                     sound_delay=sound_delay, pipelined=True)
+        self.sequence_timings.append(timing)
+        await self._prev_action.wait_for_completed()
+        self._prev_action = None
+        self._prev_contact = None
+        return wrong_note is None, wrong_note
+
+    async def __play_note_pipelined(self, note: Note, trace: TapTrace) -> None:
+        prev_action = self._prev_action
+        prev_contact = self._prev_contact
+        contact = self._robot.loop.create_future()
+        self._prev_contact = contact
+        try:
+            if prev_contact is not None:
+                await prev_contact  # Cozmo can't start the next tap before the previous one lands
+            if prev_action is not None and not prev_action.is_completed:
+                prev_action.abort()  # Skip the rest of the previous tap's follow through
+
+            cube_id = self._song.get_cube_id(note)
+            note_cube = self.get_note_cube(cube_id)
+            self._prev_action = await self.tap_cube(cube_id)
+            await sleep(self._NOTE_DELAY)
+            contact.set_result(None)
+        finally:
+            if not contact.done():
+                contact.cancel()  # The tap never landed, so the next note can't follow it
+        await note_cube.blink_and_play_note(trace=trace)
+
+    def __get_notes_to_play(self, notes: List[Note], with_error: bool) -> Tuple[List[Note], Union[None, Note]]:
+        """Decide up front which notes Cozmo plays,
+        with the same chances as :meth:`~song_match.song_robot.SongRobot.play_notes`.
+
+        :return: The notes to play, ending with the wrong note if Cozmo plays one, and the wrong note if any.
+        """
+        notes_to_play = []
+        sequence_length = len(notes)
+        for note in notes:
+            error = self.__get_chance_for_error(sequence_length)
+            if with_error and error and self.__get_chance_to_play_wrong_note(sequence_length):
+                cube_id = self._song.get_cube_id(note) % len(LightCubeIDs) + 1
+                wrong_note = self._song.get_note(cube_id)
+                notes_to_play.append(wrong_note)
+                return notes_to_play, wrong_note
+            notes_to_play.append(note)
+        return notes_to_play, None
+
     def __get_chance_to_play_wrong_note(self, sequence_length: int) -> bool:
-        difficulty = 0.1
+        difficulty = COZMO_CHANCE_TO_PLAY_WRONG_NOTE
         if self._song.is_sequence_long(sequence_length):
-            difficulty *= 1.5
+            difficulty *= LONG_SEQUENCE_DIFFICULTY
         error = self.__get_chance_for_error(sequence_length, difficulty=difficulty)
         return error
 
     @staticmethod
-    def __get_chance_for_error(sequence_length: int, difficulty: float = .01) -> bool:
+    def __get_chance_for_error(sequence_length: int, difficulty: float = COZMO_CHANCE_FOR_ERROR) -> bool:
         return random() < (difficulty * sequence_length)
 
     async def turn_back_to_center(self, in_parallel=False) -> None:
         """Turn Cozmo back to the center.
 
+        Cozmo faces the middle cube if its pose in
+        :attr:`~song_match.song_robot.SongRobot.cube_poses` is fresh,
+        or else the direction he was facing when the game started.
+
         :param in_parallel: Whether to do the action in parallel or wait until it's completed.
         :return: None
         """
-        if in_parallel:
-            self._robot.turn_in_place(self._initial_angle, is_absolute=True)
-        else:
-            await self._robot.turn_in_place(self._initial_angle, is_absolute=True).wait_for_completed()
-        self._prev_cube_id = self.__get_middle_cube_id()
+        middle_cube_id = self.__get_middle_cube_id()
+        pose = self.cube_poses.get_fresh_pose(middle_cube_id)
+        angle = self._initial_angle if pose is None else degrees(get_heading(self._robot.pose, pose))
+        action = self._robot.turn_in_place(angle, is_absolute=True)
+        if not in_parallel:
+            await action.wait_for_completed()
+        self._prev_cube_id = middle_cube_id
+
+    async def face_cube(self, cube_id: int) -> None:
+        """Make Cozmo face a cube with one absolute turn to its pose in
+        :attr:`~song_match.song_robot.SongRobot.cube_poses`.
+
+        If the pose is stale, Cozmo looks for the cube with
+        :meth:`~song_match.song_robot.SongRobot.turn_to_cube` instead, which observes it again.
+
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id` to face.
+        :return: None
+        """
+        pose = self.cube_poses.get_fresh_pose(cube_id)
+        if pose is None:
+            return await self.turn_to_cube(cube_id)
+        heading = degrees(get_heading(self._robot.pose, pose))
+        await self._robot.turn_in_place(heading, is_absolute=True).wait_for_completed()
 
     async def turn_to_cube(self, cube_id: int) -> None:
         """Make Cozmo turn in place until the specified cube is visible.
 
+        Cozmo first turns straight to where the cube was last observed,
+        or where it was when the cubes were ordered by position,
+        then keeps turning the same way in steps.
+        He stops as soon as he observes the cube, even partway through a turn.
+
+        The time and turns taken are recorded in
+        :attr:`~song_match.song_robot.SongRobot.cube_search_metrics`.
+
         :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id` to turn to.
         :return: None
         """
-        timeout = 0.1
-        try:
-            cube = await self.world.wait_for_observed_light_cube(timeout=timeout)
-        except TimeoutError:
-            cube = None  # Didn't find cube
+        loop = self._robot.loop
+        started_at = loop.time()
+        num_turns = 0
+        observed = loop.create_future()
 
-        while cube is None or cube.cube_id != cube_id:
-            await self._robot.turn_in_place(degrees(30)).wait_for_completed()
+        def on_object_observed(evt, **kwargs):
+            if getattr(evt.obj, 'cube_id', None) == cube_id and not observed.done():
+                observed.set_result(evt.obj)
 
-            try:
-                cube = await self.world.wait_for_observed_light_cube(timeout=timeout)
-            except TimeoutError:
-                cube = None  # Didn't find cube
+        handler = self.world.add_event_handler(EvtObjectObserved, on_object_observed)
+        try:
+            if not get_light_cube(self, cube_id).is_visible:
+                for angle in self.__get_search_turns(cube_id):
+                    num_turns += 1
+                    action = self._robot.turn_in_place(angle)
+                    turned = ensure_future(action.wait_for_completed(), loop=loop)
+                    await wait([observed, turned], return_when=FIRST_COMPLETED)
+                    if not observed.done():
+                        await wait([observed], timeout=self._OBSERVE_TIME)
+                    if observed.done():
+                        if not action.is_completed:
+                            action.abort()
+                        break
+        finally:
+            handler.disable()
+            self.cube_search_metrics.record(loop.time() - started_at, num_turns)
+
+    def __get_search_turns(self, cube_id: int):
+        pose = self.cube_poses.get_pose(cube_id) or self.cube_mat.get_pose(cube_id)
+        if pose is None:
+            return get_search_turns()
+        return get_search_turns(get_relative_heading(self._robot.pose, pose))
+
+    def get_note_cube(self, cube_id: int) -> NoteCube:
+        """Get the :class:`~song_match.cube.note_cube.NoteCube` of a cube.
+
+        Each cube has one :class:`~song_match.cube.note_cube.NoteCube`, created the first time it's needed.
 
-            if cube is not None and cube.cube_id == cube_id:
-                break
+        :param cube_id: :attr:`~cozmo.objects.LightCube.cube_id`
+        :return: :class:`~song_match.cube.note_cube.NoteCube`
+        """
+        note_cube = self._note_cube_map.get(cube_id)
+        if note_cube is None:
+            cube = get_light_cube(self, cube_id)
+            note_cube = NoteCube(cube, self._song, self.feedback_mode, self.light_buffer, self.light_animator,
+                                 self.loop)
+            self._note_cube_map[cube_id] = note_cube
+        return note_cube
+
+    @property
+    def note_cubes(self) -> NoteCubes:
+        """Property for accessing the :class:`~song_match.cube.note_cubes.NoteCubes` of every cube."""
+        if self._note_cubes is None:
+            note_cubes = [self.get_note_cube(cube.cube_id) for cube in get_light_cubes(self)]
+            self._note_cubes = NoteCubes(note_cubes, self._song)
+        return self._note_cubes
 
     @property
     def did_win(self) -> bool:
@@ -147,6 +331,11 @@ class SongRobot:
         """Property for accessing :attr:`~cozmo.robot.Robot.world`."""
         return self._robot.world
 
+    @property
+    def loop(self) -> AbstractEventLoop:
+        """Property for accessing the event loop of :class:`~cozmo.robot.Robot`."""
+        return self._robot.loop
+
     @property
     def robot(self) -> Robot:
         """Property for accessing :class:`~cozmo.robot.Robot`."""
@@ -169,19 +358,20 @@ class SongRobot:
         self._prev_cube_id = cube_id
         return await self.play_anim(animation, in_parallel=True)
 
-    @staticmethod
-    def __get_middle_cube_id() -> int:
-        mat_positions = CubeMat.get_positions()
+    def __get_middle_cube_id(self) -> int:
+        mat_positions = self.cube_mat.get_positions()
         return mat_positions[1]
 
     def __get_tap_animation(self, cube_id) -> str:
         """Returns a tap animation based upon the current and previously tapped cubes."""
-        animation_lookup = self.__get_tap_animation_lookup()
         key = (cube_id, self._prev_cube_id)
-        return animation_lookup[key]
+        return self._tap_animation_lookup[key]
+
+    def _on_cube_order_changed(self, mat_positions: Tuple[int, ...]) -> None:
+        self._tap_animation_lookup = self._build_tap_animation_lookup(mat_positions)
 
     @staticmethod
-    def __get_tap_animation_lookup() -> dict:
+    def _build_tap_animation_lookup(mat_positions: Tuple[int, ...]) -> dict:
         """Build a tap animation lookup dictionary.
 
         The key is (cube_id, prev_cube_id),
@@ -195,10 +385,9 @@ class SongRobot:
         4. small left
         5. big left
 
+        :param mat_positions: See :meth:`~song_match.cube_mat.CubeMat.get_positions`.
         :return: The animation to tap the cube.
         """
-        mat_positions = CubeMat.get_positions()
-
         # Build center animations
         keys = [(LightCube1Id, LightCube1Id),
                 (LightCube2Id, LightCube2Id),
@@ -0,0 +1,296 @@
+"""Module to compile song files into :class:`~song_match.songbook.CompiledSong` instances, and cache them.
+
+A song file is a JSON object like::
+
+    {
+        "title": "Hot Cross Buns",
+        "notes": ["G3", "A3", "B3"],
+        "lights": ["#ff00ff", "#0000ff", "#00ffbe"],
+        "difficulty_markers": [5, 11],
+        "sequence": "B3 A3 G3/2 B3 A3 G3/2 G3/8 G3/8 G3/8 G3/8 A3/8 A3/8 A3/8 A3/8 B3 A3 G3/2"
+    }
+
+* ``notes`` - The 3 notes of the cubes, in ascending order by pitch.
+* ``lights`` - The color of each cube's light, as ``#rrggbb``.
+* ``difficulty_markers`` - The medium and long difficulty markers,
+  see :meth:`~song_match.song.song.Song.get_difficulty_markers`.
+* ``sequence`` - The notes of the song separated by spaces. Each note can end with its duration:
+  ``/1`` for a whole note, ``/2`` half, ``/4`` quarter, or ``/8`` eighth. Defaults to a quarter note.
+
+Compiling validates the file once. The compiled song is cached in :data:`CACHE_DIR`
+under a hash of the file, so loading a songbook again skips parsing and validating every file,
+until a file changes. Songs bundled with the package are only kept in memory,
+see :func:`~song_match.songbook.load_bundled_song`.
+
+Loads neither cozmo nor pygame, see :class:`~song_match.song.file_song.FileSong` to play a compiled song.
+"""
+
+import json
+import marshal
+import os
+import re
+from hashlib import sha256
+from typing import Dict, Sequence, Tuple
+
+from song_match.exceptions import InvalidSongFile
+
+#: Extension of song files.
+SONG_FILE_EXTENSION = '.json'
+
+#: Directory compiled songs are cached in.
+#: Override per deployment with the ``SONG_MATCH_SONG_CACHE`` environment variable.
+CACHE_DIR = os.environ.get('SONG_MATCH_SONG_CACHE',
+                           os.path.join(os.path.expanduser('~'), '.cache', 'song_match', 'songs'))
+
+#: Note values a duration can be written as, like ``/8`` for an eighth note.
+NOTE_VALUES = (1, 2, 4, 8)
+
+#: Note value of notes written without a duration.
+DEFAULT_NOTE_VALUE = 4
+
+# Bump whenever CompiledSong or compiling changes, so older cached songs are compiled again
+_COMPILER_VERSION = 1
+
+_PIANO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sound_effects', 'piano')
+_NOTE_PATTERN = re.compile(r'^(?P<note>[A-G]#?[0-9])(?:/(?P<value>[0-9]+))?$')
+_COLOR_PATTERN = re.compile(r'^#[0-9a-fA-F]{6}$')
+
+# Maps the path of each bundled song file to its compiled song
+__bundled_songs = {}  # type: Dict[str, CompiledSong]
+
+
+class CompiledSong:
+    """A validated song file, in the compact and immutable form cached on disk.
+
+    The sequence is held in two byte strings, one byte per note:
+    the index of the note in :attr:`~song_match.songbook.CompiledSong.notes`, and its note value.
+    """
+
+    __slots__ = ('__title', '__notes', '__lights', '__difficulty_markers', '__pitches', '__note_values')
+
+    def __init__(self, title: str, notes: Sequence[str], lights: Sequence[int], difficulty_markers: Sequence[int],
+                 pitches: bytes, note_values: bytes):
+        self.__title = title
+        self.__notes = tuple(notes)
+        self.__lights = tuple(lights)
+        self.__difficulty_markers = tuple(difficulty_markers)
+        self.__pitches = bytes(pitches)
+        self.__note_values = bytes(note_values)
+
+    @property
+    def title(self) -> str:
+        """Property for accessing the title of the song."""
+        return self.__title
+
+    @property
+    def notes(self) -> Tuple[str, ...]:
+        """Property for accessing the names of the 3 notes, in ascending order by pitch."""
+        return self.__notes
+
+    @property
+    def lights(self) -> Tuple[int, ...]:
+        """Property for accessing the color of each cube's light, as :attr:`~cozmo.lights.Color.int_color`."""
+        return self.__lights
+
+    @property
+    def difficulty_markers(self) -> Tuple[int, ...]:
+        """Property for accessing the medium and long difficulty markers."""
+        return self.__difficulty_markers
+
+    @property
+    def pitches(self) -> bytes:
+        """Property for accessing the index in :attr:`~song_match.songbook.CompiledSong.notes`
+        of each note in the sequence."""
+        return self.__pitches
+
+    @property
+    def note_values(self) -> bytes:
+        """Property for accessing the note value of each note in the sequence. For example, 8 for an eighth note."""
+        return self.__note_values
+
+    def to_bytes(self) -> bytes:
+        """Serialize the song, to cache it.
+
+        :return: The serialized song.
+        """
+        return marshal.dumps((self.__title, self.__notes, self.__lights, self.__difficulty_markers,
+                              self.__pitches, self.__note_values))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompiledSong':
+        """Deserialize a song serialized with :meth:`~song_match.songbook.CompiledSong.to_bytes`.
+
+        :param data: The serialized song.
+        :return: :class:`~song_match.songbook.CompiledSong`
+        """
+        return cls(*marshal.loads(data))
+
+    def __len__(self) -> int:
+        return len(self.__pitches)
+
+    def __eq__(self, other):
+        return isinstance(other, CompiledSong) and self.to_bytes() == other.to_bytes()
+
+    def __hash__(self):
+        return hash(self.to_bytes())
+
+    def __repr__(self):
+        return '<CompiledSong {!r}>'.format(self.__title)
+
+
+def compile_song_file(path: str) -> CompiledSong:
+    """Read and validate a song file, without the cache.
+
+    :param path: Path to the song file.
+    :return: :class:`~song_match.songbook.CompiledSong`
+    """
+    with open(path, 'rb') as file:
+        return compile_song(file.read(), path)
+
+
+def compile_song(data: bytes, path: str = '<song>') -> CompiledSong:
+    """Validate the contents of a song file.
+
+    :param data: Contents of the song file.
+    :param path: Path to the song file, for error messages.
+    :return: :class:`~song_match.songbook.CompiledSong`
+    """
+    try:
+        song = json.loads(data.decode('utf-8'))
+    except ValueError as error:
+        raise InvalidSongFile(path, 'Not JSON, {}.'.format(error))
+    if not isinstance(song, dict):
+        raise InvalidSongFile(path, 'Expected a JSON object.')
+
+    title = __get_field(song, 'title', str, path)
+    notes = __get_notes(__get_field(song, 'notes', list, path), path)
+    lights = __get_lights(__get_field(song, 'lights', list, path), path)
+    pitches, note_values = __get_sequence(__get_field(song, 'sequence', str, path), notes, path)
+    difficulty_markers = __get_difficulty_markers(__get_field(song, 'difficulty_markers', list, path),
+                                                  len(pitches), path)
+    return CompiledSong(title, notes, lights, difficulty_markers, pitches, note_values)
+
+
+def load_compiled_song(path: str, cache_dir: str = CACHE_DIR) -> CompiledSong:
+    """Load a song file, from the cache if it was compiled before.
+
+    Songs compiled for the first time are added to the cache.
+    The cache is only an optimization: songs that can't be cached are compiled every time.
+
+    :param path: Path to the song file.
+    :param cache_dir: Directory compiled songs are cached in.
+    :return: :class:`~song_match.songbook.CompiledSong`
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    cache_path = get_cache_path(data, cache_dir)
+    try:
+        with open(cache_path, 'rb') as file:
+            return CompiledSong.from_bytes(file.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        pass  # Not cached yet, or the cached song is unreadable
+    compiled_song = compile_song(data, path)
+    __write_cache(cache_path, compiled_song)
+    return compiled_song
+
+
+def load_bundled_song(path: str) -> CompiledSong:
+    """Load a song file bundled with the package, like the built-in songs.
+
+    Each bundled song is compiled once per process and kept in memory.
+    It is never written to :data:`CACHE_DIR`, so creating a built-in song doesn't touch the user's home directory.
+
+    :param path: Path to the song file.
+    :return: :class:`~song_match.songbook.CompiledSong`
+    """
+    compiled_song = __bundled_songs.get(path)
+    if compiled_song is None:
+        compiled_song = compile_song_file(path)
+        __bundled_songs[path] = compiled_song
+    return compiled_song
+
+
+def get_cache_path(data: bytes, cache_dir: str = CACHE_DIR) -> str:
+    """Get the path a song file is cached at.
+
+    :param data: Contents of the song file.
+    :param cache_dir: Directory compiled songs are cached in.
+    :return: Path to the compiled song.
+    """
+    key = sha256(data)
+    key.update('{}:{}'.format(_COMPILER_VERSION, marshal.version).encode('ascii'))
+    return os.path.join(cache_dir, key.hexdigest())
+
+
+def is_song_file(path: str) -> bool:
+    """Get whether a path is a song file, by its extension.
+
+    :param path: Path to a file.
+    :return: Whether the file is a song file.
+    """
+    return path.endswith(SONG_FILE_EXTENSION)
+
+
+def __write_cache(cache_path: str, compiled_song: CompiledSong) -> None:
+    from tempfile import NamedTemporaryFile  # Only needed on a cache miss, so loading cached songs skips it
+
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with NamedTemporaryFile(dir=cache_dir, delete=False) as file:
+            file.write(compiled_song.to_bytes())
+        os.replace(file.name, cache_path)  # Readers see the whole song or none of it
+    except OSError:
+        pass  # Caching is best effort
+
+
+def __get_field(song: dict, name: str, field_type: type, path: str):
+    value = song.get(name)
+    if not isinstance(value, field_type):
+        raise InvalidSongFile(path, 'Expected "{}" to be a {}.'.format(name, field_type.__name__))
+    return value
+
+
+def __get_notes(notes: list, path: str) -> Tuple[str, ...]:
+    if len(notes) != 3 or len(set(notes)) != 3:
+        raise InvalidSongFile(path, 'Expected 3 different notes, got {}.'.format(notes))
+    for note in notes:
+        if not isinstance(note, str) or not os.path.isfile(os.path.join(_PIANO_DIR, note + '.wav')):
+            raise InvalidSongFile(path, 'Invalid note "{}".'.format(note))
+    return tuple(notes)
+
+
+def __get_lights(lights: list, path: str) -> Tuple[int, ...]:
+    if len(lights) != 3:
+        raise InvalidSongFile(path, 'Expected 3 lights, got {}.'.format(len(lights)))
+    int_colors = []
+    for light in lights:
+        if not isinstance(light, str) or not _COLOR_PATTERN.match(light):
+            raise InvalidSongFile(path, 'Invalid light "{}", expected a color like #ff00ff.'.format(light))
+        int_colors.append(int(light[1:], 16) << 8 | 0xff)  # Same layout as cozmo.lights.Color.int_color
+    return tuple(int_colors)
+
+
+def __get_sequence(sequence: str, notes: Tuple[str, ...], path: str) -> Tuple[bytes, bytes]:
+    pitches = bytearray()
+    note_values = bytearray()
+    for token in sequence.split():
+        match = _NOTE_PATTERN.match(token)
+        if match is None or match.group('note') not in notes:
+            raise InvalidSongFile(path, 'Invalid note "{}" in sequence, expected one of {}.'.format(token, notes))
+        value = int(match.group('value') or DEFAULT_NOTE_VALUE)
+        if value not in NOTE_VALUES:
+            raise InvalidSongFile(path, 'Invalid duration "{}" in sequence.'.format(token))
+        pitches.append(notes.index(match.group('note')))
+        note_values.append(value)
+    if not pitches:
+        raise InvalidSongFile(path, 'Expected at least one note in the sequence.')
+    return bytes(pitches), bytes(note_values)
+
+
+def __get_difficulty_markers(difficulty_markers: list, length: int, path: str) -> Tuple[int, int]:
+    if (len(difficulty_markers) != 2 or not all(isinstance(marker, int) for marker in difficulty_markers)
+            or not 0 < difficulty_markers[0] <= difficulty_markers[1] <= length):
+        raise InvalidSongFile(path, 'Expected medium and long difficulty markers from 1 to {}, got {}.'.format(
+            length, difficulty_markers))
+    return tuple(difficulty_markers)
@@ -2,6 +2,9 @@
 
 from .sound_effects import get_collect_point_sound
 from .sound_effects import get_level_complete_sound
+from .sample_cache import SampleCache
+from .sample_cache import get_sample_cache
+from .sound_effects import get_piano_note_sound
 from .sound_effects import get_piano_note_sound_path
 from .sound_effects import get_wrong_buzzer_sound
 from .sound_effects import play_collect_point_sound
@@ -0,0 +1,107 @@
+"""Module containing :class:`~song_match.sound_effects.sample_cache.SampleCache`."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+from typing import Hashable
+from typing import Tuple
+from typing import Union
+
+from pygame.mixer import Sound
+
+#: Default memory ceiling of the sample cache in bytes.
+#: Large enough for the game sounds plus every piano note a song uses.
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class SampleCache:
+    """Least recently used cache of decoded :class:`~pygame.mixer.Sound` samples.
+
+    Each sample is decoded from disk at most once while it stays in the cache.
+    When the decoded samples exceed ``max_bytes``,
+    the least recently used samples are evicted until the cache fits again.
+
+    The cache is safe to use from multiple threads, so samples can be decoded
+    in a thread pool while the event loop keeps running.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0  # Number of lookups served from the cache
+        self.misses = 0  # Number of lookups that decoded a sample from disk
+        self.evictions = 0  # Number of samples evicted to stay under max_bytes
+        self.num_bytes = 0  # Number of bytes of decoded samples currently held
+        self.__samples = OrderedDict()  # Maps a key to a (sound, size) tuple
+        self.__lock = Lock()
+
+    def get(self, key: Hashable, path: Union[str, Callable[[], str]]) -> Sound:
+        """Get the sample for ``key``, decoding it from ``path`` on a miss.
+
+        :param key: Key identifying the sample. For example, ``('piano', 'C4')``.
+        :param path: Path to the ``.wav`` file of the sample,
+                     or a function returning the path, called only on a miss.
+        :return: :class:`~pygame.mixer.Sound`
+        """
+        with self.__lock:
+            entry = self.__samples.get(key)
+            if entry is not None:
+                self.hits += 1
+                self.__samples.move_to_end(key)
+                return entry[0]
+            self.misses += 1
+
+        # Resolve and decode outside of the lock so other samples can be decoded concurrently
+        sound, size = self.__load(path() if callable(path) else path)
+
+        with self.__lock:
+            entry = self.__samples.get(key)
+            if entry is not None:  # Another thread decoded the same sample first
+                self.__samples.move_to_end(key)
+                return entry[0]
+            self.__samples[key] = (sound, size)
+            self.num_bytes += size
+            self.__evict(keep=key)
+        return sound
+
+    def clear(self) -> None:
+        """Remove every sample from the cache and reset the counters.
+
+        :return: None
+        """
+        with self.__lock:
+            self.__samples.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.num_bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__samples
+
+    def __len__(self) -> int:
+        return len(self.__samples)
+
+    def __evict(self, keep: Hashable) -> None:
+        while self.num_bytes > self.max_bytes and len(self.__samples) > 1:
+            key = next(iter(self.__samples))
+            if key == keep:
+                break
+            sound, size = self.__samples.pop(key)
+            self.num_bytes -= size
+            self.evictions += 1
+
+    @staticmethod
+    def __load(path: str) -> Tuple[Sound, int]:
+        sound = Sound(path)
+        return sound, len(sound.get_raw())
+
+
+__sample_cache = SampleCache()
+
+
+def get_sample_cache() -> SampleCache:
+    """Get the process-wide :class:`~song_match.sound_effects.sample_cache.SampleCache`.
+
+    :return: :class:`~song_match.sound_effects.sample_cache.SampleCache`
+    """
+    return __sample_cache
@@ -1,10 +1,13 @@
 import os
+from functools import partial
 
 from pygame.mixer import Sound
 
+from song_match.audio_engine import get_audio_engine
 from song_match.config import ROOT_DIR
 from song_match.exceptions import InvalidGameEffectSound
 from song_match.exceptions import InvalidNote
+from .sample_cache import get_sample_cache
 
 # Game sounds
 COLLECT_POINT = 'collect-point'
@@ -21,7 +24,7 @@ def get_collect_point_sound() -> Sound:
 
     :return: :class:`~pygame.mixer.Sound`
     """
-    return Sound(__get_game_sound_path(COLLECT_POINT))
+    return __get_game_sound(COLLECT_POINT)
 
 
 def get_level_complete_sound() -> Sound:
@@ -29,7 +32,7 @@ def get_level_complete_sound() -> Sound:
 
     :return: :class:`~pygame.mixer.Sound`
     """
-    return Sound(__get_game_sound_path(LEVEL_COMPLETE))
+    return __get_game_sound(LEVEL_COMPLETE)
 
 
 def get_wrong_buzzer_sound() -> Sound:
@@ -37,7 +40,7 @@ def get_wrong_buzzer_sound() -> Sound:
 
     :return: :class:`~pygame.mixer.Sound`
     """
-    return Sound(__get_game_sound_path(WRONG_BUZZER))
+    return __get_game_sound(WRONG_BUZZER)
 
 
 def play_collect_point_sound() -> None:
@@ -45,7 +48,7 @@ def play_collect_point_sound() -> None:
 
     :return: None
     """
-    get_collect_point_sound().play()
+    get_audio_engine().play_effect(get_collect_point_sound())
 
 
 def play_level_complete_sound() -> None:
@@ -53,7 +56,7 @@ def play_level_complete_sound() -> None:
 
     :return: None
     """
-    get_level_complete_sound().play()
+    get_audio_engine().play_effect(get_level_complete_sound())
 
 
 def play_wrong_buzzer_sound() -> None:
@@ -61,7 +64,7 @@ def play_wrong_buzzer_sound() -> None:
 
     :return: None
     """
-    get_wrong_buzzer_sound().play()
+    get_audio_engine().play_effect(get_wrong_buzzer_sound())
 
 
 def get_piano_note_sound_path(name: str) -> str:
@@ -73,6 +76,21 @@ def get_piano_note_sound_path(name: str) -> str:
     return __get_sound_path(name, PIANO)
 
 
+def get_piano_note_sound(name: str) -> Sound:
+    """Get the sound of a piano note from the sample cache.
+
+    The path is only resolved, and checked to exist, when the note isn't cached yet.
+
+    :param name: The name of the note. For example, C4.
+    :return: :class:`~pygame.mixer.Sound`
+    """
+    return get_sample_cache().get((PIANO, name), partial(get_piano_note_sound_path, name))
+
+
+def __get_game_sound(name: str) -> Sound:
+    return get_sample_cache().get((GAME, name), partial(__get_game_sound_path, name))
+
+
 def __get_game_sound_path(name: str) -> str:
     return __get_sound_path(name, GAME)
 
@@ -0,0 +1,156 @@
+"""Module containing :class:`~song_match.tap_latency.TapLatencyMetrics`."""
+
+from collections import OrderedDict
+from math import ceil
+from time import monotonic
+from typing import Callable, Dict, List
+
+# Stages of a tap, in the order they happen
+RECEIVED = 'received'  #: The tap event reached the game.
+NOTE_LOOKUP = 'note_lookup'  #: The tapped cube's note was found.
+LIGHT_OFF = 'light_off'  #: The cube's light was turned off.
+SOUND_START = 'sound_start'  #: The note started playing.
+LIGHT_ON = 'light_on'  #: The cube's light was turned back on.
+
+#: Stages measured relative to :data:`RECEIVED`.
+STAGES = (NOTE_LOOKUP, LIGHT_OFF, SOUND_START, LIGHT_ON)
+
+#: Percentiles reported for each stage.
+PERCENTILES = (50, 95, 99)
+
+
+class TapTrace:
+    """Timestamps of the stages of a single tap, from the event arriving to the cube lighting back up."""
+
+    __slots__ = ('_clock', 'timestamps')
+
+    def __init__(self, clock: Callable[[], float] = monotonic):
+        self._clock = clock
+        self.timestamps = {RECEIVED: clock()}  # Maps a stage to the time it happened
+
+    def mark(self, stage: str) -> None:
+        """Record the time a stage happened.
+
+        :param stage: The stage. For example, :data:`SOUND_START`.
+        :return: None
+        """
+        self.timestamps[stage] = self._clock()
+
+    def get_latency(self, stage: str) -> float:
+        """Get the time from the tap event arriving to a stage.
+
+        :param stage: The stage. For example, :data:`SOUND_START`.
+        :return: Latency in seconds, or None if the stage didn't happen.
+        """
+        timestamp = self.timestamps.get(stage)
+        if timestamp is None:
+            return None
+        return timestamp - self.timestamps[RECEIVED]
+
+
+class TapLatencyMetrics:
+    """Collects :class:`~song_match.tap_latency.TapTrace` latencies over a game.
+
+    Start a trace with :meth:`~song_match.tap_latency.TapLatencyMetrics.start_trace`
+    when a tap event arrives, mark each stage on it,
+    then query percentiles and histograms per stage.
+    """
+
+    def __init__(self, clock: Callable[[], float] = monotonic):
+        self.clock = clock  # Monotonic clock the timestamps come from, like the event loop's time
+        self.__latencies = {stage: [] for stage in STAGES}  # type: Dict[str, List[float]]
+        self.__num_taps = 0
+
+    def start_trace(self) -> TapTrace:
+        """Start timing a tap. Call when the tap event arrives.
+
+        :return: :class:`~song_match.tap_latency.TapTrace`
+        """
+        self.__num_taps += 1
+        return TapTrace(self.clock)
+
+    def record(self, trace: TapTrace) -> None:
+        """Add the latencies of a finished trace.
+
+        :param trace: :class:`~song_match.tap_latency.TapTrace`
+        :return: None
+        """
+        for stage in STAGES:
+            latency = trace.get_latency(stage)
+            if latency is not None:
+                self.__latencies[stage].append(latency)
+
+    def clear(self) -> None:
+        """Remove every recorded latency.
+
+        :return: None
+        """
+        for latencies in self.__latencies.values():
+            latencies.clear()
+        self.__num_taps = 0
+
+    def __len__(self) -> int:
+        return self.__num_taps
+
+    def get_latencies(self, stage: str) -> List[float]:
+        """Get every recorded latency of a stage.
+
+        :param stage: The stage. For example, :data:`SOUND_START`.
+        :return: Latencies in seconds, in the order they were recorded.
+        """
+        return list(self.__latencies[stage])
+
+    def get_percentile(self, stage: str, percentile: float) -> float:
+        """Get a percentile of the latencies of a stage, using the nearest rank.
+
+        :param stage: The stage. For example, :data:`SOUND_START`.
+        :param percentile: The percentile, from 0 to 100.
+        :return: Latency in seconds, or None if nothing was recorded.
+        """
+        latencies = sorted(self.__latencies[stage])
+        if len(latencies) == 0:
+            return None
+        rank = max(int(ceil(percentile / 100 * len(latencies))), 1)
+        return latencies[rank - 1]
+
+    def get_histogram(self, stage: str, bin_width: float = 0.005) -> Dict[float, int]:
+        """Get a histogram of the latencies of a stage.
+
+        :param stage: The stage. For example, :data:`SOUND_START`.
+        :param bin_width: Width of each bin in seconds.
+        :return: Ordered mapping of the start of each non-empty bin in seconds to its count.
+        """
+        counts = {}
+        for latency in self.__latencies[stage]:
+            start = int(latency // bin_width) * bin_width
+            counts[start] = counts.get(start, 0) + 1
+        return OrderedDict(sorted(counts.items()))
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Get the count and percentiles of each stage.
+
+        :return: Mapping of each stage to its count and its ``p50``, ``p95`` and ``p99`` latencies in seconds.
+        """
+        summary = OrderedDict()
+        for stage in STAGES:
+            stage_summary = OrderedDict(count=len(self.__latencies[stage]))
+            for percentile in PERCENTILES:
+                stage_summary['p{}'.format(percentile)] = self.get_percentile(stage, percentile)
+            summary[stage] = stage_summary
+        return summary
+
+    def format(self) -> str:
+        """Format the percentiles of each stage as a table in milliseconds.
+
+        :return: The table.
+        """
+        header = '{:<12}{:>8}'.format('stage', 'count')
+        header += ''.join('{:>10}'.format('p{} (ms)'.format(percentile)) for percentile in PERCENTILES)
+        lines = ['Tap latency over {} taps'.format(len(self)), header]
+        for stage, stage_summary in self.to_dict().items():
+            line = '{:<12}{:>8}'.format(stage, stage_summary['count'])
+            for percentile in PERCENTILES:
+                latency = stage_summary['p{}'.format(percentile)]
+                line += '{:>10}'.format('-' if latency is None else '{:.1f}'.format(latency * 1000))
+            lines.append(line)
+        return '\n'.join(lines)
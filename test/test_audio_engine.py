@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from song_match.audio_engine import AudioEngine
+from song_match.audio_engine import NUM_EFFECT_CHANNELS
+from song_match.audio_engine import NUM_NOTE_CHANNELS
+
+
+class TestAudioEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.channels = []
+        patchers = [
+            patch('song_match.audio_engine.Channel', side_effect=self.__get_channel),
+            patch('song_match.audio_engine.get_init', return_value=(22050, -16, 1)),
+            patch('song_match.audio_engine.set_num_channels'),
+            patch('song_match.audio_engine.set_reserved')
+        ]
+        self.channel, self.get_init, self.set_num_channels, self.set_reserved = [p.start() for p in patchers]
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+
+    def test_open_channels_reserves_note_and_effect_channels(self):
+        engine = AudioEngine()
+        engine.open_channels(256)
+        num_channels = NUM_NOTE_CHANNELS + NUM_EFFECT_CHANNELS
+        self.set_num_channels.assert_called_once_with(num_channels)
+        self.set_reserved.assert_called_once_with(num_channels)
+        self.assertEqual(len(self.channels), num_channels)
+        self.assertTrue(engine.is_open)
+        self.assertAlmostEqual(engine.buffer_latency, 256 / 22050)
+
+    def test_each_cube_plays_on_its_own_channel(self):
+        engine = AudioEngine()
+        engine.open_channels(256)
+        sounds = [MagicMock() for _ in range(NUM_NOTE_CHANNELS)]
+        for channel_index, sound in enumerate(sounds):
+            engine.play_note(sound, channel_index)
+        for note_channel, sound in zip(self.channels, sounds):
+            note_channel.play.assert_called_once_with(sound)
+
+    def test_effects_never_take_note_channels(self):
+        engine = AudioEngine()
+        engine.open_channels(256)
+        for channel in self.channels:
+            channel.get_busy.return_value = True
+        num_effects = 10
+        for _ in range(num_effects):
+            engine.play_effect(MagicMock())
+        for note_channel in self.channels[:NUM_NOTE_CHANNELS]:
+            note_channel.play.assert_not_called()
+        for effect_channel in self.channels[NUM_NOTE_CHANNELS:]:
+            self.assertEqual(effect_channel.play.call_count, num_effects // NUM_EFFECT_CHANNELS)
+
+    def test_effects_prefer_idle_channels(self):
+        engine = AudioEngine()
+        engine.open_channels(256)
+        busy_channel, idle_channel = self.channels[NUM_NOTE_CHANNELS:]
+        busy_channel.get_busy.return_value = True
+        engine.play_effect(MagicMock())
+        busy_channel.play.assert_not_called()
+        idle_channel.play.assert_called_once()
+
+    def test_play_latency_includes_buffer_latency(self):
+        engine = AudioEngine()
+        engine.open_channels(256)
+        self.assertIsNone(engine.get_play_latency())
+        engine.play_note(MagicMock(), 0)
+        self.assertGreaterEqual(engine.get_play_latency(), engine.buffer_latency)
+
+    def test_plays_on_any_channel_without_a_mixer(self):
+        self.get_init.return_value = None
+        engine = AudioEngine()
+        engine.open_channels(256)
+        self.assertFalse(engine.is_open)
+        sound = MagicMock()
+        engine.play_note(sound, 0)
+        engine.play_effect(sound)
+        self.assertEqual(sound.play.call_count, 2)
+        self.channel.assert_not_called()
+        self.assertIsNone(engine.get_play_latency())
+
+    def __get_channel(self, channel_id):
+        channel = MagicMock()
+        channel.get_busy.return_value = False
+        self.channels.append(channel)
+        return channel
+
+
+if __name__ == '__main__':
+    unittest.main()
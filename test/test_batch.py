@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import patch
+
+from song_match import song_registry
+from song_match.game_constants import FEEDBACK_MODES
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.simulator.batch import DIFFICULTY_SETTINGS
+from song_match.simulator.batch import DifficultySetting
+from song_match.simulator.batch import SongProfile
+from song_match.simulator.batch import TimeModel
+from song_match.simulator.batch import get_difficulty_settings
+from song_match.simulator.batch import get_song_profiles
+from song_match.simulator.batch import run_batch
+from song_match.simulator.batch import simulate_games
+from song_match.song import HotCrossBuns
+from song_match.song import MaryHadALittleLamb
+from song_match.song_match import SongMatch
+from song_match.song_registry import register_song
+from song_match.sound_effects import get_sample_cache
+
+PERFECT = DifficultySetting('perfect', player_accuracy=1, cozmo_chance_for_error=0)
+
+
+class TestBatch(unittest.TestCase):
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_perfect_games_play_every_round(self, sound):
+        profile = SongProfile.of('hcb', HotCrossBuns())
+
+        result = simulate_games(profile, PERFECT, num_players=2, num_games=100, seed=1)
+
+        self.assertEqual(result.player_win_rate, 1)
+        self.assertEqual(result.cozmo_win_rate, 1)
+        self.assertEqual(result.mean_rounds, len(profile.round_positions))
+        self.assertEqual(result.player_eliminations.sum(), 0)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_games_end_once_players_strike_out(self, sound):
+        profile = SongProfile.of('hcb', HotCrossBuns())
+        setting = DifficultySetting('hopeless', player_accuracy=0, cozmo_chance_for_error=0)
+
+        result = simulate_games(profile, setting, num_players=1, num_games=100, seed=1)
+
+        self.assertEqual(result.player_win_rate, 0)
+        self.assertEqual(result.mean_rounds, setting.max_strikes)
+        self.assertEqual(result.player_eliminations[setting.max_strikes - 1], 100)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_seeded_batches_are_reproducible(self, sound):
+        profile = SongProfile.of('mhall', MaryHadALittleLamb())
+        setting = DifficultySetting('normal')
+
+        first, = run_batch([profile], [setting], num_players=2, num_games=3000, seed=7, max_workers=2,
+                           chunk_size=1000)
+        second, = run_batch([profile], [setting], num_players=2, num_games=3000, seed=7, max_workers=2,
+                            chunk_size=1000)
+
+        self.assertEqual(first.num_games, 3000)
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertEqual(first.rounds_histogram.sum(), 3000)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    @patch('song_match.song_match.init_mixer')
+    @patch('song_match.song_robot.random', return_value=1)
+    def test_time_model_matches_simulated_game(self, random, init_mixer, sound):
+        for feedback_mode in FEEDBACK_MODES:
+            with self.subTest(feedback_mode=feedback_mode):
+                song = HotCrossBuns()
+                song_match = SongMatch(song=song, num_players=2, feedback_mode=feedback_mode)
+                players = SongPlayers(song, num_players=2, cube_mat=song_match.cube_mat)
+                simulation = Simulation(players, virtual_clock=True)
+                simulation.run(song_match.play)
+
+                result = simulate_games(SongProfile.of('hcb', song), PERFECT, num_players=2, num_games=1,
+                                        time_model=TimeModel(feedback_mode=feedback_mode))
+
+                self.assertAlmostEqual(result.mean_duration, simulation.game_time, places=6)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_song_profiles_cover_registered_songs(self, sound):
+        with patch.dict(getattr(song_registry, '__songs')):
+            register_song('buns', 'Hot Cross Buns', 'song_match.song.songs.hot_cross_buns', 'HotCrossBuns')
+            profiles = get_song_profiles()
+        self.assertEqual([profile.name for profile in profiles], ['hcb', 'mhall', 'rrga', 'buns'])
+
+    def test_accuracy_override_leaves_shared_settings_unchanged(self):
+        settings = get_difficulty_settings(['easy', 'normal'], player_accuracy=.5)
+
+        self.assertEqual([setting.name for setting in settings], ['easy', 'normal'])
+        self.assertEqual([setting.player_accuracy for setting in settings], [.5, .5])
+        self.assertEqual(settings[0].cozmo_chance_for_error, DIFFICULTY_SETTINGS['easy'].cozmo_chance_for_error)
+        self.assertEqual(DIFFICULTY_SETTINGS['easy'].player_accuracy, .95)
+        self.assertEqual(DIFFICULTY_SETTINGS['normal'].player_accuracy, .95)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from itertools import permutations
+
+from cozmo.objects import LightCubeIDs
+
+from song_match.cube_mat import CubeMat
+
+from test.util import get_song_robot
+
+
+class TestCubeMat(unittest.TestCase):
+
+    def setUp(self):
+        self.cube_mat = CubeMat()
+
+    def test_orders_cubes_by_position(self):
+        self.cube_mat.order_cubes_by_position(get_song_robot([20, 10, 30]))
+
+        self.assertEqual(self.cube_mat.get_positions(), (2, 1, 3))
+        self.assertEqual(self.cube_mat.cube_id_to_position(1), 2)
+        self.assertEqual(self.cube_mat.cube_id_to_position(2), 1)
+        self.assertEqual(self.cube_mat.cube_id_to_position(3), 3)
+
+    def test_maps_a_three_cycle_in_both_directions(self):
+        self.cube_mat.order_cubes_by_position(get_song_robot([30, 10, 20]))
+
+        self.assertEqual(self.cube_mat.get_positions(), (2, 3, 1))
+        self.assertEqual([self.cube_mat.cube_id_to_position(cube_id) for cube_id in LightCubeIDs], [3, 1, 2])
+        self.assertEqual([self.cube_mat.position_to_cube_id(position) for position in range(1, 4)], [2, 3, 1])
+
+    def test_position_to_cube_id_is_inverse_of_cube_id_to_position(self):
+        for y_positions in permutations([10, 20, 30]):
+            self.cube_mat.order_cubes_by_position(get_song_robot(y_positions))
+            for cube_id in LightCubeIDs:
+                position = self.cube_mat.cube_id_to_position(cube_id)
+                self.assertEqual(self.cube_mat.position_to_cube_id(position), cube_id)
+
+    def test_instances_keep_their_own_layout(self):
+        other_cube_mat = CubeMat()
+        self.cube_mat.order_cubes_by_position(get_song_robot([20, 10, 30]))
+        other_cube_mat.order_cubes_by_position(get_song_robot([30, 20, 10]))
+
+        self.assertEqual(self.cube_mat.get_positions(), (2, 1, 3))
+        self.assertEqual(other_cube_mat.get_positions(), (3, 2, 1))
+        self.assertEqual(self.cube_mat.position_to_cube_id(1), 2)
+        self.assertEqual(other_cube_mat.position_to_cube_id(1), 3)
+
+    def test_class_methods_use_default_instance(self):
+        CubeMat.order_cubes_by_position(get_song_robot([30, 10, 20]))
+
+        self.assertEqual(CubeMat.get_positions(), (2, 3, 1))
+        self.assertEqual(CubeMat.get_positions(), CubeMat.get_default().get_positions())
+        self.assertEqual(CubeMat.cube_id_to_position(1), CubeMat.get_default().cube_id_to_position(1))
+        self.assertIsNone(self.cube_mat.get_positions())
+
+    def test_unordered_lookups_are_zero(self):
+        self.assertEqual(self.cube_mat.cube_id_to_position(1), 0)
+        self.assertEqual(self.cube_mat.position_to_cube_id(1), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
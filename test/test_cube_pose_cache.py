@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import MagicMock
+
+from cozmo.objects import EvtObjectObserved
+from cozmo.util import Pose
+from cozmo.util import degrees
+
+from song_match.cube_pose_cache import CubePoseCache
+
+
+class TestCubePoseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0.0
+        self.cache = CubePoseCache(clock=lambda: self.time, max_age=5)
+        self.pose = Pose(200, 80, 0, angle_z=degrees(0))
+
+    def test_missing_pose_is_stale(self):
+        self.assertIsNone(self.cache.get_pose(1))
+        self.assertIsNone(self.cache.get_age(1))
+        self.assertTrue(self.cache.is_stale(1))
+        self.assertIsNone(self.cache.get_fresh_pose(1))
+        self.assertEqual(self.cache.num_stale, 1)
+
+    def test_pose_goes_stale_with_age(self):
+        self.cache.update(1, self.pose)
+        self.time = 5
+        self.assertIs(self.cache.get_fresh_pose(1), self.pose)
+        self.time = 5.5
+        self.assertAlmostEqual(self.cache.get_age(1), 5.5)
+        self.assertIsNone(self.cache.get_fresh_pose(1))
+        self.assertIs(self.cache.get_pose(1), self.pose)
+        self.assertEqual((self.cache.num_hits, self.cache.num_stale), (1, 1))
+
+    def test_observed_cubes_are_recorded(self):
+        cube = MagicMock(cube_id=2)
+        self.time = 1
+        self.cache.on_object_observed(EvtObjectObserved(obj=cube, pose=self.pose))
+        self.assertIs(self.cache.get_pose(2), self.pose)
+        self.cache.on_object_observed(EvtObjectObserved(obj=cube))
+        self.assertIs(self.cache.get_pose(2), cube.pose)
+        self.cache.on_object_observed(EvtObjectObserved(obj=object(), pose=self.pose))  # Not a cube
+        self.assertEqual(self.cache.num_updates, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
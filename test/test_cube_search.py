@@ -0,0 +1,47 @@
+import unittest
+from itertools import islice
+
+from cozmo.util import Pose
+from cozmo.util import degrees
+
+from song_match.cube_search import CubeSearchMetrics
+from song_match.cube_search import SEARCH_STEP
+from song_match.cube_search import get_relative_heading
+from song_match.cube_search import get_search_turns
+
+
+def get_turns(relative_heading=None, num_turns=3):
+    return [angle.degrees for angle in islice(get_search_turns(relative_heading), num_turns)]
+
+
+class TestCubeSearch(unittest.TestCase):
+
+    def test_relative_heading(self):
+        cube_pose = Pose(100, 100, 0, angle_z=degrees(0))
+        self.assertAlmostEqual(get_relative_heading(Pose(0, 0, 0, angle_z=degrees(0)), cube_pose), 45)
+        self.assertAlmostEqual(get_relative_heading(Pose(0, 0, 0, angle_z=degrees(90)), cube_pose), -45)
+        self.assertAlmostEqual(get_relative_heading(Pose(0, 0, 0, angle_z=degrees(-170)), cube_pose), -145)
+
+    def test_turns_to_heading_then_steps_the_same_way(self):
+        self.assertEqual(get_turns(-100), [-100, -SEARCH_STEP, -SEARCH_STEP])
+        self.assertEqual(get_turns(45), [45, SEARCH_STEP, SEARCH_STEP])
+
+    def test_steps_left_without_a_heading(self):
+        self.assertEqual(get_turns(), [SEARCH_STEP] * 3)
+
+    def test_metrics(self):
+        metrics = CubeSearchMetrics()
+        self.assertIsNone(metrics.mean_search_time)
+        self.assertEqual(metrics.max_num_turns, 0)
+        metrics.record(0.5, 1)
+        metrics.record(1.5, 3)
+        self.assertEqual(len(metrics), 2)
+        self.assertAlmostEqual(metrics.mean_search_time, 1)
+        self.assertAlmostEqual(metrics.mean_num_turns, 2)
+        self.assertEqual(metrics.max_num_turns, 3)
+        metrics.clear()
+        self.assertEqual(len(metrics), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
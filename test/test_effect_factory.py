@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from song_match.effect import Effect
+from song_match.effect import EffectFactory
+from song_match.effect import get_effect_types
+from song_match.effect import register_effect
+from song_match.effect import registry
+from song_match.effect.effects import WrongNoteEffect
+from song_match.exceptions import DuplicateEffectType
+from song_match.exceptions import InvalidEffectType
+from song_match.sound_effects import get_sample_cache
+from song_match.sound_effects.sound_effects import GAME
+from song_match.sound_effects.sound_effects import WRONG_BUZZER
+
+
+class TestEffectFactory(unittest.TestCase):
+
+    def setUp(self):
+        # Restore the registry after tests that register effects
+        patchers = [
+            patch.dict(getattr(registry, '__effect_classes')),
+            patch.object(registry, '__loaded_entry_points', False),
+            patch.object(registry, '_get_entry_points', return_value=[])
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.song_robot = MagicMock()
+        self.effect_factory = EffectFactory(self.song_robot)
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    def test_create_returns_one_instance_per_effect_type(self):
+        effect = self.effect_factory.create('WrongNote')
+        self.assertIsInstance(effect, WrongNoteEffect)
+        self.assertIs(self.effect_factory.create('WrongNote'), effect)
+        self.assertIsNot(EffectFactory(self.song_robot).create('WrongNote'), effect)
+
+    def test_create_raises_invalid_effect_type(self):
+        with self.assertRaises(InvalidEffectType):
+            self.effect_factory.create('RightNote')
+
+    def test_subclasses_register_themselves(self):
+        class SparkleEffect(Effect):
+            pass
+
+        self.assertIn('Sparkle', get_effect_types())
+        self.assertIsInstance(self.effect_factory.create('Sparkle'), SparkleEffect)
+
+        with self.assertRaises(DuplicateEffectType):
+            register_effect('Sparkle', WrongNoteEffect)
+
+    def test_effects_are_loaded_from_entry_points(self):
+        class ConfettiEffect(Effect):
+            pass
+
+        entry_point = MagicMock()
+        entry_point.name = 'Party'
+        entry_point.load.return_value = ConfettiEffect
+        registry._get_entry_points.return_value = [entry_point]
+
+        self.assertIsInstance(self.effect_factory.create('Party'), ConfettiEffect)
+        self.effect_factory.create('Party')
+        entry_point.load.assert_called_once_with()
+        registry._get_entry_points.assert_called_once_with(registry.ENTRY_POINT_GROUP)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_prepare_creates_note_cubes_and_decodes_sounds(self, sound):
+        self.effect_factory.prepare()
+
+        self.assertEqual(set(get_effect_types()), {'CorrectSequence', 'GameOver', 'RoundTransition', 'WrongNote'})
+        self.assertIn((GAME, WRONG_BUZZER), get_sample_cache())
+        self.assertEqual(sound.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
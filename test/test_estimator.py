@@ -0,0 +1,76 @@
+import random
+import unittest
+from asyncio import new_event_loop
+from unittest.mock import patch
+
+import numpy as np
+
+from song_match.cube_mat import CubeMat
+from song_match.simulator import SimulatedRobot
+from song_match.simulator import SimulatedWorld
+from song_match.simulator.batch import SongProfile
+from song_match.simulator.estimator import CozmoErrorEstimator
+from song_match.song import HotCrossBuns
+from song_match.song import MaryHadALittleLamb
+from song_match.song_robot import SongRobot
+from song_match.sound_effects import get_sample_cache
+
+
+async def play_note(self, note):
+    pass
+
+
+class TestCozmoErrorEstimator(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_sampled_chances_match_exact_chances(self, sound):
+        estimator = CozmoErrorEstimator(SongProfile.of('mhall', MaryHadALittleLamb()))
+        num_samples = 20000
+
+        exact = estimator.get_round_survival_chances()
+        sampled = estimator.sample_round_survival_chances(num_samples, seed=3)
+
+        tolerance = 4 * np.sqrt(exact * (1 - exact) / num_samples) + 1e-9
+        self.assertTrue(np.all(np.abs(sampled - exact) <= tolerance), (sampled, exact))
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    @patch.object(SongRobot, 'play_note', play_note)
+    def test_exact_chances_match_song_robot(self, sound):
+        world = SimulatedWorld([], self.loop)
+        robot = SimulatedRobot(world, self.loop)
+        song = HotCrossBuns()
+        song_robot = SongRobot(robot, song)
+        CubeMat.order_cubes_by_position(song_robot)
+        estimator = CozmoErrorEstimator(SongProfile.of('hcb', song))
+        num_trials = 4000
+        random.seed(5)
+
+        for length, exact in zip(estimator.sequence_lengths[-3:], estimator.get_round_survival_chances()[-3:]):
+            notes = song.get_sequence_slice(int(length))
+            num_survived = 0
+            for _ in range(num_trials):
+                played_correct_sequence, _ = self.loop.run_until_complete(song_robot.play_notes(notes, True))
+                num_survived += played_correct_sequence
+            tolerance = 4 * np.sqrt(exact * (1 - exact) / num_trials)
+            self.assertAlmostEqual(num_survived / num_trials, exact, delta=tolerance)
+
+    def test_strike_distribution_sums_to_one(self):
+        profile = SongProfile('song', [0.4] * 20, long_marker=10, starting_position=3,
+                              round_positions=[3, 4, 5, 7, 9, 12, 15, 18, 20])
+        estimator = CozmoErrorEstimator(profile)
+
+        distribution = estimator.get_strike_distribution()
+
+        np.testing.assert_allclose(distribution.sum(axis=1), 1)
+        self.assertTrue(np.all(np.diff(estimator.get_in_game_chances()) <= 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from asyncio import sleep
+from unittest.mock import MagicMock
+
+from cozmo.lights import off_light
+
+from song_match.cube import NoteCube
+from song_match.cube.light_animator import LightAnimator
+from song_match.cube.light_animator import LightPattern
+from song_match.cube.light_animator import chaser
+from song_match.cube.light_animator import flash
+from song_match.cube.light_animator import pulse
+from song_match.cube.light_animator import solid
+from song_match.cube.lights import GREEN_LIGHT
+from song_match.simulator import SimulatedLightCube
+from song_match.simulator import VirtualClockEventLoop
+
+
+class TestLightPatterns(unittest.TestCase):
+
+    def test_chaser_lights_one_corner_per_frame(self):
+        pattern = chaser(GREEN_LIGHT)
+        self.assertTrue(pattern.repeat)
+        for i, frame in enumerate(pattern.frames):
+            self.assertEqual([light is GREEN_LIGHT for light in frame], [corner == i for corner in range(4)])
+
+    def test_flash_alternates_off_and_on(self):
+        pattern = flash(GREEN_LIGHT, 3, 0.15)
+        self.assertFalse(pattern.repeat)
+        self.assertEqual(len(pattern.frames), 6)
+        self.assertAlmostEqual(pattern.duration, 0.9)
+        self.assertIs(pattern.frames[0][0], off_light)
+        self.assertIs(pattern.frames[-1][0], GREEN_LIGHT)
+
+    def test_pulse_fades_out_and_back_in(self):
+        pattern = pulse(GREEN_LIGHT, period=1, num_steps=4)
+        brightness = [frame[0].on_color.int_color >> 16 & 0xff for frame in pattern.frames]
+        self.assertEqual(brightness[0], GREEN_LIGHT.on_color.int_color >> 16 & 0xff)
+        self.assertEqual(brightness[2], 0)
+        self.assertAlmostEqual(brightness[1], brightness[3], delta=1)
+
+    def test_invalid_patterns(self):
+        with self.assertRaises(ValueError):
+            LightPattern([], 0.1)
+        with self.assertRaises(ValueError):
+            LightPattern(solid(GREEN_LIGHT).frames, 0, repeat=True)
+
+
+class TestLightAnimator(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = VirtualClockEventLoop()
+        self.animator = LightAnimator(self.loop)
+        self.song = MagicMock()
+        self.song.get_cube_light.return_value = GREEN_LIGHT
+        self.note_cubes = [NoteCube(SimulatedLightCube(cube_id, MagicMock(), self.loop), self.song,
+                                    light_animator=self.animator, loop=self.loop)
+                           for cube_id in range(1, 4)]
+
+    def tearDown(self):
+        self.loop.run_until_complete(sleep(0.01))  # Let the animator task exit
+        self.loop.close()
+
+    def test_one_wakeup_per_frame_for_every_cube(self):
+        async def chase():
+            for note_cube in self.note_cubes:
+                note_cube.start_light_chaser(0.1)
+            await sleep(1.05)
+            for note_cube in self.note_cubes:
+                note_cube.stop_light_chaser()
+
+        self.loop.run_until_complete(chase())
+
+        self.assertEqual(self.animator.num_wakeups, 10)
+        self.assertEqual(self.animator.num_frames, 11 * len(self.note_cubes))
+        for note_cube in self.note_cubes:
+            self.assertFalse(self.animator.is_playing(note_cube))
+            self.assertEqual(note_cube._cube.lights, (GREEN_LIGHT,) * 4)
+
+    def test_flash_finishes_after_its_frames(self):
+        note_cube = self.note_cubes[0]
+        started_at = self.loop.time()
+        self.loop.run_until_complete(note_cube.flash(GREEN_LIGHT, 3, 0.15))
+        self.assertAlmostEqual(self.loop.time() - started_at, 0.9)
+        self.assertEqual(note_cube._cube.num_light_commands, 6)
+        self.assertEqual(note_cube._cube.lights, (GREEN_LIGHT,) * 4)
+        self.assertFalse(self.animator.is_playing(note_cube))
+
+    def test_playing_a_pattern_replaces_the_last_one(self):
+        note_cube = self.note_cubes[0]
+        note_cube.start_light_chaser()
+        self.loop.run_until_complete(note_cube.flash(GREEN_LIGHT, 1, 0.1))
+        self.assertFalse(self.animator.is_playing(note_cube))
+        note_cube.start_light_chaser()  # The replaced chaser isn't running anymore
+        note_cube.stop_light_chaser()
+
+    def test_chaser_cant_start_twice(self):
+        note_cube = self.note_cubes[0]
+        note_cube.start_light_chaser()
+        with self.assertRaises(ValueError):
+            note_cube.start_light_chaser()
+        note_cube.stop_light_chaser()
+
+    def test_cancelling_the_future_stops_the_pattern(self):
+        note_cube = self.note_cubes[0]
+        future = note_cube.play_lights(chaser(GREEN_LIGHT))
+        future.cancel()
+        self.loop.run_until_complete(sleep(0.5))
+        self.assertFalse(self.animator.is_playing(note_cube))
+        self.assertEqual(note_cube._cube.num_light_commands, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
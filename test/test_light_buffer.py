@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from cozmo.lights import Color
+from cozmo.lights import Light
+from cozmo.lights import green_light
+from cozmo.lights import off_light
+
+from song_match.cube.light_buffer import LightBuffer
+from song_match.cube.lights import GREEN_LIGHT
+from song_match.simulator import SimulatedLightCube
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.simulator import VirtualClockEventLoop
+from song_match.song import RainRainGoAway
+from song_match.song_match import SongMatch
+from song_match.sound_effects import get_sample_cache
+
+
+class TestLightBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = VirtualClockEventLoop()
+        self.light_buffer = LightBuffer(self.loop)
+        self.cube = SimulatedLightCube(1, MagicMock(), self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_updates_in_the_same_tick_are_merged(self):
+        self.light_buffer.set_lights(self.cube, green_light)
+        self.light_buffer.set_lights(self.cube, off_light)
+        self.assertEqual(self.cube.num_light_commands, 0)
+
+        self.loop.run_until_complete(_tick())
+
+        self.assertEqual(self.cube.num_light_commands, 1)
+        self.assertIs(self.cube.lights[0], off_light)
+        self.assertEqual(self.light_buffer.num_merged, 1)
+
+    def test_redundant_updates_are_dropped(self):
+        self.light_buffer.set_lights(self.cube, GREEN_LIGHT)
+        self.loop.run_until_complete(_tick())
+        self.light_buffer.set_lights(self.cube, Light(on_color=Color(rgb=(0, 255, 0))))  # Looks like GREEN_LIGHT
+        self.loop.run_until_complete(_tick())
+
+        self.assertEqual(self.cube.num_light_commands, 1)
+        self.assertEqual(self.light_buffer.num_redundant, 1)
+
+        self.light_buffer.forget()
+        self.light_buffer.set_lights(self.cube, green_light)
+        self.light_buffer.flush()
+        self.assertEqual(self.cube.num_light_commands, 2)
+
+    def test_each_cube_gets_its_own_command(self):
+        other_cube = SimulatedLightCube(2, MagicMock(), self.loop)
+        self.light_buffer.set_lights(self.cube, green_light)
+        self.light_buffer.set_light_corners(other_cube, green_light, off_light, off_light, off_light)
+        self.light_buffer.flush()
+
+        self.assertEqual(self.cube.num_light_commands, 1)
+        self.assertEqual(other_cube.lights, (green_light, off_light, off_light, off_light))
+        self.assertEqual(self.light_buffer.num_sent, 2)
+
+
+class TestLightBufferInGame(unittest.TestCase):
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    @patch('song_match.song_match.init_mixer')
+    def test_game_suppresses_light_commands(self, init_mixer, sound):
+        song = RainRainGoAway()
+        song_match = SongMatch(song=song, num_players=2)
+        simulation = Simulation(SongPlayers(song, num_players=2, cube_mat=song_match.cube_mat), virtual_clock=True)
+
+        simulation.run(song_match.play)
+
+        light_buffer = song_match._song_robot.light_buffer
+        num_light_commands = sum(cube.num_light_commands for cube in simulation.world.light_cubes.values())
+        self.assertEqual(num_light_commands, light_buffer.num_sent)
+        self.assertGreater(light_buffer.num_suppressed, 0)
+
+
+async def _tick():
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
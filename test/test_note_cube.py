@@ -0,0 +1,71 @@
+import unittest
+from asyncio import new_event_loop
+from asyncio import sleep
+from unittest.mock import MagicMock
+
+from song_match.cube import LIGHT_FIRST
+from song_match.cube import NoteCube
+from song_match.cube import SOUND_FIRST
+from song_match.simulator import SimulatedLightCube
+from song_match.tap_latency import LIGHT_OFF
+from song_match.tap_latency import LIGHT_ON
+from song_match.tap_latency import SOUND_START
+from song_match.tap_latency import TapLatencyMetrics
+
+
+class TestNoteCube(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = new_event_loop()
+        self.cube = SimulatedLightCube(1, MagicMock(), self.loop)
+        self.song = MagicMock()
+        self.metrics = TapLatencyMetrics(clock=self.loop.time)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def blink(self, note_cube: NoteCube, blink_duration: float):
+        trace = self.metrics.start_trace()
+        return trace, note_cube.blink_and_play_note(blink_duration, trace=trace)
+
+    def test_light_first_plays_note_halfway_through_blink(self):
+        trace, blink = self.blink(NoteCube(self.cube, self.song, LIGHT_FIRST, loop=self.loop), 0.02)
+        self.loop.run_until_complete(blink)
+        self.song.play_note.assert_called_once_with(1)
+        self.assertGreaterEqual(trace.get_latency(SOUND_START), 0.01)
+        self.assertGreaterEqual(trace.get_latency(LIGHT_ON), 0.02)
+
+    def test_sound_first_plays_note_before_blinking(self):
+        trace, blink = self.blink(NoteCube(self.cube, self.song, SOUND_FIRST, loop=self.loop), 0.02)
+        self.loop.run_until_complete(blink)
+        self.song.play_note.assert_called_once_with(1)
+        self.assertLessEqual(trace.timestamps[SOUND_START], trace.timestamps[LIGHT_OFF])
+        self.assertLess(trace.get_latency(SOUND_START), 0.01)
+        self.assertGreaterEqual(trace.get_latency(LIGHT_ON), 0.02)
+
+    def test_next_tap_cancels_sound_first_blink(self):
+        note_cube = NoteCube(self.cube, self.song, SOUND_FIRST, loop=self.loop)
+        first_trace, first_blink = self.blink(note_cube, 1)
+
+        async def tap_twice():
+            first = self.loop.create_task(first_blink)
+            await sleep(0.01)
+            second_trace, second_blink = self.blink(note_cube, 0.01)
+            await second_blink
+            await first
+            return second_trace
+
+        started_at = self.loop.time()
+        second_trace = self.loop.run_until_complete(tap_twice())
+        self.assertLess(self.loop.time() - started_at, 0.5)
+        self.assertEqual(self.song.play_note.call_count, 2)
+        self.assertNotIn(LIGHT_ON, first_trace.timestamps)
+        self.assertIn(LIGHT_ON, second_trace.timestamps)
+
+    def test_invalid_feedback_mode(self):
+        with self.assertRaises(ValueError):
+            NoteCube(self.cube, self.song, 'light-last', loop=self.loop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from asyncio import new_event_loop
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from song_match.preloader import Preloader
+from song_match.song import HotCrossBuns
+from song_match.sound_effects import get_sample_cache
+
+
+class TestPreloader(unittest.TestCase):
+
+    def setUp(self):
+        get_sample_cache().clear()
+        self.loop = new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_decodes_song_and_game_sounds(self, sound):
+        sound.side_effect = lambda path: MagicMock()
+        preloader = Preloader(HotCrossBuns())
+
+        preloader.start(self.loop)
+        self.assertIsNone(preloader.duration)
+        self.loop.run_until_complete(preloader.wait())
+
+        self.assertTrue(preloader.is_finished)
+        self.assertGreaterEqual(preloader.duration, 0)
+        self.assertGreaterEqual(preloader.wait_time, 0)
+        for key in [('piano', 'G3'), ('piano', 'A3'), ('piano', 'B3'),
+                    ('game', 'collect-point'), ('game', 'level-complete'), ('game', 'wrong-buzzer')]:
+            self.assertIn(key, get_sample_cache())
+        self.assertEqual(sound.call_count, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
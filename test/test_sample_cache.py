@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from song_match.sound_effects import SampleCache
+from song_match.sound_effects import get_collect_point_sound
+from song_match.sound_effects import get_piano_note_sound
+from song_match.sound_effects import get_sample_cache
+
+
+def get_sound(num_bytes: int):
+    sound = MagicMock()
+    sound.get_raw.return_value = bytes(num_bytes)
+    return sound
+
+
+class TestSampleCache(unittest.TestCase):
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_loads_each_sample_once(self, sound):
+        sound.side_effect = lambda path: get_sound(100)
+        cache = SampleCache()
+
+        first = cache.get(('piano', 'C4'), 'C4.wav')
+        second = cache.get(('piano', 'C4'), 'C4.wav')
+
+        self.assertIs(first, second)
+        self.assertEqual(sound.call_count, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.num_bytes, 100)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_evicts_least_recently_used(self, sound):
+        sound.side_effect = lambda path: get_sound(100)
+        cache = SampleCache(max_bytes=250)
+
+        cache.get('C4', 'C4.wav')
+        cache.get('D4', 'D4.wav')
+        cache.get('C4', 'C4.wav')  # D4 is now the least recently used
+        cache.get('E4', 'E4.wav')
+
+        self.assertIn('C4', cache)
+        self.assertNotIn('D4', cache)
+        self.assertIn('E4', cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.num_bytes, 200)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_keeps_sample_larger_than_ceiling(self, sound):
+        sound.side_effect = lambda path: get_sound(100)
+        cache = SampleCache(max_bytes=50)
+
+        cache.get('C4', 'C4.wav')
+        cache.get('D4', 'D4.wav')
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn('D4', cache)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_sound_effects_share_process_wide_cache(self, sound):
+        sound.side_effect = lambda path: get_sound(10)
+        get_sample_cache().clear()
+
+        get_piano_note_sound('C4')
+        get_piano_note_sound('C4')
+        get_collect_point_sound()
+        get_collect_point_sound()
+
+        self.assertEqual(sound.call_count, 2)
+        self.assertEqual(get_sample_cache().hits, 2)
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_cached_sounds_skip_the_filesystem(self, sound):
+        sound.side_effect = lambda path: get_sound(10)
+        get_sample_cache().clear()
+        get_piano_note_sound('C4')
+
+        with patch('os.path.isfile') as isfile:
+            get_piano_note_sound('C4')
+        isfile.assert_not_called()
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_path_function_is_called_only_on_a_miss(self, sound):
+        sound.side_effect = lambda path: get_sound(10)
+        cache = SampleCache()
+        get_path = MagicMock(return_value='C4.wav')
+
+        cache.get('C4', get_path)
+        cache.get('C4', get_path)
+
+        sound.assert_called_once_with('C4.wav')
+        get_path.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from asyncio import sleep
+from unittest.mock import patch
+
+from song_match.sequence_scheduler import SequenceScheduler
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.simulator import VirtualClockEventLoop
+from song_match.song import MaryHadALittleLamb
+from song_match.song import Note
+from song_match.song.note import EIGHTH_NOTE
+from song_match.song.note import QUARTER_NOTE
+from song_match.song_match import SongMatch
+from song_match.sound_effects import get_sample_cache
+from song_match.tap_latency import SOUND_START
+
+
+class TestSequenceScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = VirtualClockEventLoop()
+        self.scheduler = SequenceScheduler(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        get_sample_cache().clear()
+
+    def play(self, notes, note_times, sound_delay=0.0):
+        note_times = iter(note_times)
+
+        async def play_note(note, trace):
+            await sleep(sound_delay)
+            trace.mark(SOUND_START)
+            await sleep(next(note_times))
+
+        return self.loop.run_until_complete(self.scheduler.play(notes, play_note, sound_delay=sound_delay))
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_time_spent_playing_notes_is_absorbed(self, sound):
+        notes = [Note('C4', EIGHTH_NOTE), Note('D4', QUARTER_NOTE), Note('E4', EIGHTH_NOTE)]
+        started_at = self.loop.time()
+
+        timing = self.play(notes, note_times=[0.1, 0.1, 0.1], sound_delay=0.05)
+
+        for error in timing.onset_errors + timing.inter_onset_errors:
+            self.assertAlmostEqual(error, 0)
+        self.assertAlmostEqual(timing.onsets[0] - started_at, 0.05)
+        self.assertAlmostEqual(self.loop.time() - started_at, 0.05 + 2 * EIGHTH_NOTE + QUARTER_NOTE)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_late_note_does_not_delay_the_rest(self, sound):
+        notes = [Note('C4', EIGHTH_NOTE)] * 4
+
+        timing = self.play(notes, note_times=[0.3, 0.1, 0.1, 0.1])
+
+        self.assertAlmostEqual(timing.onset_errors[1], 0.3 - EIGHTH_NOTE)
+        self.assertAlmostEqual(timing.onset_errors[2], 0)
+        self.assertAlmostEqual(timing.max_inter_onset_error, 0.3 - EIGHTH_NOTE)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_failed_note_cancels_the_notes_still_playing(self, sound):
+        notes = [Note('C4', EIGHTH_NOTE)] * 3
+        started = []
+        finished = []
+
+        async def play_note(note, trace):
+            started.append(note)
+            if len(started) == 2:
+                raise RuntimeError('Tap failed')
+            await sleep(1)
+            finished.append(note)
+
+        with self.assertRaises(RuntimeError):
+            self.loop.run_until_complete(self.scheduler.play(notes, play_note, pipelined=True))
+        self.loop.run_until_complete(sleep(2))
+
+        self.assertEqual(len(started), 3)
+        self.assertEqual(finished, [])
+
+
+class TestSequenceTimingInGame(unittest.TestCase):
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    @patch('song_match.song_match.init_mixer')
+    def test_game_plays_sequences_on_tempo(self, init_mixer, sound):
+        song = MaryHadALittleLamb()
+        song_match = SongMatch(song=song, num_players=1)
+        simulation = Simulation(SongPlayers(song, num_players=1, cube_mat=song_match.cube_mat), virtual_clock=True)
+
+        simulation.run(song_match.play)
+
+        self.assertGreater(len(song_match.sequence_timings), 1)
+        for timing in song_match.sequence_timings:
+            self.assertAlmostEqual(timing.max_inter_onset_error, 0)
+            self.assertEqual(len(timing.onsets), len(timing.notes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+
+from song_match.cube_mat import CubeMat
+from song_match.session_manager import SessionManager
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.song import HotCrossBuns
+from song_match.song import RainRainGoAway
+from song_match.song_match import SongMatch
+from song_match.sound_effects import get_sample_cache
+
+
+@patch('song_match.sound_effects.sample_cache.Sound')
+@patch('song_match.song_match.init_mixer')
+class TestSessionManager(unittest.TestCase):
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    def test_tables_with_different_layouts_play_at_once(self, init_mixer, sound):
+        songs = [HotCrossBuns(), RainRainGoAway()]
+        layouts = [(0, 80, -80), (-80, 0, 80)]
+        song_matches = [SongMatch(song=song, num_players=2) for song in songs]
+        players = [SongPlayers(song, num_players=2, cube_mat=song_match.cube_mat)
+                   for song, song_match in zip(songs, song_matches)]
+        simulation = Simulation(players[0], y_positions=layouts[0], virtual_clock=True)
+        robots = [simulation.robot, simulation.add_robot(players[1], y_positions=layouts[1])]
+        session_manager = SessionManager(simulation.loop)
+        sessions = [session_manager.add_session(song_match, robot)
+                    for song_match, robot in zip(song_matches, robots)]
+
+        simulation.run(lambda robot: session_manager.run())
+
+        self.assertEqual([session.name for session in sessions], ['table-1', 'table-2'])
+        for session, song in zip(sessions, songs):
+            self.assertTrue(session.is_finished)
+            self.assertIsNone(session.error)
+            self.assertEqual(len(session.result.winners), 2)
+            self.assertEqual(len(session.tap_latency), session.robot.world.num_taps)
+            self.assertIs(session.song_match.cube_mat, session.song_match._song_robot.cube_mat)
+        self.assertEqual(song_matches[0].cube_mat.get_positions(), (3, 1, 2))
+        self.assertEqual(song_matches[1].cube_mat.get_positions(), (1, 2, 3))
+        self.assertAlmostEqual(simulation.game_time, max(session.game_time for session in sessions))
+
+    def test_tables_share_one_song_with_different_layouts(self, init_mixer, sound):
+        song = HotCrossBuns()
+        layouts = [(0, 80, -80), (-80, 0, 80)]
+        song_matches = [SongMatch(song=song, num_players=2) for _ in layouts]
+        players = [SongPlayers(song, num_players=2, cube_mat=song_match.cube_mat) for song_match in song_matches]
+        simulation = Simulation(players[0], y_positions=layouts[0], virtual_clock=True)
+        robots = [simulation.robot, simulation.add_robot(players[1], y_positions=layouts[1])]
+        session_manager = SessionManager(simulation.loop)
+        sessions = [session_manager.add_session(song_match, robot)
+                    for song_match, robot in zip(song_matches, robots)]
+
+        simulation.run(lambda robot: session_manager.run())
+
+        self.assertEqual(song_matches[0].cube_mat.get_positions(), (3, 1, 2))
+        self.assertEqual(song_matches[1].cube_mat.get_positions(), (1, 2, 3))
+        for session in sessions:
+            self.assertIsNone(session.error)
+            self.assertEqual(len(session.result.winners), 2)
+            self.assertEqual(session.result.strikes, {1: 0, 2: 0})
+        self.assertIs(song.cube_mat, CubeMat.get_default())
+
+    def test_failed_game_does_not_stop_other_games(self, init_mixer, sound):
+        song = HotCrossBuns()
+        simulation = Simulation([], virtual_clock=True)  # Runs out of taps right away
+        other_song = HotCrossBuns()
+        other_song_match = SongMatch(song=other_song, num_players=1)
+        other_robot = simulation.add_robot(SongPlayers(other_song, num_players=1, cube_mat=other_song_match.cube_mat))
+        session_manager = SessionManager(simulation.loop)
+        failed = session_manager.add_session(SongMatch(song=song, num_players=1), simulation.robot)
+        finished = session_manager.add_session(other_song_match, other_robot, name='other')
+
+        simulation.run(lambda robot: session_manager.run())
+
+        self.assertIsInstance(failed.error, RuntimeError)
+        self.assertIsNone(failed.result)
+        self.assertIsNone(finished.error)
+        self.assertEqual(finished.name, 'other')
+        self.assertGreater(finished.game_time, failed.game_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from asyncio import new_event_loop
+from unittest.mock import patch
+
+from cozmo.objects import EvtObjectTapped
+
+from song_match.cube_mat import CubeMat
+from song_match.simulator import ActionLatencies
+from song_match.simulator import SimulatedRobot
+from song_match.simulator import SimulatedWorld
+from song_match.simulator import SongPlayers
+from song_match.simulator import get_round_positions
+from song_match.simulator import Simulation
+from song_match.song import HotCrossBuns
+from song_match.song import RainRainGoAway
+from song_match.song_match import SongMatch
+from song_match.song_robot import SongRobot
+from song_match.sound_effects import get_sample_cache
+
+
+class TestSimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        get_sample_cache().clear()
+
+    def test_actions_complete_after_latency(self):
+        world = SimulatedWorld([], self.loop)
+        robot = SimulatedRobot(world, self.loop, latencies=ActionLatencies(animation=0.01))
+
+        async def play():
+            action = robot.play_anim('anim_memorymatch_pointcenter_01')
+            self.assertFalse(action.is_completed)
+            await action.wait_for_completed()
+            self.assertTrue(action.is_completed)
+
+        self.loop.run_until_complete(play())
+        self.assertEqual(len(robot.actions), 1)
+
+    def test_taps_dispatch_to_handlers_and_waiters(self):
+        world = SimulatedWorld([3, 1], self.loop, latencies=ActionLatencies.instant())
+        handled = []
+        world.add_event_handler(EvtObjectTapped, lambda evt, obj=None, **kwargs: handled.append(obj.cube_id))
+
+        async def wait_for_taps():
+            first = await world.wait_for(EvtObjectTapped)
+            second = await world.wait_for(EvtObjectTapped)
+            return first.obj.cube_id, second.obj.cube_id
+
+        self.assertEqual(self.loop.run_until_complete(wait_for_taps()), (3, 1))
+        self.assertEqual(handled, [3, 1])
+        with self.assertRaises(RuntimeError):
+            self.loop.run_until_complete(world.wait_for(EvtObjectTapped))
+
+    def test_cube_lights(self):
+        world = SimulatedWorld([], self.loop)
+        cube = world.get_light_cube(1)
+        cube.set_lights_off()
+        self.assertEqual(cube.num_light_commands, 1)
+
+    def test_round_positions(self):
+        with patch('song_match.sound_effects.sample_cache.Sound'):
+            song = HotCrossBuns()
+            self.assertEqual(get_round_positions(song), [3, 4, 5, 7, 9, 11, 14, 17])
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_song_players_tap_the_song(self, sound):
+        world = SimulatedWorld([], self.loop)
+        CubeMat.order_cubes_by_position(SongRobot(SimulatedRobot(world, self.loop), None))
+        song = HotCrossBuns()
+
+        taps = list(SongPlayers(song, num_players=2))
+
+        positions = get_round_positions(song)
+        self.assertEqual(len(taps), 2 * sum(positions))
+        expected = [song.get_cube_id(note) for note in song.get_sequence_slice(positions[0])]
+        self.assertEqual(taps[:positions[0]], expected)
+        self.assertEqual(taps[positions[0]:2 * positions[0]], expected)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_song_players_strike_out(self, sound):
+        world = SimulatedWorld([], self.loop)
+        CubeMat.order_cubes_by_position(SongRobot(SimulatedRobot(world, self.loop), None))
+
+        taps = list(SongPlayers(HotCrossBuns(), num_players=1, accuracy=0))
+
+        self.assertEqual(len(taps), 3)
+
+
+class TestVirtualClock(unittest.TestCase):
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    @patch('song_match.song_match.init_mixer')
+    def test_full_game_runs_in_virtual_time(self, init_mixer, sound):
+        song = RainRainGoAway()
+        song_match = SongMatch(song=song, num_players=3)
+        simulation = Simulation(SongPlayers(song, num_players=3, cube_mat=song_match.cube_mat), virtual_clock=True)
+
+        result = simulation.run(song_match.play)
+
+        self.assertEqual(simulation.world.num_taps, 3 * sum(get_round_positions(song)))
+        self.assertGreater(simulation.game_time, 60)
+        self.assertLess(simulation.wall_time, 10)
+        self.assertEqual(result.num_rounds, len(get_round_positions(song)))
+        self.assertEqual(result.strikes, {1: 0, 2: 0, 3: 0})
+        self.assertEqual(len(result.winners), 3)
+        self.assertAlmostEqual(result.game_time, simulation.game_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
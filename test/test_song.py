@@ -0,0 +1,85 @@
+import unittest
+from itertools import permutations
+from unittest.mock import patch
+
+from cozmo.objects import LightCubeIDs
+
+from song_match.cube_mat import CubeMat
+from song_match.game_constants import STARTING_POSITION
+from song_match.song import HotCrossBuns
+from song_match.song import MaryHadALittleLamb
+from song_match.song import RainRainGoAway
+from song_match.sound_effects import get_sample_cache
+
+from test.util import get_song_robot
+
+# Each song is made up of 3 distinct notes
+MAX_SOUNDS_PER_GAME = 3
+
+
+def simulate_game(song) -> None:
+    """Exercise the song the way :class:`~song_match.song_match.SongMatch` does over a full game."""
+    current_position = STARTING_POSITION
+    while song.is_not_finished(current_position):
+        notes = song.get_sequence_slice(current_position)
+        for note in notes:
+            cube_id = song.get_cube_id(note)
+            song.get_cube_light(cube_id)
+            song.play_note(cube_id)
+        for cube_id in LightCubeIDs:
+            song.get_note(cube_id)
+        song.is_sequence_long(current_position)
+        medium, long = song.get_difficulty_markers()
+        if current_position < medium:
+            current_position += 1
+        elif current_position < long:
+            current_position += 2
+        else:
+            current_position += 3
+        current_position = min(current_position, song.length + 1)
+    song.get_sequence()
+
+
+class TestSong(unittest.TestCase):
+
+    def setUp(self):
+        self.cube_mat = CubeMat()
+        self.cube_mat.order_cubes_by_position(get_song_robot([20, 10, 30]))
+        get_sample_cache().clear()
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_sounds_are_decoded_once_per_song(self, sound):
+        for song_class in (HotCrossBuns, MaryHadALittleLamb, RainRainGoAway):
+            sound.reset_mock()
+            get_sample_cache().clear()
+            simulate_game(song_class(self.cube_mat))
+            self.assertLessEqual(sound.call_count, MAX_SOUNDS_PER_GAME, song_class.__name__)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_note_tables_are_reused(self, sound):
+        song = HotCrossBuns(self.cube_mat)
+        self.assertIs(song.get_sequence(), song.get_sequence())
+        self.assertIs(song.get_note(1), song.get_note(1))
+        self.assertIs(song.get_difficulty_markers(), song.get_difficulty_markers())
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_note_and_cube_id_agree_for_every_cube_order(self, sound):
+        song = MaryHadALittleLamb(self.cube_mat)
+        for y_positions in permutations([10, 20, 30]):
+            self.cube_mat.order_cubes_by_position(get_song_robot(y_positions))
+            for note in song.get_sequence():
+                self.assertEqual(song.get_note(song.get_cube_id(note)), note)
+            left_cube_id = self.cube_mat.position_to_cube_id(1)
+            self.assertEqual(song.get_note(left_cube_id).note, 'C4')  # Lowest note on the left
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_songs_are_built_lazily(self, sound):
+        HotCrossBuns()
+        sound.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
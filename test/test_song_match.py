@@ -0,0 +1,61 @@
+import unittest
+from itertools import chain
+from unittest.mock import patch
+
+from cozmo.objects import EvtObjectObserved
+from cozmo.objects import EvtObjectTapped
+
+from song_match.game_constants import MAX_STRIKES
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.simulator import get_round_positions
+from song_match.song import HotCrossBuns
+from song_match.song import MaryHadALittleLamb
+from song_match.song_match import SongMatch
+from song_match.sound_effects import get_sample_cache
+
+
+@patch('song_match.sound_effects.sample_cache.Sound')
+@patch('song_match.song_match.init_mixer')
+class TestGameResult(unittest.TestCase):
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    def test_game_ends_when_players_strike_out(self, init_mixer, sound):
+        song = MaryHadALittleLamb()
+        song_match = SongMatch(song=song, num_players=1)
+        players = SongPlayers(song, num_players=1, accuracy=0, cube_mat=song_match.cube_mat)
+        simulation = Simulation(players, virtual_clock=True)
+
+        result = simulation.run(song_match.play)
+
+        self.assertEqual(result.num_rounds, MAX_STRIKES)
+        self.assertEqual(result.strikes, {1: MAX_STRIKES})
+        self.assertEqual(result.winners, [])
+        self.assertLess(result.num_rounds, len(get_round_positions(song)))
+
+    def test_games_play_back_to_back_on_one_robot(self, init_mixer, sound):
+        songs = [HotCrossBuns(), MaryHadALittleLamb()]
+        song_matches = [SongMatch(song=song, num_players=2) for song in songs]
+        taps = chain(*[SongPlayers(song, num_players=2, cube_mat=song_match.cube_mat)
+                       for song, song_match in zip(songs, song_matches)])
+        simulation = Simulation(taps, virtual_clock=True)
+
+        async def play_games(robot):
+            return [await song_match.play(robot) for song_match in song_matches]
+
+        results = simulation.run(play_games)
+
+        for result, song in zip(results, songs):
+            self.assertEqual(result.num_rounds, len(get_round_positions(song)))
+            self.assertEqual(len(result.winners), 2)
+        self.assertAlmostEqual(sum(result.game_time for result in results), simulation.game_time)
+        self.assertEqual(simulation.world._handlers[EvtObjectTapped], [])
+        self.assertEqual(simulation.world._handlers[EvtObjectObserved], [])
+        for song_match in song_matches:
+            self.assertEqual(song_match.cube_mat._CubeMat__order_listeners, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from song_match import song_registry
+from song_match.exceptions import DuplicateSongKey
+from song_match.exceptions import InvalidSongKey
+from song_match.song import FileSong
+from song_match.song import HotCrossBuns
+from song_match.song.songs.hot_cross_buns import SONG_FILE
+from song_match.song_registry import create_song
+from song_match.song_registry import get_song_class
+from song_match.song_registry import get_song_keys
+from song_match.song_registry import get_song_title
+from song_match.song_registry import load_songbook
+from song_match.song_registry import register_song
+
+
+class TestSongRegistry(unittest.TestCase):
+
+    def setUp(self):
+        # Restore the registry after tests that register songs
+        patcher = patch.dict(getattr(song_registry, '__songs'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_songs_are_registered_by_key(self):
+        self.assertEqual(get_song_keys(), ['hcb', 'mhall', 'rrga'])
+        self.assertEqual(get_song_title('hcb'), 'Hot Cross Buns')
+        self.assertIs(get_song_class('hcb'), HotCrossBuns)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_create_song_returns_new_song(self, sound):
+        song = create_song('hcb')
+        self.assertIsInstance(song, HotCrossBuns)
+        self.assertIsNot(create_song('hcb'), song)
+
+    def test_invalid_song_key(self):
+        with self.assertRaises(InvalidSongKey):
+            get_song_title('twinkle')
+
+    def test_duplicate_song_key(self):
+        register_song('hcb', 'Hot Cross Buns', 'song_match.song.songs.hot_cross_buns', 'HotCrossBuns')
+        with self.assertRaises(DuplicateSongKey):
+            register_song('hcb', 'Twinkle Twinkle', 'song_match.song.songs.twinkle', 'Twinkle')
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_load_songbook(self, sound):
+        with TemporaryDirectory() as songbook_dir:
+            with open(SONG_FILE, 'rb') as song_file, open(os.path.join(songbook_dir, 'buns.json'), 'wb') as file:
+                file.write(song_file.read())
+            open(os.path.join(songbook_dir, 'README.txt'), 'w').close()
+            self.assertEqual(load_songbook(songbook_dir, os.path.join(songbook_dir, 'cache')), ['buns'])
+        self.assertEqual(get_song_keys(), ['hcb', 'mhall', 'rrga', 'buns'])
+        self.assertEqual(get_song_title('buns'), 'Hot Cross Buns')
+        song = create_song('buns')
+        self.assertIsInstance(song, FileSong)
+        self.assertEqual(song.get_sequence(), HotCrossBuns().get_sequence())
+
+
+if __name__ == '__main__':
+    unittest.main()
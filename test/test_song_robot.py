@@ -0,0 +1,286 @@
+import unittest
+from asyncio import sleep
+from itertools import permutations
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from cozmo.objects import LightCube1Id, LightCube2Id, LightCube3Id
+from cozmo.objects import LightCubeIDs
+from cozmo.util import Pose
+from cozmo.util import degrees
+
+from song_match.cube import NoteCube
+from song_match.cube import NoteCubes
+from song_match.cube_mat import CubeMat
+from song_match.effect import EffectFactory
+from song_match.simulator import ActionLatencies
+from song_match.simulator import SimulatedRobot
+from song_match.simulator import SimulatedWorld
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.simulator import VirtualClockEventLoop
+from song_match.song import HotCrossBuns
+from song_match.song_match import SongMatch
+from song_match.song_robot import SongRobot
+from song_match.sound_effects import get_sample_cache
+
+from test.util import get_song_robot
+
+
+def get_legacy_tap_animation_lookup(cube_mat: CubeMat) -> dict:
+    """The tap animation lookup as it was built on every tap before it was precomputed."""
+    mat_positions = cube_mat.get_positions()
+
+    keys = [(LightCube1Id, LightCube1Id),
+            (LightCube2Id, LightCube2Id),
+            (LightCube3Id, LightCube3Id)]
+    center = 'anim_memorymatch_pointcenter_01'
+    animations = [center, center, center]
+
+    keys.append(tuple(mat_positions[:-1]))
+    keys.append(tuple(mat_positions[-2:]))
+    small_right = 'anim_memorymatch_pointsmallright_fast_01'
+    animations.append(small_right)
+    animations.append(small_right)
+
+    keys.append(tuple([mat_positions[0], mat_positions[-1]]))
+    animations.append('anim_memorymatch_pointbigright_01')
+
+    keys.append(tuple(mat_positions[:-1][::-1]))
+    keys.append(tuple(mat_positions[-2:][::-1]))
+    small_left = 'anim_memorymatch_pointsmallleft_fast_01'
+    animations.append(small_left)
+    animations.append(small_left)
+
+    keys.append(tuple([mat_positions[0], mat_positions[-1]][::-1]))
+    animations.append('anim_memorymatch_pointbigleft_01')
+
+    return dict(zip(keys, animations))
+
+
+class TestSongRobot(unittest.TestCase):
+
+    def test_tap_animation_lookup_matches_legacy_lookup_for_every_cube_order(self):
+        cube_mat = CubeMat()
+        song_robot = SongRobot(MagicMock(), MagicMock(), cube_mat=cube_mat)
+        for y_positions in permutations([10, 20, 30]):
+            cube_mat.order_cubes_by_position(get_song_robot(y_positions))
+            self.assertEqual(song_robot._tap_animation_lookup, get_legacy_tap_animation_lookup(cube_mat))
+            self.assertEqual(len(song_robot._tap_animation_lookup), 9)
+
+    def test_tap_animation_lookup_is_built_once_per_cube_order(self):
+        cube_mat = CubeMat()
+        cube_mat.order_cubes_by_position(get_song_robot([10, 20, 30]))
+        song_robot = SongRobot(MagicMock(), MagicMock(), cube_mat=cube_mat)
+        lookup = song_robot._tap_animation_lookup
+
+        song_robot._prev_cube_id = LightCube1Id
+        self.assertEqual(song_robot._SongRobot__get_tap_animation(LightCube2Id),
+                         lookup[(LightCube2Id, LightCube1Id)])
+        self.assertIs(song_robot._tap_animation_lookup, lookup)
+
+    def test_close_stops_listening_to_the_cube_mat(self):
+        cube_mat = CubeMat()
+        song_robot = SongRobot(MagicMock(), MagicMock(), cube_mat=cube_mat)
+        other_song_robot = SongRobot(MagicMock(), MagicMock(), cube_mat=CubeMat())
+
+        song_robot.close()
+        cube_mat.order_cubes_by_position(get_song_robot([10, 20, 30]))
+
+        self.assertIsNone(song_robot._tap_animation_lookup)
+        self.assertIsNone(other_song_robot._tap_animation_lookup)
+        self.assertEqual(cube_mat._CubeMat__order_listeners, [])
+
+
+@patch('song_match.sound_effects.sample_cache.Sound')
+class TestPipelinedPlayback(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = VirtualClockEventLoop()
+        world = SimulatedWorld([], self.loop)
+        self.robot = SimulatedRobot(world, self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        get_sample_cache().clear()
+
+    def play_song(self, pipelined: bool):
+        song = HotCrossBuns()
+        song_robot = SongRobot(self.robot, song)
+        CubeMat.order_cubes_by_position(song_robot)
+        started_at = self.loop.time()
+        result = self.loop.run_until_complete(song_robot.play_notes(song.get_sequence(), pipelined=pipelined))
+        return song, song_robot, result, self.loop.time() - started_at
+
+    def test_pipelined_playback_keeps_to_the_song_tempo(self, sound):
+        song, song_robot, result, pipelined_time = self.play_song(pipelined=True)
+        _, _, _, sequential_time = self.play_song(pipelined=False)
+
+        self.assertEqual(result, (True, None))
+        song_time = sum(note.duration for note in song.get_sequence())
+        self.assertLess(pipelined_time, song_time + 2 * SongRobot._NOTE_DELAY + self.robot._latencies.animation)
+        self.assertLess(pipelined_time, sequential_time / 2)
+        timing, = song_robot.sequence_timings
+        self.assertEqual(len(timing.onsets), song.length)
+        for note, error in zip(song.get_sequence(), timing.inter_onset_errors):
+            # Cozmo can't tap faster than a tap takes to land
+            self.assertLessEqual(error, max(SongRobot._NOTE_DELAY - note.duration, 0) + 1e-9)
+
+    def test_pipelined_playback_aborts_each_tap_after_it_lands(self, sound):
+        song, song_robot, _, _ = self.play_song(pipelined=True)
+
+        self.assertEqual(len(self.robot.actions), song.length)
+        for action in self.robot.actions:
+            self.assertTrue(action.is_completed)
+
+    @patch('song_match.song_robot.random', return_value=0)
+    def test_pipelined_playback_stops_at_wrong_note(self, random, sound):
+        song = HotCrossBuns()
+        song_robot = SongRobot(self.robot, song)
+        CubeMat.order_cubes_by_position(song_robot)
+        notes = song.get_sequence_slice(5)
+
+        played_correct_sequence, note = self.loop.run_until_complete(
+            song_robot.play_notes(notes, with_error=True, pipelined=True))
+
+        self.assertFalse(played_correct_sequence)
+        self.assertNotEqual(note, notes[0])
+        self.assertEqual(len(self.robot.actions), 1)
+
+    def test_failed_tap_stops_the_rest_of_the_sequence(self, sound):
+        song = HotCrossBuns()
+        song_robot = SongRobot(self.robot, song)
+        CubeMat.order_cubes_by_position(song_robot)
+        tap_cube = song_robot.tap_cube
+        tapped_cube_ids = []
+
+        async def fail_second_tap(cube_id):
+            tapped_cube_ids.append(cube_id)
+            if len(tapped_cube_ids) == 2:
+                raise RuntimeError('Tap failed')
+            return await tap_cube(cube_id)
+
+        song_robot.tap_cube = fail_second_tap
+        with self.assertRaises(RuntimeError):
+            self.loop.run_until_complete(song_robot.play_notes(song.get_sequence(), pipelined=True))
+        self.loop.run_until_complete(sleep(10))
+
+        self.assertEqual(len(tapped_cube_ids), 2)
+        self.assertTrue(song_robot._prev_contact.done())  # No later note is left waiting for the failed tap
+
+
+@patch('song_match.sound_effects.sample_cache.Sound')
+class TestNoteCubeIdentityMap(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = VirtualClockEventLoop()
+        self.song_robot = SongRobot(SimulatedRobot(SimulatedWorld([], self.loop), self.loop), MagicMock())
+
+    def tearDown(self):
+        self.loop.close()
+        get_sample_cache().clear()
+
+    def test_one_note_cube_per_cube(self, sound):
+        for cube_id in LightCubeIDs:
+            note_cube = self.song_robot.get_note_cube(cube_id)
+            self.assertIs(NoteCube.of(self.song_robot, cube_id), note_cube)
+            self.assertEqual(note_cube.cube_id, cube_id)
+        note_cubes = NoteCubes.of(self.song_robot)
+        self.assertIs(self.song_robot.note_cubes, note_cubes)
+        self.assertIs(EffectFactory(self.song_robot).create('WrongNote')._note_cubes, note_cubes)
+
+    def test_note_cubes_run_on_the_robot_loop(self, sound):
+        note_cube = NoteCube.of(self.song_robot, LightCube1Id)
+        self.assertIs(self.song_robot.loop, self.loop)
+        self.assertIs(note_cube._loop, self.loop)
+
+    def test_note_cubes_have_no_instance_dict(self, sound):
+        self.assertFalse(hasattr(self.song_robot.get_note_cube(LightCube1Id), '__dict__'))
+        self.assertFalse(hasattr(self.song_robot.note_cubes, '__dict__'))
+
+    @patch('song_match.song_match.init_mixer')
+    def test_game_creates_three_note_cubes(self, init_mixer, sound):
+        song = HotCrossBuns()
+        song_match = SongMatch(song=song, num_players=1)
+        simulation = Simulation(SongPlayers(song, num_players=1, cube_mat=song_match.cube_mat), virtual_clock=True)
+        with patch('song_match.song_robot.NoteCube', side_effect=NoteCube) as note_cube:
+            simulation.run(song_match.play)
+        self.assertEqual(note_cube.call_count, len(LightCubeIDs))
+
+
+class TestTurnToCube(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = VirtualClockEventLoop()
+        self.world = SimulatedWorld([], self.loop, y_positions=(0, 80, -80))
+        self.robot = SimulatedRobot(self.world, self.loop)
+        self.song_robot = SongRobot(self.robot, MagicMock())
+        CubeMat.order_cubes_by_position(self.song_robot)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def turn_to_cube(self, cube_id: int):
+        self.loop.run_until_complete(self.song_robot.turn_to_cube(cube_id))
+        return self.song_robot.cube_search_metrics
+
+    def look_away(self):
+        self.loop.run_until_complete(self.robot.turn_in_place(degrees(180)).wait_for_completed())
+        self.assertFalse(any(cube.is_visible for cube in self.world.light_cubes.values()))
+
+    def test_no_turns_if_cube_is_visible(self):
+        metrics = self.turn_to_cube(LightCube2Id)
+        self.assertEqual(metrics.turn_counts, [0])
+        self.assertEqual(metrics.search_times, [0])
+        self.assertEqual(len(self.robot.actions), 0)
+
+    def test_turns_straight_to_the_cube(self):
+        self.look_away()
+        metrics = self.turn_to_cube(LightCube3Id)
+        self.assertTrue(self.world.light_cubes[LightCube3Id].is_visible)
+        self.assertEqual(metrics.turn_counts, [1])
+        self.assertAlmostEqual(metrics.search_times[0], ActionLatencies().turn)
+        self.assertAlmostEqual(self.robot.pose_angle.degrees % 360, 360 - 21.8, places=1)
+
+    def test_keeps_turning_the_same_way_if_the_cube_moved(self):
+        self.look_away()
+        moved_cube = self.world.light_cubes[LightCube2Id]
+        moved_cube.pose = Pose(-200, 100, 0, angle_z=degrees(0))  # Behind Cozmo to his left
+        metrics = self.turn_to_cube(LightCube2Id)
+        self.assertTrue(moved_cube.is_visible)
+        self.assertGreater(metrics.turn_counts[0], 1)
+        turn_angles = [float(action.name.split(': ')[1]) for action in self.robot.actions[1:]]
+        self.assertTrue(all(angle < 0 for angle in turn_angles))  # The shortest way from 180 degrees
+
+    def test_observations_refresh_the_pose_cache(self):
+        self.loop.run_until_complete(self.world.wait_until_num_objects_visible(3))
+        for cube_id, cube in self.world.light_cubes.items():
+            self.assertIs(self.song_robot.cube_poses.get_fresh_pose(cube_id), cube.pose)
+
+    def test_faces_cube_with_one_absolute_turn_if_pose_is_fresh(self):
+        self.loop.run_until_complete(self.world.wait_until_num_objects_visible(3))
+        self.look_away()
+        self.loop.run_until_complete(self.song_robot.face_cube(LightCube2Id))
+        self.assertEqual(len(self.robot.actions), 2)
+        self.assertAlmostEqual(self.robot.pose_angle.degrees, 21.8, places=1)
+        self.assertTrue(self.world.light_cubes[LightCube2Id].is_visible)
+        self.assertEqual(len(self.song_robot.cube_search_metrics), 0)
+
+    def test_stale_pose_searches_for_the_cube(self):
+        self.loop.run_until_complete(self.world.wait_until_num_objects_visible(3))
+        self.look_away()
+        self.loop.run_until_complete(sleep(self.song_robot.cube_poses.max_age))
+        self.loop.run_until_complete(self.song_robot.face_cube(LightCube2Id))
+        self.assertEqual(self.song_robot.cube_search_metrics.turn_counts, [1])
+        self.assertFalse(self.song_robot.cube_poses.is_stale(LightCube2Id))
+
+    def test_turns_back_to_face_the_middle_cube(self):
+        self.world.light_cubes[LightCube1Id].pose = Pose(200, 20, 0, angle_z=degrees(0))
+        self.loop.run_until_complete(self.world.wait_until_num_objects_visible(3))
+        self.look_away()
+        self.loop.run_until_complete(self.song_robot.turn_back_to_center())
+        self.assertAlmostEqual(self.robot.pose_angle.degrees, 5.7, places=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import json
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from song_match.exceptions import InvalidSongFile
+from song_match.song import HotCrossBuns
+from song_match.song.file_song import load_song
+from song_match.song.note import EIGHTH_NOTE
+from song_match.song.note import HALF_NOTE
+from song_match.song.note import QUARTER_NOTE
+from song_match.songbook import CompiledSong
+from song_match.songbook import compile_song_file
+from song_match.songbook import get_cache_path
+from song_match.songbook import load_compiled_song
+
+
+def get_song(**fields) -> dict:
+    song = {
+        'title': 'Hot Cross Buns',
+        'notes': ['G3', 'A3', 'B3'],
+        'lights': ['#ff00ff', '#0000ff', '#00ffbe'],
+        'difficulty_markers': [2, 4],
+        'sequence': 'B3 A3 G3/2 G3/8 A3/8'
+    }
+    song.update(fields)
+    return song
+
+
+class TestSongbook(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = os.path.join(temp_dir.name, 'cache')
+        self.path = os.path.join(temp_dir.name, 'hcb.json')
+
+    def write_song(self, song: dict) -> None:
+        with open(self.path, 'w') as file:
+            json.dump(song, file)
+
+    def test_compile_song_file(self):
+        self.write_song(get_song())
+        compiled_song = compile_song_file(self.path)
+        self.assertEqual(compiled_song.title, 'Hot Cross Buns')
+        self.assertEqual(compiled_song.notes, ('G3', 'A3', 'B3'))
+        self.assertEqual(compiled_song.lights, (0xff00ffff, 0x0000ffff, 0x00ffbeff))
+        self.assertEqual(compiled_song.difficulty_markers, (2, 4))
+        self.assertEqual(compiled_song.pitches, bytes([2, 1, 0, 0, 1]))
+        self.assertEqual(compiled_song.note_values, bytes([4, 4, 2, 8, 8]))
+        self.assertEqual(len(compiled_song), 5)
+
+    def test_compiled_song_round_trips_through_bytes(self):
+        self.write_song(get_song())
+        compiled_song = compile_song_file(self.path)
+        self.assertEqual(CompiledSong.from_bytes(compiled_song.to_bytes()), compiled_song)
+
+    def test_invalid_song_files(self):
+        invalid_songs = [
+            get_song(title=None),
+            get_song(notes=['G3', 'A3']),
+            get_song(notes=['G3', 'A3', 'A3']),
+            get_song(notes=['G3', 'A3', 'H3']),
+            get_song(lights=['#ff00ff', '#0000ff', 'cyan']),
+            get_song(sequence='B3 A3 C4'),
+            get_song(sequence='B3 A3 G3/3'),
+            get_song(sequence=''),
+            get_song(difficulty_markers=[4, 2]),
+            get_song(difficulty_markers=[2, 6]),
+            ['not', 'an', 'object'],
+        ]
+        for song in invalid_songs:
+            with self.subTest(song=song):
+                self.write_song(song)
+                with self.assertRaises(InvalidSongFile):
+                    compile_song_file(self.path)
+
+    def test_load_compiled_song_caches_by_file_hash(self):
+        self.write_song(get_song())
+        compiled_song = load_compiled_song(self.path, self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        with patch('song_match.songbook.compile_song') as compile_song:
+            self.assertEqual(load_compiled_song(self.path, self.cache_dir), compiled_song)
+        compile_song.assert_not_called()
+
+        self.write_song(get_song(title='Hot Cross Buns Remix'))
+        self.assertEqual(load_compiled_song(self.path, self.cache_dir).title, 'Hot Cross Buns Remix')
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_corrupt_cache_is_compiled_again(self):
+        self.write_song(get_song())
+        compiled_song = load_compiled_song(self.path, self.cache_dir)
+        with open(self.path, 'rb') as file:
+            cache_path = get_cache_path(file.read(), self.cache_dir)
+        with open(cache_path, 'wb') as file:
+            file.write(b'\x00corrupt')
+        self.assertEqual(load_compiled_song(self.path, self.cache_dir), compiled_song)
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    def test_load_song(self, sound):
+        self.write_song(get_song())
+        song = load_song(self.path, cache_dir=self.cache_dir)
+        sequence = song.get_sequence()
+        self.assertEqual([note.note for note in sequence], ['B3', 'A3', 'G3', 'G3', 'A3'])
+        self.assertEqual([note.duration for note in sequence],
+                         [QUARTER_NOTE, QUARTER_NOTE, HALF_NOTE, EIGHTH_NOTE, EIGHTH_NOTE])
+        self.assertEqual(song.get_difficulty_markers(), [2, 4])
+        self.assertEqual(song.title, 'Hot Cross Buns')
+
+    def test_bundled_songs_are_kept_in_memory(self):
+        with patch('song_match.songbook.__write_cache') as write_cache:
+            song = HotCrossBuns()
+            other_song = HotCrossBuns()
+        write_cache.assert_not_called()
+        self.assertIs(song.compiled_song, other_song.compiled_song)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from benchmarks.startup import get_heavy_packages
+from benchmarks.startup import get_loaded_modules
+from song_match import _LazyModule
+from song_match.game_result import GameResult
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_help_loads_no_heavy_packages(self):
+        modules = get_loaded_modules('--help')
+        self.assertIn('song_match.song_registry', modules)
+        self.assertEqual(get_heavy_packages(modules), [])
+
+    def test_invalid_arguments_load_no_heavy_packages(self):
+        modules = get_loaded_modules('-s', 'twinkle')
+        self.assertIn('song_match.song_registry', modules)
+        self.assertEqual(get_heavy_packages(modules), [])
+
+    def test_package_exports_on_python_3_6(self):
+        package = _LazyModule('song_match')  # The type of the package on Python 3.6
+        self.assertIs(package.GameResult, GameResult)
+        self.assertIn('SongMatch', dir(package))
+        with self.assertRaises(AttributeError):
+            package.Nope
+
+
+if __name__ == '__main__':
+    unittest.main()
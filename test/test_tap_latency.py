@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import patch
+
+from song_match.simulator import Simulation
+from song_match.simulator import SongPlayers
+from song_match.song import HotCrossBuns
+from song_match.song_match import SongMatch
+from song_match.sound_effects import get_sample_cache
+from song_match.tap_latency import LIGHT_OFF
+from song_match.tap_latency import LIGHT_ON
+from song_match.tap_latency import NOTE_LOOKUP
+from song_match.tap_latency import SOUND_START
+from song_match.tap_latency import TapLatencyMetrics
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTapLatencyMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.metrics = TapLatencyMetrics(clock=self.clock)
+
+    def record_tap(self, sound_start: float) -> None:
+        trace = self.metrics.start_trace()
+        self.clock.now += sound_start
+        trace.mark(SOUND_START)
+        self.metrics.record(trace)
+
+    def test_percentiles_use_nearest_rank(self):
+        for i in range(1, 101):
+            self.record_tap(i / 1000)
+        self.assertEqual(len(self.metrics), 100)
+        self.assertAlmostEqual(self.metrics.get_percentile(SOUND_START, 50), 0.050)
+        self.assertAlmostEqual(self.metrics.get_percentile(SOUND_START, 95), 0.095)
+        self.assertAlmostEqual(self.metrics.get_percentile(SOUND_START, 99), 0.099)
+        self.assertIsNone(self.metrics.get_percentile(LIGHT_ON, 50))
+
+    def test_histogram_counts_latencies_per_bin(self):
+        for sound_start in (0.001, 0.004, 0.012):
+            self.record_tap(sound_start)
+        histogram = self.metrics.get_histogram(SOUND_START, bin_width=0.005)
+        self.assertEqual(list(histogram.values()), [2, 1])
+        self.assertAlmostEqual(list(histogram.keys())[1], 0.010)
+
+    def test_summary_and_table(self):
+        self.record_tap(0.020)
+        summary = self.metrics.to_dict()
+        self.assertEqual(summary[SOUND_START]['count'], 1)
+        self.assertEqual(summary[NOTE_LOOKUP]['count'], 0)
+        self.assertAlmostEqual(summary[SOUND_START]['p99'], 0.020)
+        self.assertIn('20.0', self.metrics.format())
+
+    def test_clear(self):
+        self.record_tap(0.020)
+        self.metrics.clear()
+        self.assertEqual(len(self.metrics), 0)
+        self.assertEqual(self.metrics.get_latencies(SOUND_START), [])
+
+
+class TestTapLatencyInGame(unittest.TestCase):
+
+    def tearDown(self):
+        get_sample_cache().clear()
+
+    @patch('song_match.sound_effects.sample_cache.Sound')
+    @patch('song_match.song_match.init_mixer')
+    def test_every_player_tap_is_traced(self, init_mixer, sound):
+        song = HotCrossBuns()
+        song_match = SongMatch(song=song, num_players=1)
+        simulation = Simulation(SongPlayers(song, num_players=1, cube_mat=song_match.cube_mat), virtual_clock=True)
+
+        simulation.run(song_match.play)
+
+        tap_latency = song_match.tap_latency
+        self.assertEqual(len(tap_latency), simulation.world.num_taps)
+        self.assertEqual(tap_latency.get_percentile(LIGHT_OFF, 99), 0)
+        self.assertAlmostEqual(tap_latency.get_percentile(SOUND_START, 50), 0.0625)
+        self.assertAlmostEqual(tap_latency.get_percentile(LIGHT_ON, 50), 0.125)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+"""Helpers shared by the tests and benchmarks."""
+
+from typing import Sequence
+from unittest.mock import MagicMock
+
+from cozmo.objects import LightCubeIDs
+
+
+def get_song_robot(y_positions: Sequence[float]) -> MagicMock:
+    """Get a mock :class:`~song_match.song_robot.SongRobot` that sees each cube at a y position.
+
+    :param y_positions: The y position of each cube, ordered by :attr:`~cozmo.objects.LightCube.cube_id`.
+    :return: A mock song robot to order a :class:`~song_match.cube_mat.CubeMat` with.
+    """
+    cubes = {}
+    for cube_id, y in zip(LightCubeIDs, y_positions):
+        cube = MagicMock()
+        cube.cube_id = cube_id
+        cube.pose.position.y = y
+        cubes[cube_id] = cube
+    song_robot = MagicMock()
+    song_robot.robot.world.light_cubes = cubes
+    return song_robot